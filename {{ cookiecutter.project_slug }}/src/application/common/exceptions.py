@@ -0,0 +1,12 @@
+import dataclasses
+
+from domain.common import AppError
+
+
+@dataclasses.dataclass(eq=False)
+class InvalidCursorError(AppError):
+    cursor: str
+
+    @property
+    def title(self) -> str:
+        return "The page cursor is invalid or expired"
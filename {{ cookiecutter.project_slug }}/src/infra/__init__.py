@@ -1,5 +1,7 @@
 from .ioc import (
+    AsyncpgProvider,
     ConfigProvider,
+    HttpClientProvider,
     InteractorProvider,
     RepositoriesProvider,
     SqlalchemyProvider,
@@ -7,7 +9,9 @@ from .ioc import (
 from .log import configure_logging, custom_logger
 
 __all__ = (
+    "AsyncpgProvider",
     "ConfigProvider",
+    "HttpClientProvider",
     "SqlalchemyProvider",
     "RepositoriesProvider",
     "InteractorProvider",
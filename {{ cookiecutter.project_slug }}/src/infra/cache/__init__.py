@@ -0,0 +1,4 @@
+from .interactor import CachedInteractor, InteractorCache
+from .lru import LRUCache
+
+__all__ = ("CachedInteractor", "InteractorCache", "LRUCache")
@@ -0,0 +1,334 @@
+import asyncio
+import hashlib
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+import orjson
+from domain.common import Interactor
+from prometheus_client import Counter, Gauge
+from redis.asyncio import Redis
+from redis.exceptions import LockError, RedisError
+
+from .lru import LRUCache
+
+CACHE_REQUESTS = Counter(
+    "interactor_cache_requests_total",
+    "Total count of cached interactor calls by interactor and result "
+    "(l1_hit, l2_hit, miss, collapsed, early_refresh).",
+    ["interactor", "result"],
+)
+CACHE_HIT_RATIO = Gauge(
+    "interactor_cache_hit_ratio",
+    "Share of cached interactor calls answered from L1 or Redis since start.",
+    ["interactor"],
+)
+CACHE_INVALIDATIONS = Counter(
+    "interactor_cache_invalidations_total",
+    "Total count of interactor cache keys invalidated by origin (local, remote).",
+    ["origin"],
+)
+
+_HITS = ("l1_hit", "l2_hit", "collapsed")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    value: Any
+    delta: float
+    expires_at: float
+
+    @property
+    def ttl(self) -> float:
+        return self.expires_at - time.time()
+
+    def should_refresh(self, beta: float) -> bool:
+        # XFetch: recompute early with a probability growing as expiry nears,
+        # faster for values slow to compute.
+        gap = -self.delta * beta * math.log(1.0 - random.random())
+        return time.time() + gap >= self.expires_at
+
+
+class InteractorCache:
+    """
+    Two-tier cache-aside store for interactor results.
+
+    Entries live in a short-lived in-process LRU (L1) and, if a Redis client
+    is given, in Redis (L2) as orjson bytes shared by all workers. Stampedes
+    are avoided three ways:
+    - concurrent misses of a key in a worker share one computation;
+    - across workers, the holder of a Redis lock computes and the others
+      wait for its value;
+    - before expiry, single callers recompute early at random (XFetch), so
+      a popular key is refreshed before it is missed.
+
+    ``invalidate`` drops tagged entries from Redis and, through pub/sub, from
+    the L1 of every worker running ``listen``.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        prefix: str = "interactor-cache:",
+        max_entries: int = 4096,
+        local_ttl: float = 5.0,
+        beta: float = 1.0,
+        lock_timeout: float = 5.0,
+    ) -> None:
+        self._local: LRUCache[str, _Entry] = LRUCache(max_entries=max_entries)
+        self._redis = redis
+        self._prefix = prefix
+        self._channel = f"{prefix}invalidate"
+        self.local_ttl = local_ttl
+        self.beta = beta
+        self.lock_timeout = lock_timeout
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._calls: dict[str, list[int]] = {}
+
+    def wrap[Request, Response](
+        self,
+        interactor: Interactor[Request, Response],
+        name: str,
+        ttl: float,
+        tags: Callable[[Request], Iterable[str]] | None = None,
+        decode: Callable[[Any], Response] | None = None,
+    ) -> "CachedInteractor[Request, Response]":
+        return CachedInteractor(interactor, self, name, ttl, tags, decode)
+
+    async def get_or_compute(
+        self,
+        name: str,
+        key: str,
+        ttl: float,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+        decode: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        result = "l1_hit"
+        entry = self._local.get(key)
+        if entry is None and self._redis is not None:
+            result = "l2_hit"
+            entry = await self._load(key, decode)
+            if entry is not None:
+                self._local.set(key, entry, ttl=min(self.local_ttl, entry.ttl))
+        if entry is not None and not entry.should_refresh(self.beta):
+            self._count(name, result)
+            return entry.value
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            if entry is not None:
+                # Being refreshed already, the current value is good enough.
+                self._count(name, result)
+                return entry.value
+            self._count(name, "collapsed")
+            return await asyncio.shield(in_flight)
+
+        self._count(name, "miss" if entry is None else "early_refresh")
+        task = asyncio.ensure_future(
+            self._fill(key, ttl, compute, tuple(tags), decode, entry)
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Drop the entries tagged with any of ``tags`` in every worker.
+
+        Call it once the change is committed, or a concurrent miss may cache
+        the old state again.
+        """
+        if self._redis is None:
+            return
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                pipe.delete(*tag_keys)
+                *members, _ = await pipe.execute()
+            keys = sorted({key.decode() for keys in members for key in keys})
+            if keys:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(*(self._prefix + key for key in keys))
+                    pipe.publish(self._channel, orjson.dumps(keys))
+                    await pipe.execute()
+        except RedisError:
+            logger.warning("Interactor cache invalidation failed", exc_info=True)
+            raise
+        for key in keys:
+            self._local.delete(key)
+        CACHE_INVALIDATIONS.labels(origin="local").inc(len(keys))
+
+    async def listen(self) -> None:
+        """Drop the L1 entries invalidated by other workers, until cancelled."""
+        if self._redis is None:
+            return
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as ps:
+                    await ps.subscribe(self._channel)
+                    async for message in ps.listen():
+                        keys = orjson.loads(message["data"])
+                        for key in keys:
+                            self._local.delete(key)
+                        CACHE_INVALIDATIONS.labels(origin="remote").inc(len(keys))
+            except RedisError:
+                logger.warning("Interactor cache listener lost", exc_info=True)
+                # Invalidations may have been missed while disconnected.
+                self._local.clear()
+                await asyncio.sleep(1.0)
+
+    async def _fill(
+        self,
+        key: str,
+        ttl: float,
+        compute: Callable[[], Awaitable[Any]],
+        tags: tuple[str, ...],
+        decode: Callable[[Any], Any] | None,
+        stale: _Entry | None,
+    ) -> Any:
+        lock = None
+        if self._redis is not None:
+            lock = self._redis.lock(
+                f"{self._prefix}lock:{key}", timeout=self.lock_timeout
+            )
+            if not await self._acquire(lock):
+                if stale is not None:
+                    return stale.value
+                if (entry := await self._wait(key, decode)) is not None:
+                    return entry.value
+                lock = None
+        try:
+            started = time.perf_counter()
+            value = await compute()
+            entry = _Entry(value, time.perf_counter() - started, time.time() + ttl)
+            self._local.set(key, entry, ttl=min(self.local_ttl, ttl))
+            await self._store(key, entry, ttl, tags)
+            return value
+        finally:
+            if lock is not None:
+                try:
+                    await lock.release()
+                except (LockError, RedisError):
+                    pass
+
+    async def _acquire(self, lock: Any) -> bool:
+        try:
+            return bool(await lock.acquire(blocking=False))
+        except RedisError:
+            return True  # Redis is down: compute without the lock.
+
+    async def _wait(
+        self, key: str, decode: Callable[[Any], Any] | None
+    ) -> _Entry | None:
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            if (entry := await self._load(key, decode)) is not None:
+                return entry
+        return None
+
+    async def _load(
+        self, key: str, decode: Callable[[Any], Any] | None
+    ) -> _Entry | None:
+        assert self._redis is not None
+        try:
+            raw = await self._redis.get(self._prefix + key)
+        except RedisError:
+            logger.warning("Interactor cache read failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        value, delta, expires_at = orjson.loads(raw)
+        return _Entry(decode(value) if decode else value, delta, expires_at)
+
+    async def _store(
+        self, key: str, entry: _Entry, ttl: float, tags: tuple[str, ...]
+    ) -> None:
+        if self._redis is None:
+            return
+        raw = orjson.dumps([entry.value, entry.delta, entry.expires_at])
+        seconds = max(math.ceil(ttl), 1)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._prefix + key, raw, ex=seconds)
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), key)
+                    # A tag lives as long as its longest-lived entry.
+                    pipe.expire(self._tag_key(tag), seconds, nx=True)
+                    pipe.expire(self._tag_key(tag), seconds, gt=True)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Interactor cache write failed", exc_info=True)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    def _count(self, name: str, result: str) -> None:
+        CACHE_REQUESTS.labels(interactor=name, result=result).inc()
+        calls = self._calls.get(name)
+        if calls is None:
+            calls = self._calls[name] = [0, 0]
+            CACHE_HIT_RATIO.labels(interactor=name).set_function(
+                lambda: calls[0] / calls[1] if calls[1] else 0.0
+            )
+        calls[0] += result in _HITS
+        calls[1] += 1
+
+
+class CachedInteractor[Request, Response]:
+    """
+    Interactor answering from an ``InteractorCache`` before running ``interactor``.
+
+    The cache key is ``name`` plus a digest of the orjson-serialized request.
+    Results must be serializable by orjson; ``decode`` rebuilds them from
+    their JSON form when read from Redis, e.g. ``lambda data: UserDto(**data)``.
+    ``tags`` names the aggregates a result depends on, for ``invalidate``::
+
+        get_user = cache.wrap(
+            GetUser(repository), "get_user", ttl=60,
+            tags=lambda request: [f"user:{request.user_id}"],
+            decode=lambda data: UserDto(**data),
+        )
+    """
+
+    def __init__(
+        self,
+        interactor: Interactor[Request, Response],
+        cache: InteractorCache,
+        name: str,
+        ttl: float,
+        tags: Callable[[Request], Iterable[str]] | None = None,
+        decode: Callable[[Any], Response] | None = None,
+    ) -> None:
+        self.interactor = interactor
+        self.cache = cache
+        self.name = name
+        self.ttl = ttl
+        self.tags = tags
+        self.decode = decode
+
+    def key(self, request: Request) -> str:
+        digest = hashlib.blake2b(
+            orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16,
+        )
+        return f"{self.name}:{digest.hexdigest()}"
+
+    async def execute(self, request: Request) -> Response:
+        result: Response = await self.cache.get_or_compute(
+            self.name,
+            self.key(request),
+            self.ttl,
+            lambda: self.interactor.execute(request),
+            self.tags(request) if self.tags else (),
+            self.decode,
+        )
+        return result
@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class LRUCache[K, V]:
+    """
+    In-process LRU bounded by entry count and, optionally, total size.
+
+    Entries may carry a TTL; expired ones are dropped lazily on access.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] = lambda _: 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float | None, int, V]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def size(self) -> int:
+        return self._bytes
+
+    def get(self, key: K) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, _, value = item
+        if expires_at is not None and expires_at <= self._clock():
+            self.delete(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+        self.delete(key)
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._data[key] = (expires_at, size, value)
+        self._bytes += size
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, evicted_size, _) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def delete(self, key: K) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
@@ -18,11 +18,33 @@ class RedisConfig:
         The port where Redis server is listening.
     host : str
         The host where Redis server is located.
+    max_connections : int
+        The maximum number of connections kept in the pool.
+    pool_timeout : float
+        How long to wait for a free pool connection, in seconds.
+    health_check_interval : int
+        Idle seconds after which a connection is pinged before reuse.
+    socket_timeout : float
+        Read/write timeout of a connection, in seconds.
+    socket_connect_timeout : float
+        Timeout for establishing a connection, in seconds.
+    pipeline_max_batch : int
+        Commands after which an automatic pipeline is sent at once.
+    pipeline_max_delay : float
+        Seconds an automatic pipeline waits for more commands; 0 sends it
+        at the end of the current event-loop iteration.
     """
 
     host: str
     port: int
     password: str | None
+    max_connections: int = 50
+    pool_timeout: float = 5.0
+    health_check_interval: int = 30
+    socket_timeout: float = 5.0
+    socket_connect_timeout: float = 2.0
+    pipeline_max_batch: int = 100
+    pipeline_max_delay: float = 0.0
 
     @staticmethod
     def from_env(env: Env) -> "RedisConfig":
@@ -32,8 +54,26 @@ class RedisConfig:
         password = env.str("REDIS_PASSWORD", None)
         port = env.int("REDIS_PORT")
         host = env.str("REDIS_HOST")
+        max_connections = env.int("REDIS_MAX_CONNECTIONS", 50)
+        pool_timeout = env.float("REDIS_POOL_TIMEOUT", 5.0)
+        health_check_interval = env.int("REDIS_HEALTH_CHECK_INTERVAL", 30)
+        socket_timeout = env.float("REDIS_SOCKET_TIMEOUT", 5.0)
+        socket_connect_timeout = env.float("REDIS_SOCKET_CONNECT_TIMEOUT", 2.0)
+        pipeline_max_batch = env.int("REDIS_PIPELINE_MAX_BATCH", 100)
+        pipeline_max_delay = env.float("REDIS_PIPELINE_MAX_DELAY", 0.0)
 
-        return RedisConfig(password=password, port=port, host=host)
+        return RedisConfig(
+            password=password,
+            port=port,
+            host=host,
+            max_connections=max_connections,
+            pool_timeout=pool_timeout,
+            health_check_interval=health_check_interval,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            pipeline_max_batch=pipeline_max_batch,
+            pipeline_max_delay=pipeline_max_delay,
+        )
 
     @property
     def construct_redis_dsn(self) -> str:
@@ -64,6 +104,32 @@ class DbConfig:
         The name of the database.
     port : int
         The port where the database server is listening.
+    pool_size : int
+        The number of connections kept open in the pool.
+    max_overflow : int
+        The number of connections allowed above ``pool_size`` under load.
+    pool_timeout : float
+        How long to wait for a free pool connection, in seconds.
+    pool_recycle : int
+        Age in seconds after which a connection is replaced on checkout.
+    pool_pre_ping : bool
+        Whether to test connections for liveness on checkout.
+    statement_cache_size : int
+        Size of the asyncpg prepared statement caches, 0 disables them
+        (required behind PgBouncer in transaction mode).
+    pool_warmup : int
+        The number of connections opened at startup, capped at ``pool_size``.
+    replica_urls : tuple[str, ...]
+        SQLAlchemy URLs of read replicas, reads are routed to them if set.
+    replica_strategy : str
+        How a replica is picked: ``least_connections`` or ``round_robin``.
+    replica_check_interval : float
+        Seconds between health checks of the replicas.
+    repeated_query_threshold : int
+        How many times a request may run the same statement fingerprint before
+        it is reported as a likely N+1.
+    repeated_query_mode : str
+        What to do with such requests: ``off``, ``warn`` or ``raise``.
     """
 
     host: str
@@ -71,6 +137,18 @@ class DbConfig:
     user: str
     database: str
     port: int
+    pool_size: int = 10
+    max_overflow: int = 5
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    pool_warmup: int = 2
+    replica_urls: tuple[str, ...] = ()
+    replica_strategy: str = "least_connections"
+    replica_check_interval: float = 5.0
+    repeated_query_threshold: int = 10
+    repeated_query_mode: str = "warn"
     naming_convention = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_N_name)s",
@@ -89,6 +167,18 @@ class DbConfig:
         user = env.str("POSTGRES_USER")
         database = env.str("POSTGRES_DB")
         port = env.int("POSTGRES_PORT", 5432)
+        pool_size = env.int("POSTGRES_POOL_SIZE", 10)
+        max_overflow = env.int("POSTGRES_MAX_OVERFLOW", 5)
+        pool_timeout = env.float("POSTGRES_POOL_TIMEOUT", 30.0)
+        pool_recycle = env.int("POSTGRES_POOL_RECYCLE", 1800)
+        pool_pre_ping = env.bool("POSTGRES_POOL_PRE_PING", True)
+        statement_cache_size = env.int("POSTGRES_STATEMENT_CACHE", 100)
+        pool_warmup = env.int("POSTGRES_POOL_WARMUP", 2)
+        replica_urls: tuple[str, ...] = tuple(env.list("POSTGRES_REPLICA_URLS", []))
+        replica_strategy = env.str("POSTGRES_REPLICA_STRATEGY", "least_connections")
+        replica_check_interval = env.float("POSTGRES_REPLICA_INTERVAL", 5.0)
+        repeated_query_threshold = env.int("POSTGRES_REPEAT_THRESHOLD", 10)
+        repeated_query_mode = env.str("POSTGRES_REPEAT_MODE", "warn")
 
         return DbConfig(
             host=host,
@@ -96,6 +186,18 @@ class DbConfig:
             user=user,
             database=database,
             port=port,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            statement_cache_size=statement_cache_size,
+            pool_warmup=pool_warmup,
+            replica_urls=replica_urls,
+            replica_strategy=replica_strategy,
+            replica_check_interval=replica_check_interval,
+            repeated_query_threshold=repeated_query_threshold,
+            repeated_query_mode=repeated_query_mode,
         )
 
     @property
@@ -135,6 +237,51 @@ class DbConfig:
         return uri.render_as_string(hide_password=False)
 
 
+@dataclass(frozen=True, slots=True)
+class HttpClientConfig:
+    """
+    Outbound HTTP client configuration class.
+
+    Attributes
+    ----------
+    timeout : float
+        Default timeout of an outbound request, in seconds.
+    max_connections : int
+        The maximum number of concurrent connections across all hosts.
+    max_keepalive_connections : int
+        The maximum number of idle connections kept alive for reuse.
+    keepalive_expiry : float
+        Idle seconds after which a kept-alive connection is closed.
+    http2 : bool
+        Whether to negotiate HTTP/2 with hosts that support it.
+    """
+
+    timeout: float = 20.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+
+    @staticmethod
+    def from_env(env: Env) -> "HttpClientConfig":
+        """
+        Creates the HttpClientConfig object from environment variables.
+        """
+        timeout = env.float("HTTP_CLIENT_TIMEOUT", 20.0)
+        max_connections = env.int("HTTP_CLIENT_MAX_CONNECTIONS", 100)
+        max_keepalive_connections = env.int("HTTP_CLIENT_MAX_KEEPALIVE", 20)
+        keepalive_expiry = env.float("HTTP_CLIENT_KEEPALIVE_EXPIRY", 5.0)
+        http2 = env.bool("HTTP_CLIENT_HTTP2", False)
+
+        return HttpClientConfig(
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class AppConfig:
     title: str
@@ -183,7 +330,12 @@ class Config:
     ----------
     db: DbConfig
         Holds the settings specific to the database (default is None).
+    redis: RedisConfig
+        Holds the settings specific to Redis.
+    http: HttpClientConfig
+        Holds the settings of the outbound HTTP client.
     """
 
     db: DbConfig
     redis: RedisConfig
+    http: HttpClientConfig
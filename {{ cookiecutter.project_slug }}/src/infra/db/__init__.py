@@ -1,3 +1,28 @@
+from .export import copy_csv, ndjson
 from .models import Base
+from .pool import build_engine, warm_up
+from .raw import Query, QueryExecutor
+from .routing import EngineRouter, RoutingSession, use_primary
+from .session import (
+    autocommit,
+    clear_statement_timeout,
+    finish_session,
+    read_only,
+)
 
-__all__ = ("Base",)
+__all__ = (
+    "Base",
+    "EngineRouter",
+    "Query",
+    "QueryExecutor",
+    "RoutingSession",
+    "autocommit",
+    "build_engine",
+    "clear_statement_timeout",
+    "copy_csv",
+    "finish_session",
+    "ndjson",
+    "read_only",
+    "use_primary",
+    "warm_up",
+)
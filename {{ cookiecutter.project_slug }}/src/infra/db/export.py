@@ -0,0 +1,111 @@
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterator
+
+import orjson
+from prometheus_client import Counter
+from sqlalchemy import Dialect, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .session import clear_statement_timeout
+
+EXPORTED_ROWS = Counter(
+    "db_export_rows_total",
+    "Total count of rows streamed out by exports by format.",
+    ["format"],
+)
+
+
+def compile_query(statement: Select[Any], dialect: Dialect) -> tuple[str, list[Any]]:
+    """
+    Render ``statement`` as SQL with positional arguments for the driver.
+
+    Expanding parameters, e.g. of ``in_()``, are rendered in place, one
+    argument per value.
+    """
+    compiled = statement.compile(
+        dialect=dialect, compile_kwargs={"render_postcompile": True}
+    )
+    return str(compiled), [compiled.params[name] for name in compiled.positiontup or ()]
+
+
+async def copy_csv(
+    session: AsyncSession,
+    statement: Select[Any],
+    header: bool = True,
+    queue_size: int = 8,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of ``statement`` as CSV with ``COPY (...) TO STDOUT``.
+
+    Postgres renders the CSV and asyncpg hands over its chunks as they
+    arrive. At most ``queue_size`` chunks are buffered: while the consumer
+    is slower, the COPY is not read, so the backpressure reaches the server
+    through TCP. Closing the iterator early cancels the COPY and drops the
+    connection instead of returning it to the pool mid-COPY.
+
+    The export is not bound by the request deadline, it runs for as long as
+    the client keeps reading.
+    """
+    connection = await session.connection(bind_arguments={"clause": statement})
+    await clear_statement_timeout(connection)
+    query, args = compile_query(statement, connection.dialect)
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    assert driver is not None, "the connection was invalidated"
+
+    queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(queue_size)
+
+    async def produce() -> None:
+        try:
+            status = await driver.copy_from_query(
+                query, *args, output=queue.put, format="csv", header=header
+            )
+        except Exception as err:
+            await queue.put(err)
+        else:
+            EXPORTED_ROWS.labels(format="csv").inc(int(status.rsplit(" ", 1)[-1]))
+            await queue.put(None)
+
+    task = asyncio.create_task(produce())
+    try:
+        while (chunk := await queue.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            await connection.invalidate()
+
+
+async def ndjson(
+    session: AsyncSession, statement: Select[Any], fetch_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of ``statement`` as newline delimited JSON objects.
+
+    Rows come from a server-side cursor ``fetch_size`` at a time and each
+    batch is sent as one chunk. The next batch is only fetched once the
+    consumer asks for it. Select columns rather than ORM entities, rows are
+    dumped as ``{column: value}``. Like ``copy_csv``, it is not bound by
+    the request deadline.
+    """
+    connection = await session.connection(bind_arguments={"clause": statement})
+    await clear_statement_timeout(connection)
+    result = await session.stream(statement.execution_options(yield_per=fetch_size))
+    try:
+        async for rows in result.mappings().partitions():
+            EXPORTED_ROWS.labels(format="ndjson").inc(len(rows))
+            yield b"".join(
+                [
+                    orjson.dumps(
+                        dict(row), default=str, option=orjson.OPT_APPEND_NEWLINE
+                    )
+                    for row in rows
+                ]
+            )
+    finally:
+        await result.close()
@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter as Tally
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterator
+
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+QUERY_INFO = Gauge(
+    "db_query_fingerprint_info",
+    "Normalized statement of each query fingerprint.",
+    ["fingerprint", "statement"],
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Histogram of statement execution time by fingerprint (in seconds)",
+    ["fingerprint", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Histogram of rows returned or affected by statement fingerprint.",
+    ["fingerprint", "operation"],
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 10000),
+)
+REQUEST_QUERIES = Histogram(
+    "db_request_queries",
+    "Histogram of statements executed per request by route template.",
+    ["path"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+REPEATED_QUERIES = Counter(
+    "db_repeated_queries_total",
+    "Total count of requests running one fingerprint over the threshold (N+1).",
+    ["path", "fingerprint"],
+)
+
+_QUERY = "db_query"
+_LITERALS = re.compile(
+    r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|(?<![\w:]):\w+|\?|\b\d+(?:\.\d+)?\b"
+)
+_PARAM = r"\?(?:::[\w ]+?)?\s*"
+_LISTS = re.compile(rf"\(\s*(?:{_PARAM},\s*)*{_PARAM}\)")
+_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_SPACES = re.compile(r"\s+")
+# Sent by the session itself, not by the code whose statements are counted.
+_SESSION_STATEMENTS = ("SET LOCAL statement_timeout",)
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+class RepeatedQueryError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    digest: str
+    operation: str
+    statement: str
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> Fingerprint:
+    """
+    Identify ``statement`` regardless of its literals and parameter values.
+
+    Literals and placeholders become ``?``, ``IN`` lists and multi-row
+    ``VALUES`` collapse, so ``id IN ($1, $2)`` and ``id IN ($1)`` match.
+    """
+    normalized = _LITERALS.sub("?", statement)
+    normalized = _ROWS.sub("(...)", _LISTS.sub("(...)", normalized))
+    normalized = _SPACES.sub(" ", normalized).strip()
+    digest = hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
+    operation = normalized.split(" ", 1)[0].upper()
+    QUERY_INFO.labels(fingerprint=digest, statement=normalized[:200]).set(1)
+    return Fingerprint(digest=digest, operation=operation, statement=normalized)
+
+
+@dataclass(slots=True)
+class QueryCounter:
+    """Statements run within a ``track_queries`` block, by fingerprint."""
+
+    path: str | None
+    parent: "QueryCounter | None" = None
+    total: int = 0
+    fingerprints: Tally[Fingerprint] = field(default_factory=Tally)
+
+    def record(self, query: Fingerprint) -> int:
+        counter: QueryCounter | None = self
+        while counter is not None:
+            counter.total += 1
+            counter.fingerprints[query] += 1
+            counter = counter.parent
+        return self.fingerprints[query]
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{count:>4} x {query.statement}"
+            for query, count in self.fingerprints.most_common()
+        )
+
+
+_current: ContextVar[QueryCounter | None] = ContextVar("db_queries", default=None)
+
+
+@contextmanager
+def track_queries(path: str | None = None) -> Iterator[QueryCounter]:
+    """
+    Count the statements run by the current context, e.g. a request.
+
+    With ``path`` set, the total is recorded under that route template.
+    Blocks nest: statements are counted by every enclosing block. The
+    deadline's ``SET LOCAL statement_timeout`` is left out.
+    """
+    counter = QueryCounter(path=path, parent=_current.get())
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+        if path is not None:
+            REQUEST_QUERIES.labels(path=path).observe(counter.total)
+
+
+def instrument_engine(
+    engine: AsyncEngine, threshold: int = 10, mode: str = "warn"
+) -> AsyncEngine:
+    """
+    Trace and measure every statement of ``engine`` by fingerprint.
+
+    Each statement gets a child span of the current one, and its duration
+    and row count are recorded per fingerprint. A request running one
+    fingerprint more than ``threshold`` times is reported as a likely N+1
+    once, by a warning or, with ``mode="raise"``, a ``RepeatedQueryError``.
+    """
+    if mode not in ("off", "warn", "raise"):
+        raise ValueError(f"Unknown repeated query mode {mode!r}")
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def on_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        query = fingerprint(statement)
+        counter = None if statement.startswith(_SESSION_STATEMENTS) else _current.get()
+        if (
+            counter is not None
+            and counter.record(query) == threshold + 1
+            and mode != "off"
+        ):
+            repeated(counter, query)
+        span = tracer.start_span(
+            query.operation,
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.statement": query.statement,
+                "db.query.fingerprint": query.digest,
+            },
+        )
+        conn.info[_QUERY] = (query, span, time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def on_executed(conn: Any, cursor: Any, *_: Any) -> None:
+        entry = conn.info.pop(_QUERY, None)
+        if entry is None:
+            return
+        query, span, started = entry
+        labels = {"fingerprint": query.digest, "operation": query.operation}
+        QUERY_DURATION.labels(**labels).observe(time.perf_counter() - started)
+        if (rows := cursor.rowcount) >= 0:
+            QUERY_ROWS.labels(**labels).observe(rows)
+            span.set_attribute("db.response.rows", rows)
+        span.end()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def on_error(context: ExceptionContext) -> None:
+        if context.connection is None:
+            return
+        entry = context.connection.info.pop(_QUERY, None)
+        if entry is not None:
+            _, span, _ = entry
+            span.record_exception(context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+    def repeated(counter: QueryCounter, query: Fingerprint) -> None:
+        path = counter.path or "-"
+        REPEATED_QUERIES.labels(path=path, fingerprint=query.digest).inc()
+        message = (
+            f"{path} ran {query.operation} {query.digest} over {threshold} "
+            f"times, likely an N+1: {query.statement}"
+        )
+        if mode == "raise":
+            raise RepeatedQueryError(message)
+        logger.warning(message)
+
+    return engine
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from typing import Any
+
+from infra.config import DbConfig
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Gauge of database pool connections by state (in_use, idle, overflow).",
+    ["pool", "state"],
+)
+POOL_MAX_CONNECTIONS = Gauge(
+    "db_pool_max_connections",
+    "Configured maximum number of database pool connections.",
+    ["pool"],
+)
+POOL_WAIT_TIME = Histogram(
+    "db_pool_checkout_duration_seconds",
+    "Histogram of time spent checking out a database connection (in seconds)",
+    ["pool"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+POOL_INVALIDATIONS = Counter(
+    "db_pool_invalidations_total",
+    "Total count of database connections invalidated by the pool.",
+    ["pool"],
+)
+ENGINE_QUERIES = Counter(
+    "db_engine_queries_total",
+    "Total count of statements executed by engine.",
+    ["engine"],
+)
+ENGINE_QUERY_DURATION = Histogram(
+    "db_engine_query_duration_seconds",
+    "Histogram of statement execution time by engine (in seconds)",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits.
+
+    The time covers both waiting for a connection to be returned and opening
+    a new one, so a spike means the pool is exhausted or the server is slow
+    to accept connections.
+    """
+
+    name: str = "default"
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_WAIT_TIME.labels(pool=self.name).observe(time.perf_counter() - started)
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        pool.name = self.name
+        return pool
+
+
+def build_engine(
+    config: DbConfig, name: str = "primary", url: str | None = None
+) -> AsyncEngine:
+    """
+    Create an engine whose pool follows ``config`` and is exported as metrics.
+
+    ``url`` defaults to the one of ``config``. The caller owns the engine and
+    must ``dispose()`` it on shutdown.
+    """
+    engine = create_async_engine(
+        url or config.construct_sqlalchemy_url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args={
+            # SQLAlchemy's and asyncpg's own prepared statement caches.
+            "prepared_statement_cache_size": config.statement_cache_size,
+            "statement_cache_size": config.statement_cache_size,
+        },
+    )
+    sync_engine = engine.sync_engine
+    assert isinstance(sync_engine.pool, InstrumentedAsyncAdaptedQueuePool)
+    sync_engine.pool.name = name
+
+    # The pool is replaced on ``dispose()``, so always read the current one.
+    POOL_MAX_CONNECTIONS.labels(pool=name).set(config.pool_size + config.max_overflow)
+    POOL_CONNECTIONS.labels(pool=name, state="in_use").set_function(
+        lambda: sync_engine.pool.checkedout()  # type: ignore[attr-defined]
+    )
+    POOL_CONNECTIONS.labels(pool=name, state="idle").set_function(
+        lambda: sync_engine.pool.checkedin()  # type: ignore[attr-defined]
+    )
+    POOL_CONNECTIONS.labels(pool=name, state="overflow").set_function(
+        lambda: max(sync_engine.pool.overflow(), 0)  # type: ignore[attr-defined]
+    )
+    invalidations = POOL_INVALIDATIONS.labels(pool=name)
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(*_: Any) -> None:
+        invalidations.inc()
+
+    queries = ENGINE_QUERIES.labels(engine=name)
+    query_duration = ENGINE_QUERY_DURATION.labels(engine=name)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def on_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        conn.info["db_query_started_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def on_executed(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        queries.inc()
+        started_at = conn.info.pop("db_query_started_at", None)
+        if started_at is not None:
+            query_duration.observe(time.perf_counter() - started_at)
+
+    return engine
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pool connections at once and return them to the pool."""
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    await asyncio.gather(
+        *(result.close() for result in results if not isinstance(result, BaseException))
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
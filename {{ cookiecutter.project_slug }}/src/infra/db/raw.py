@@ -0,0 +1,100 @@
+import time
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable
+
+import asyncpg
+from domain.common.value_objects import ValueObject
+from infra import deadline
+from infra.config import DbConfig
+from prometheus_client import Histogram
+
+RAW_QUERY_DURATION = Histogram(
+    "db_raw_query_duration_seconds",
+    "Histogram of raw asyncpg query time by query name (in seconds)",
+    ["query"],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Query[T]:
+    """
+    Named SQL statement with its rows mapped into ``into``.
+
+    ``into`` is either a ``ValueObject`` subclass, built from the first
+    column, or any callable taking the columns as keyword arguments, such as
+    a DTO dataclass. Parameters are positional: ``$1``, ``$2``...
+
+    Declare queries once at module level::
+
+        USER_EMAIL = Query(
+            "user_email", "SELECT email FROM users WHERE id = $1", Email
+        )
+    """
+
+    name: str
+    sql: str
+    into: Callable[..., T]
+
+
+@cache
+def _row_mapper(into: Callable[..., Any]) -> Callable[[asyncpg.Record], Any]:
+    if isinstance(into, type) and issubclass(into, ValueObject):
+        return lambda record: into(record[0])
+    return lambda record: into(**record)
+
+
+async def _keep_session(connection: asyncpg.Connection) -> None:
+    # QueryExecutor only runs single autocommit statements, there is no
+    # session state to reset: skip the RESET ALL round-trip of every release.
+    pass
+
+
+async def create_pool(config: DbConfig) -> asyncpg.Pool:
+    """
+    Open an asyncpg pool sized and tuned like the SQLAlchemy engine.
+
+    Connections are not reset on release, so the pool must only be used
+    through ``QueryExecutor``: a ``SET``, ``LISTEN`` or advisory lock would
+    leak to the next user of the connection.
+    """
+    return await asyncpg.create_pool(
+        config.construct_psql_dns,
+        min_size=min(config.pool_warmup, config.pool_size),
+        max_size=config.pool_size,
+        max_inactive_connection_lifetime=config.pool_recycle,
+        statement_cache_size=config.statement_cache_size,
+        reset=_keep_session,
+    )
+
+
+class QueryExecutor:
+    """
+    Runs ``Query`` objects straight on an asyncpg pool.
+
+    A fast path for hot read lookups: no ORM hydration, identity map or
+    greenlet switch, and the statements are prepared once per connection by
+    asyncpg's statement cache. Queries run in autocommit outside the request
+    session, so they don't see its uncommitted writes. Each is cancelled once
+    the request deadline passes.
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self.pool = pool
+
+    async def fetch[T](self, query: Query[T], *args: Any) -> list[T]:
+        started = time.perf_counter()
+        records = await self.pool.fetch(query.sql, *args, timeout=deadline.clip(None))
+        RAW_QUERY_DURATION.labels(query=query.name).observe(
+            time.perf_counter() - started
+        )
+        row_mapper = _row_mapper(query.into)
+        return [row_mapper(record) for record in records]
+
+    async def fetch_one[T](self, query: Query[T], *args: Any) -> T | None:
+        started = time.perf_counter()
+        record = await self.pool.fetchrow(query.sql, *args, timeout=deadline.clip(None))
+        RAW_QUERY_DURATION.labels(query=query.name).observe(
+            time.perf_counter() - started
+        )
+        return None if record is None else _row_mapper(query.into)(record)
@@ -0,0 +1,10 @@
+from .base import SqlalchemyRepository
+from .loader import DataLoader, EntityLoaders
+from .pagination import Page
+
+__all__ = (
+    "DataLoader",
+    "EntityLoaders",
+    "Page",
+    "SqlalchemyRepository",
+)
@@ -0,0 +1,177 @@
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator, Mapping, Sequence
+
+from infra.db.models import Base
+from sqlalchemy import ColumnElement, Table, insert, inspect, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from .pagination import Page, paginate, stream
+
+
+def chunked[T](items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class SqlalchemyRepository[TModel: Base]:
+    """
+    Generic repository of ``model`` rows over the request ``AsyncSession``.
+
+    Bulk writes are sent ``chunk_size`` rows per statement, each executed with
+    SQLAlchemy's insertmanyvalues batching, and ``copy_records`` streams large
+    ingests through asyncpg's binary COPY. Lists are read page by page with
+    ``paginate`` or as a whole with ``stream``.
+
+    Subclass it per model::
+
+        class UserRepository(SqlalchemyRepository[User]):
+            model = User
+    """
+
+    model: type[TModel]
+    chunk_size: int = 1000
+
+    def __init__(self, session: AsyncSession, chunk_size: int | None = None) -> None:
+        self.session = session
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+    @property
+    def primary_key(self) -> tuple[ColumnElement[Any], ...]:
+        return tuple(inspect(self.model).primary_key)
+
+    @property
+    def keyset(self) -> tuple[InstrumentedAttribute[Any], ...]:
+        """Default pagination order: ``created_at``, then the primary key."""
+        mapper = inspect(self.model)
+        return (
+            self.model.created_at,
+            *(
+                getattr(self.model, mapper.get_property_by_column(column).key)
+                for column in mapper.primary_key
+            ),
+        )
+
+    async def get(self, ident: Any) -> TModel | None:
+        return await self.session.get(self.model, ident)
+
+    async def get_many(self, idents: Iterable[Any]) -> list[TModel]:
+        """
+        Load the rows with the given primary keys, unknown ones are skipped.
+
+        Composite keys are given as tuples in primary key column order.
+        """
+        pk = self.primary_key
+        key = pk[0] if len(pk) == 1 else tuple_(*pk)
+        rows: list[TModel] = []
+        for chunk in chunked(dict.fromkeys(idents), self.chunk_size):
+            result = await self.session.scalars(
+                select(self.model).where(key.in_(chunk))
+            )
+            rows.extend(result)
+        return rows
+
+    async def paginate(
+        self,
+        limit: int,
+        *where: ColumnElement[bool],
+        cursor: str | None = None,
+        order_by: Sequence[InstrumentedAttribute[Any]] | None = None,
+        descending: bool = False,
+    ) -> Page[TModel]:
+        """
+        Load a page of at most ``limit`` rows matching ``where`` by keyset.
+
+        Ordered on ``order_by``, ``keyset`` by default, which the table should
+        index, e.g. ``Index("ix_users_keyset", "created_at", "id")``.
+        """
+        return await paginate(
+            self.session,
+            select(self.model).where(*where),
+            order_by or self.keyset,
+            limit,
+            cursor,
+            descending,
+        )
+
+    def stream(
+        self, *where: ColumnElement[bool], fetch_size: int | None = None
+    ) -> AsyncIterator[TModel]:
+        """Iterate all rows matching ``where``, ``fetch_size`` rows per fetch."""
+        return stream(
+            self.session,
+            select(self.model).where(*where),
+            fetch_size or self.chunk_size,
+        )
+
+    async def add_many(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """INSERT ``rows`` given as column-value mappings, return their count."""
+        count = 0
+        for chunk in chunked(rows, self.chunk_size):
+            await self.session.execute(insert(self.model), chunk)
+            count += len(chunk)
+        return count
+
+    async def upsert_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        conflict_columns: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+    ) -> int:
+        """
+        INSERT ``rows`` and UPDATE the ones that already exist.
+
+        Conflicts are detected on ``conflict_columns``, the primary key by
+        default. ``update_columns`` defaults to every other column given in the
+        rows; with none left, existing rows are kept as they are.
+        """
+        conflict = list(conflict_columns or (c.name for c in self.primary_key))
+        count = 0
+        for chunk in chunked(rows, self.chunk_size):
+            statement = pg_insert(self.model)
+            columns = (
+                [name for name in chunk[0] if name not in conflict]
+                if update_columns is None
+                else update_columns
+            )
+            if columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=conflict,
+                    set_={name: statement.excluded[name] for name in columns},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=conflict)
+            await self.session.execute(statement, chunk)
+            count += len(chunk)
+        return count
+
+    async def copy_records(
+        self, records: Iterable[Sequence[Any]], columns: Sequence[str]
+    ) -> int:
+        """
+        Bulk-load ``records`` (tuples in ``columns`` order) with binary COPY.
+
+        The COPY joins the session transaction, so it is committed or rolled
+        back with the request. Omitted columns take their server defaults.
+        """
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        assert driver is not None, "the connection was invalidated"
+        if not driver.is_in_transaction():
+            # session.connection() began the session transaction, but the
+            # driver defers its BEGIN to the first statement sent through
+            # SQLAlchemy: send one so the COPY runs inside that transaction.
+            await connection.exec_driver_sql("SELECT 1")
+        table = self.model.__table__
+        assert isinstance(table, Table)
+        status = await driver.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=list(columns),
+            schema_name=table.schema,
+        )
+        return int(status.rsplit(" ", 1)[-1])
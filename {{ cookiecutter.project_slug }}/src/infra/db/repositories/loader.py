@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping
+
+from infra.db.models import Base
+from prometheus_client import Counter, Histogram
+from sqlalchemy import Select, any_, bindparam, inspect, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import chunked
+
+LOADER_BATCH_SIZE = Histogram(
+    "db_loader_batch_size",
+    "Histogram of keys fetched per DataLoader batch by loader.",
+    ["loader"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+LOADER_CACHE_HITS = Counter(
+    "db_loader_cache_hits_total",
+    "Total count of DataLoader loads served from the request cache by loader.",
+    ["loader"],
+)
+
+
+class DataLoader[TKey: Hashable, TValue]:
+    """
+    Batches the ``load(key)`` calls made in one event-loop iteration.
+
+    The first load of an iteration schedules a dispatch right after it, so
+    the loads of coroutines started together, e.g. with ``asyncio.gather``,
+    end up in a single ``batch_load(keys)`` call. Results, missing keys
+    included, are cached for the loader's lifetime: one request.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[TKey]], Awaitable[Mapping[TKey, TValue]]],
+        name: str,
+        max_batch_size: int = 1000,
+    ) -> None:
+        self.batch_load = batch_load
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self._cache: dict[TKey, asyncio.Future[TValue | None]] = {}
+        self._queue: list[TKey] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._batch_size = LOADER_BATCH_SIZE.labels(loader=name)
+        self._cache_hits = LOADER_CACHE_HITS.labels(loader=name)
+
+    async def load(self, key: TKey) -> TValue | None:
+        # Shielded: a cancelled caller must not cancel a future others share.
+        return await asyncio.shield(self._future(key))
+
+    async def load_many(self, keys: Iterable[TKey]) -> list[TValue | None]:
+        return list(await asyncio.shield(asyncio.gather(*map(self._future, keys))))
+
+    def prime(self, key: TKey, value: TValue) -> None:
+        """Cache ``value`` for ``key``, e.g. an entity loaded by another query."""
+        if key not in self._cache:
+            future = self._cache[key] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+
+    def _future(self, key: TKey) -> asyncio.Future[TValue | None]:
+        if (future := self._cache.get(key)) is not None:
+            self._cache_hits.inc()
+            return future
+        loop = asyncio.get_running_loop()
+        future = self._cache[key] = loop.create_future()
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append(key)
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        for keys in chunked(queue, self.max_batch_size):
+            task = asyncio.create_task(self._run(keys))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list[TKey]) -> None:
+        self._batch_size.observe(len(keys))
+        try:
+            values = await self.batch_load(keys)
+        except BaseException as err:
+            for key in keys:
+                # Dropped from the cache so that a later load retries.
+                future = self._cache.pop(key)
+                if isinstance(err, Exception):
+                    future.set_exception(err)
+                else:
+                    future.cancel()
+            if not isinstance(err, Exception):
+                raise
+            return
+        for key in keys:
+            self._cache[key].set_result(values.get(key))
+
+
+def select_by_ids[TModel: Base](model: type[TModel]) -> Select[tuple[TModel]]:
+    """Select the ``model`` rows whose primary key is in the ``ids`` array."""
+    (pk,) = inspect(model).primary_key
+    return select(model).where(pk == any_(bindparam("ids", type_=ARRAY(pk.type))))
+
+
+class EntityLoaders:
+    """
+    Request-scoped ``DataLoader`` per model, loading rows by primary key.
+
+    Each batch is one ``WHERE pk = ANY(:ids)`` query, a single prepared
+    statement whatever the batch size. Batches of different models share the
+    request session, so they run one after the other::
+
+        authors = await loaders.of(Author).load_many(
+            post.author_id for post in posts
+        )
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._loaders: dict[type[Base], DataLoader[Any, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    def of[TModel: Base](self, model: type[TModel]) -> DataLoader[Any, TModel]:
+        loader = self._loaders.get(model)
+        if loader is None:
+            loader = self._loaders[model] = DataLoader(
+                self._batch_load(model), name=model.__name__
+            )
+        return loader
+
+    def _batch_load[TModel: Base](
+        self, model: type[TModel]
+    ) -> Callable[[list[Any]], Awaitable[dict[Any, TModel]]]:
+        mapper = inspect(model)
+        key = mapper.get_property_by_column(mapper.primary_key[0]).key
+        statement = select_by_ids(model)
+
+        async def batch_load(ids: list[Any]) -> dict[Any, TModel]:
+            async with self._lock:
+                rows = await self.session.scalars(statement, {"ids": ids})
+                return {getattr(row, key): row for row in rows}
+
+        return batch_load
@@ -0,0 +1,126 @@
+import base64
+import binascii
+import datetime
+import decimal
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
+
+import orjson
+from application.common.exceptions import InvalidCursorError
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+_NEXT = "n"
+_PREV = "p"
+_ISO_TYPES = (datetime.datetime, datetime.date, datetime.time)
+_STR_TYPES = (uuid.UUID, decimal.Decimal)
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    items: list[T]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    payload = orjson.dumps([direction, list(values)], default=str)
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str, keys: Sequence[InstrumentedAttribute[Any]]
+) -> tuple[str, list[Any]]:
+    """Return the direction and the key values of ``cursor``, typed like ``keys``."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, values = orjson.loads(payload)
+        if direction not in (_NEXT, _PREV) or len(values) != len(keys):
+            raise ValueError(cursor)
+        return direction, [_load(key, value) for key, value in zip(keys, values)]
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as err:
+        raise InvalidCursorError(cursor=cursor) from err
+
+
+def _load(key: InstrumentedAttribute[Any], value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, _ISO_TYPES):
+        return python_type.fromisoformat(value)
+    if issubclass(python_type, _STR_TYPES):
+        return python_type(value)
+    return value
+
+
+async def paginate[T](
+    session: AsyncSession,
+    statement: Select[tuple[T]],
+    keys: Sequence[InstrumentedAttribute[Any]],
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> Page[T]:
+    """
+    Fetch a page of ``statement`` by keyset, ordered on ``keys``.
+
+    ``keys`` must be unique together, e.g. ``created_at`` plus the primary
+    key, and backed by an index in the same order, so each page is an index
+    range scan whatever its depth, unlike OFFSET. ``statement`` selects ORM
+    entities; the cursors are opaque tokens holding the key values of the
+    first and last row of the page.
+    """
+    direction, values = decode_cursor(cursor, keys) if cursor else (_NEXT, None)
+    backwards = direction == _PREV
+    reverse = backwards != descending
+
+    if values is not None:
+        row = tuple_(*keys)
+        bound = tuple_(*values)
+        statement = statement.where(row < bound if reverse else row > bound)
+    order = [key.desc() if reverse else key.asc() for key in keys]
+    result = await session.scalars(statement.order_by(*order).limit(limit + 1))
+    items = list(result)
+
+    has_more = len(items) > limit
+    del items[limit:]
+    if backwards:
+        items.reverse()
+    if not items:
+        return Page(items=items)
+
+    def key_of(item: T) -> list[Any]:
+        return [getattr(item, key.key) for key in keys]
+
+    more_before = has_more if backwards else values is not None
+    more_after = values is not None if backwards else has_more
+    return Page(
+        items=items,
+        next_cursor=encode_cursor(_NEXT, key_of(items[-1])) if more_after else None,
+        prev_cursor=encode_cursor(_PREV, key_of(items[0])) if more_before else None,
+    )
+
+
+async def stream[T](
+    session: AsyncSession, statement: Select[tuple[T]], fetch_size: int
+) -> AsyncIterator[T]:
+    """
+    Iterate every entity of ``statement`` through a server-side cursor.
+
+    Rows are fetched ``fetch_size`` at a time, so memory stays flat however
+    many rows there are. The session connection is busy until the iteration
+    ends.
+    """
+    result = await session.stream_scalars(
+        statement.execution_options(yield_per=fetch_size)
+    )
+    try:
+        async for item in result:
+            yield item
+    finally:
+        await result.close()
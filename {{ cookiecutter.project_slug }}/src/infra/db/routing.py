@@ -0,0 +1,166 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Sequence
+
+from prometheus_client import Gauge
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.interfaces import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import SessionTransactionOrigin
+from sqlalchemy.pool import QueuePool
+
+from .session import TrackedSession, is_read_only
+
+REPLICA_UP = Gauge(
+    "db_replica_up",
+    "Whether a read replica is in rotation (1) or taken out of it (0).",
+    ["engine"],
+)
+
+_STICKY = "db_sticky_primary"
+_REPLICA = "db_replica"
+
+logger = logging.getLogger(__name__)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        REPLICA_UP.labels(engine=name).set(1)
+
+        # Failed pre-pings and lost connections take the replica out at once.
+        @event.listens_for(engine.sync_engine, "handle_error")
+        def on_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or context.is_pre_ping:
+                self.mark(False)
+
+    @property
+    def connections(self) -> int:
+        pool = self.engine.sync_engine.pool
+        return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+    def mark(self, healthy: bool) -> None:
+        if healthy != self.healthy:
+            logger.warning(
+                "Replica %s is %s", self.name, "back" if healthy else "out of rotation"
+            )
+        self.healthy = healthy
+        REPLICA_UP.labels(engine=self.name).set(int(healthy))
+
+
+class EngineRouter:
+    """
+    Picks the engine a statement runs on: the primary or one of the replicas.
+
+    Replicas are picked by ``least_connections`` (fewest checked out
+    connections) or ``round_robin`` among the healthy ones. With no healthy
+    replica every statement goes to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[Replica] = (),
+        strategy: str = "least_connections",
+    ) -> None:
+        if strategy not in ("least_connections", "round_robin"):
+            raise ValueError(f"Unknown replica strategy {strategy!r}")
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.strategy = strategy
+        self._turn = itertools.count()
+
+    def pick(self) -> Replica | None:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == "round_robin":
+            return healthy[next(self._turn) % len(healthy)]
+        return min(healthy, key=lambda replica: replica.connections)
+
+    async def check(self, timeout: float) -> None:
+        """Ping every replica and put it in or out of rotation."""
+        await asyncio.gather(
+            *(self._ping(replica, timeout) for replica in self.replicas)
+        )
+
+    async def run_checks(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.check(timeout=interval)
+
+    async def dispose(self) -> None:
+        await asyncio.gather(*(replica.engine.dispose() for replica in self.replicas))
+
+    @staticmethod
+    async def _ping(replica: Replica, timeout: float) -> None:
+        try:
+            async with asyncio.timeout(timeout):
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception:
+            replica.mark(False)
+        else:
+            replica.mark(True)
+
+
+class RoutingSession(TrackedSession):
+    """
+    Session sending plain SELECTs to a replica and everything else to the primary.
+
+    Once the session writes, locks rows, begins a transaction or asks for a
+    connection explicitly, it sticks to the primary so the request reads its
+    own writes and explicit transactions stay atomic. Sessions
+    set up by ``read_only()`` or ``autocommit()`` ask for their connection
+    up front too, but get a replica. Within a session all replica reads go
+    to the same replica.
+    """
+
+    def __init__(self, router: EngineRouter | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.router = router
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Engine | Connection:
+        router = self.router
+        if router is None or not router.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if clause is None:
+            # An explicit connection: only read-only sessions may read stale.
+            replica_safe = is_read_only(self)
+        else:
+            replica_safe = isinstance(clause, Select) and clause._for_update_arg is None
+        if (
+            self._flushing
+            or self.info.get(_STICKY)
+            or not replica_safe
+            or self._in_explicit_transaction()
+        ):
+            self.info[_STICKY] = True
+            return router.primary.sync_engine
+
+        replica: Replica | None = self.info.get(_REPLICA)
+        if replica is None or not replica.healthy:
+            replica = router.pick()
+            if replica is None:
+                return router.primary.sync_engine
+            self.info[_REPLICA] = replica
+        return replica.engine.sync_engine
+
+    def _in_explicit_transaction(self) -> bool:
+        transaction = self.get_transaction()
+        return self.in_nested_transaction() or (
+            transaction is not None
+            and transaction.origin is not SessionTransactionOrigin.AUTOBEGIN
+        )
+
+
+def use_primary(session: AsyncSession) -> None:
+    """Send every following statement of ``session`` to the primary."""
+    session.info[_STICKY] = True
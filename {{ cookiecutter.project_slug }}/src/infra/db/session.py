@@ -0,0 +1,102 @@
+import math
+
+from infra import deadline
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+ROUND_TRIPS_SAVED = Histogram(
+    "db_session_round_trips_saved",
+    "Histogram of database round-trips saved per request session by outcome "
+    "(unused, autocommit, commit).",
+    ["outcome"],
+    buckets=(0, 1, 2, 3, 4, 6, 8),
+)
+
+_AUTOCOMMIT = "db_autocommit"
+_READ_ONLY = "db_read_only"
+_STATEMENT_TIMEOUT = "db_statement_timeout"
+
+
+class TrackedSession(Session):
+    """
+    Session whose statements are cancelled once the request deadline passes.
+
+    Each transaction sets a ``statement_timeout`` from the time left, and
+    ``finish_session`` reports the round-trips saved by ``autocommit()``.
+    """
+
+
+@event.listens_for(TrackedSession, "after_begin")
+def _on_begin(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    left = deadline.remaining()
+    connection.info[_STATEMENT_TIMEOUT] = False
+    if (
+        left is not None
+        and connection.get_execution_options().get("isolation_level") != "AUTOCOMMIT"
+    ):
+        # Postgres cancels the statements still running once the request has
+        # given up, instead of holding the connection until they finish.
+        timeout = max(1, math.ceil(left * 1000))
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout}")
+        connection.info[_STATEMENT_TIMEOUT] = True
+
+
+async def clear_statement_timeout(connection: AsyncConnection) -> None:
+    """
+    Lift the deadline's statement timeout from the current transaction.
+
+    For statements that outlive the request's time budget on purpose, such
+    as exports streamed after the response has started.
+    """
+    if connection.info.get(_STATEMENT_TIMEOUT):
+        await connection.exec_driver_sql("SET LOCAL statement_timeout = 0")
+        connection.info[_STATEMENT_TIMEOUT] = False
+
+
+async def read_only(session: AsyncSession) -> None:
+    """
+    Run the transaction of ``session`` as ``BEGIN READ ONLY``.
+
+    Must be called before the session runs its first query.
+    """
+    session.info[_READ_ONLY] = True
+    await session.connection(execution_options={"postgresql_readonly": True})
+
+
+async def autocommit(session: AsyncSession) -> None:
+    """
+    Run every statement of ``session`` in its own implicit transaction.
+
+    Saves the BEGIN and COMMIT round-trips of read-only interactors. Must be
+    called before the session runs its first query.
+    """
+    session.info[_AUTOCOMMIT] = True
+    await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+
+
+def is_read_only(session: Session) -> bool:
+    """Whether ``session`` was set up by ``read_only()`` or ``autocommit()``."""
+    return bool(session.info.get(_READ_ONLY) or session.info.get(_AUTOCOMMIT))
+
+
+async def finish_session(session: AsyncSession) -> None:
+    """
+    Commit the request transaction of ``session``.
+
+    Sessions that never touched the database hold no connection and the
+    commit sends nothing. ``autocommit()`` sessions send neither BEGIN nor
+    COMMIT, the only round-trips saved.
+    """
+    if session.info.get(_AUTOCOMMIT):
+        outcome, saved = "autocommit", 2
+    elif session.in_transaction() or session.new or session.dirty or session.deleted:
+        outcome, saved = "commit", 0
+    else:
+        outcome, saved = "unused", 0
+    await session.commit()
+    ROUND_TRIPS_SAVED.labels(outcome=outcome).observe(saved)
@@ -0,0 +1,69 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+HEADER = "x-request-timeout"
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    """
+    Give the current context ``timeout`` seconds, as an absolute loop time.
+
+    Nested deadlines can only shorten the enclosing one.
+    """
+    at = asyncio.get_running_loop().time() + timeout
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current)
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def lift() -> None:
+    """
+    Drop the deadline for the rest of the current context.
+
+    For work allowed to outlive the request's time budget, such as a body
+    streamed once the response has started.
+    """
+    _deadline.set(None)
+
+
+def expires_at() -> float | None:
+    """Loop time of the current deadline, or ``None`` without one."""
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or ``None`` without one."""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return at - asyncio.get_running_loop().time()
+
+
+def clip(timeout: float | None) -> float | None:
+    """Shorten ``timeout`` to the time left, so work never outlives its request."""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.0)
+    return left if timeout is None else min(timeout, left)
+
+
+def timeout(reserve: float = 0.0) -> asyncio.Timeout:
+    """
+    ``asyncio.timeout`` expiring ``reserve`` seconds before the deadline.
+
+    The reserve leaves time to handle the ``TimeoutError``, e.g. to answer
+    with a partial result before the request itself times out.
+    """
+    at = _deadline.get()
+    return asyncio.timeout_at(None if at is None else at - reserve)
@@ -0,0 +1,13 @@
+from .base import BaseClient, Response
+from .batch import BatchRequest, BatchResult
+from .http import build_http_client
+from .resilience import CircuitOpenError
+
+__all__ = (
+    "BaseClient",
+    "BatchRequest",
+    "BatchResult",
+    "CircuitOpenError",
+    "Response",
+    "build_http_client",
+)
@@ -1,11 +1,48 @@
 import abc
+import asyncio
 import logging
-from typing import Annotated, Any, Literal, Mapping
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Mapping,
+    Self,
+)
 
 import backoff
 import httpx
+import msgpack
+import orjson
+from infra import deadline
+from infra.config import HttpClientConfig
 from pydantic import BaseModel, Field
 
+from .batch import (
+    BATCH_DURATION,
+    BATCH_REQUEST_LATENCY,
+    BATCH_THROUGHPUT,
+    BatchRequest,
+    BatchResult,
+    TokenBucket,
+)
+from .cache import CACHE_REQUESTS, CachedResponse, HttpCache
+from .http import build_http_client
+from .resilience import (
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    HedgePolicy,
+    Hedger,
+    get_circuit_breaker,
+)
+from .streaming import JsonArrayDecoder
+
 
 class Response(BaseModel):
     status_code: int
@@ -14,13 +51,112 @@ class Response(BaseModel):
     )
 
 
+MSGPACK = "application/msgpack"
+
+
+def _loads(content: bytes, content_type: str | None) -> Any:
+    if content_type is not None and "msgpack" in content_type:
+        return msgpack.unpackb(content, strict_map_key=False)
+    return orjson.loads(content)
+
+
+def _response(
+    status_code: int,
+    content: bytes,
+    raw: bool = False,
+    content_type: str | None = None,
+) -> Response:
+    data = _loads(content, content_type)
+    if raw:
+        # The caller trusts the payload, skip pydantic validation.
+        return Response.model_construct(status_code=status_code, data=data)
+    return Response(status_code=status_code, data=data)
+
+
+def _with_deadline(headers: Mapping[str, str] | None) -> Mapping[str, str] | None:
+    # Tell the upstream how long we will wait, so it can give up in time too.
+    left = deadline.remaining()
+    if left is None:
+        return headers
+    return {**(headers or {}), deadline.HEADER: f"{max(left, 0.0):.3f}"}
+
+
 class BaseClient(abc.ABC):
+    """
+    Base class for outbound API clients.
+
+    Pass the APP-scoped ``httpx.AsyncClient`` from ``HttpClientProvider`` to
+    reuse its keep-alive pool. Without one, the client owns a persistent
+    ``httpx.AsyncClient`` and must be closed with ``aclose()``.
+
+    Calls go through the per-host circuit breaker, so a failing dependency is
+    answered with a 503 ``Response`` right away. GETs can be hedged by passing
+    a ``HedgePolicy`` and served from an ``HttpCache``.
+
+    Pass ``raw=True`` to skip validating the payload into ``Response``, and use
+    ``stream_bytes()`` or ``stream_json()`` to process large bodies without
+    holding them in memory.
 
-    def __init__(self, url: str, timeout: int = 20) -> None:
+    Requests use the timeouts of the ``httpx.AsyncClient`` unless ``timeout``
+    is given. Within a request, timeouts are cut to the time left before its
+    deadline, which is passed on in the ``X-Request-Timeout`` header.
+
+    Pass ``msgpack=True`` to ask peers built from this template for
+    MessagePack instead of JSON, which is smaller and faster to decode for
+    large numeric payloads. Streaming methods always ask for JSON.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = CircuitBreakerPolicy(),
+        hedge: HedgePolicy | None = None,
+        cache: HttpCache | None = None,
+        msgpack: bool = False,
+    ) -> None:
         self._url = url
+        self._msgpack = msgpack
         self._timeout = timeout
+        self._host = httpx.URL(url).host
+        self._breaker = (
+            get_circuit_breaker(self._host, circuit_breaker)
+            if circuit_breaker is not None
+            else None
+        )
+        self._hedger: Hedger[httpx.Response] | None = (
+            Hedger(self._host, hedge) if hedge is not None else None
+        )
+        self._cache = cache
+        self._owns_client = client is None
+        config = HttpClientConfig() if timeout is None else HttpClientConfig(timeout)
+        self._client = client or build_http_client(config, name=self.__class__.__name__)
         self.log = logging.getLogger(self.__class__.__name__)
 
+    def _request_timeout(self) -> httpx.Timeout:
+        timeout = (
+            self._client.timeout
+            if self._timeout is None
+            else httpx.Timeout(self._timeout)
+        )
+        return httpx.Timeout(
+            connect=deadline.clip(timeout.connect),
+            read=deadline.clip(timeout.read),
+            write=deadline.clip(timeout.write),
+            pool=deadline.clip(timeout.pool),
+        )
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     @backoff.on_exception(
         backoff.expo,
         (httpx.ConnectError, httpx.RequestError),
@@ -34,6 +170,10 @@ class BaseClient(abc.ABC):
         headers: Mapping[str, str] | None = None,
         data: Mapping[str, str] | None = None,
         json: Mapping[str, str] | None = None,
+        on_response: (
+            Callable[[httpx.Response], Awaitable[Response | None]] | None
+        ) = None,
+        raw: bool = False,
     ) -> Response:
         """
         Make an HTTP request
@@ -43,60 +183,156 @@ class BaseClient(abc.ABC):
         :param headers: Headers for the request
         :param data: Data for the request
         :param json: JSON data for the request
+        :param on_response: Hook that may answer before the default handling
+        :param raw: Build the response without pydantic validation
         :return: The response from the API
         """
         request_url = f"{self._url}{path}"
         if headers is None:
             headers = {"Content-Type": "application/json"}
-        async with httpx.AsyncClient(
-            base_url=self._url,
-            headers=headers,
-            timeout=self._timeout,
-        ) as client:
-            self.log.debug(
-                "Making request %r %r with json %r and params %r",
+        self.log.debug(
+            "Making request %r %r with json %r and params %r",
+            method,
+            request_url,
+            json,
+            params,
+        )
+        if self._breaker is not None and not self._breaker.allow():
+            self.log.warning("Circuit for %r is open, failing fast", self._host)
+            return Response(
+                status_code=503,
+                data={"error": f"Circuit breaker for {self._host} is open"},
+            )
+
+        failed: bool | None = None
+        started = time.perf_counter()
+        try:
+            response = await self._send(
                 method,
                 request_url,
-                json,
-                params,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
             )
-            try:
-                response = await client.request(
-                    method=method,
-                    params=params,
-                    json=json,
-                    data=data,
-                    headers=headers,
-                    url=request_url,
-                )
-                response.raise_for_status()
-                return Response(data=response.json(), status_code=response.status_code)
-            except httpx.HTTPStatusError as e:
-                self.log.error(
-                    "Request to %r %r failed with status code %r and error %r",
-                    method,
-                    request_url,
-                    e.response.status_code,
-                    e.response.text,
-                )
-                return Response(status_code=e.response.status_code)
-            except httpx.RequestError as e:
-                self.log.error(
-                    "Request to %r %r failed with error %r",
-                    method,
-                    request_url,
-                    str(e),
+            failed = response.is_server_error
+            if on_response is not None:
+                handled = await on_response(response)
+                if handled is not None:
+                    return handled
+            response.raise_for_status()
+            return _response(
+                response.status_code,
+                response.content,
+                raw,
+                response.headers.get("content-type"),
+            )
+        except httpx.HTTPStatusError as e:
+            self.log.error(
+                "Request to %r %r failed with status code %r and error %r",
+                method,
+                request_url,
+                e.response.status_code,
+                e.response.text,
+            )
+            return Response(status_code=e.response.status_code)
+        except httpx.RequestError as e:
+            failed = True
+            self.log.error(
+                "Request to %r %r failed with error %r",
+                method,
+                request_url,
+                str(e),
+            )
+            return Response(status_code=500, data={"error": str(e)})
+        finally:
+            if self._breaker is not None:
+                if failed is None:
+                    self._breaker.release()
+                else:
+                    self._breaker.record(failed, time.perf_counter() - started)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        headers = kwargs.pop("headers", None)
+        if self._msgpack:
+            headers = {**(headers or {}), "Accept": MSGPACK}
+
+        def attempt() -> Awaitable[httpx.Response]:
+            return self._client.request(
+                method=method,
+                url=url,
+                timeout=self._request_timeout(),
+                headers=_with_deadline(headers),
+                **kwargs,
+            )
+
+        if method == "GET" and self._hedger is not None:
+            return await self._hedger.run(attempt)
+        return await attempt()
+
+    async def _cached_get(
+        self,
+        cache: HttpCache,
+        key: str,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        raw: bool = False,
+    ) -> Response:
+        entry = await cache.get(key)
+        if entry is not None and entry.is_fresh:
+            CACHE_REQUESTS.labels(host=self._host, result="hit").inc()
+            return _response(
+                entry.status_code, entry.body, raw, entry.headers.get("content-type")
+            )
+
+        request_headers = dict(headers or {"Content-Type": "application/json"})
+        if entry is not None:
+            request_headers |= entry.conditional_headers
+
+        async def on_response(response: httpx.Response) -> Response | None:
+            if response.status_code == 304 and entry is not None:
+                CACHE_REQUESTS.labels(host=self._host, result="revalidated").inc()
+                refreshed = entry.revalidated(response)
+                await cache.set(key, refreshed)
+                return _response(
+                    refreshed.status_code,
+                    refreshed.body,
+                    raw,
+                    refreshed.headers.get("content-type"),
                 )
-                return Response(status_code=500, data={"error": str(e)})
+
+            CACHE_REQUESTS.labels(host=self._host, result="miss").inc()
+            stored = CachedResponse.from_response(response, cache.default_ttl)
+            if stored is not None:
+                await cache.set(key, stored)
+            return None
+
+        return await self._make_request(
+            path,
+            method="GET",
+            params=params,
+            headers=request_headers,
+            on_response=on_response,
+            raw=raw,
+        )
 
     async def get(
         self,
         path: str,
         params: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        raw: bool = False,
     ) -> Response:
+        if self._cache is not None:
+            key = self._cache.key(f"{self._url}{path}", params, headers)
+            return await self._cache.single_flight(
+                key,
+                self._host,
+                partial(self._cached_get, self._cache, key, path, params, headers, raw),
+            )
         return await self._make_request(
-            path, method="GET", params=params, headers=headers
+            path, method="GET", params=params, headers=headers, raw=raw
         )
 
     async def post(
@@ -105,9 +341,10 @@ class BaseClient(abc.ABC):
         json: Mapping[str, str] | None = None,
         data: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        raw: bool = False,
     ) -> Response:
         return await self._make_request(
-            path, method="POST", json=json, data=data, headers=headers
+            path, method="POST", json=json, data=data, headers=headers, raw=raw
         )
 
     async def patch(
@@ -116,9 +353,10 @@ class BaseClient(abc.ABC):
         json: Mapping[str, str] | None = None,
         data: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        raw: bool = False,
     ) -> Response:
         return await self._make_request(
-            path, method="PATCH", json=json, data=data, headers=headers
+            path, method="PATCH", json=json, data=data, headers=headers, raw=raw
         )
 
     async def delete(
@@ -126,5 +364,178 @@ class BaseClient(abc.ABC):
         path: str,
         params: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        raw: bool = False,
     ) -> Response:
-        return await self._make_request(path, "DELETE", params=params, headers=headers)
+        return await self._make_request(
+            path, "DELETE", params=params, headers=headers, raw=raw
+        )
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        path: str,
+        method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"],
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        data: Mapping[str, str] | None,
+        json: Mapping[str, Any] | None,
+    ) -> AsyncIterator[httpx.Response]:
+        if self._breaker is not None and not self._breaker.allow():
+            raise CircuitOpenError(self._host)
+
+        failed: bool | None = None
+        started = time.perf_counter()
+        try:
+            async with self._client.stream(
+                method,
+                f"{self._url}{path}",
+                params=params,
+                headers=_with_deadline(headers),
+                data=data,
+                json=json,
+                timeout=self._request_timeout(),
+            ) as response:
+                failed = response.is_server_error
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                yield response
+        except httpx.RequestError:
+            failed = True
+            raise
+        finally:
+            if self._breaker is not None:
+                if failed is None:
+                    self._breaker.release()
+                else:
+                    self._breaker.record(failed, time.perf_counter() - started)
+
+    async def stream_bytes(
+        self,
+        path: str,
+        method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET",
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: Mapping[str, str] | None = None,
+        json: Mapping[str, Any] | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the response body in chunks of up to ``chunk_size`` bytes.
+
+        Unlike the other methods, errors are raised: ``httpx.HTTPStatusError``
+        for error statuses, ``httpx.RequestError`` for transport failures and
+        ``CircuitOpenError`` when the circuit is open.
+        """
+        async with self._open_stream(
+            path, method, params, headers, data, json
+        ) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def stream_json(
+        self,
+        path: str,
+        method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET",
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: Mapping[str, str] | None = None,
+        json: Mapping[str, Any] | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the items of a JSON array body one by one as they are received.
+
+        Raises like ``stream_bytes()``, and ``ValueError`` if the body is not a
+        well-formed JSON array.
+        """
+        decoder = JsonArrayDecoder()
+        async for chunk in self.stream_bytes(
+            path, method, params, headers, data, json, chunk_size
+        ):
+            for item in decoder.feed(chunk):
+                yield item
+        decoder.close()
+
+    async def batch(
+        self,
+        requests: Iterable[BatchRequest],
+        concurrency: int = 10,
+        rate: float | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run ``requests`` with at most ``concurrency`` in flight and, if ``rate``
+        is set, no more than ``rate`` starts per second. Results are yielded in
+        completion order; a failed request yields a result carrying its error
+        and does not cancel the rest of the batch. An error raised by
+        ``requests`` itself ends the batch and is re-raised.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        pending = iter(requests)
+        limiter = TokenBucket(rate) if rate is not None else None
+        results: asyncio.Queue[BatchResult | None] = asyncio.Queue(maxsize=concurrency)
+        latency = BATCH_REQUEST_LATENCY.labels(host=self._host)
+
+        async def run(request: BatchRequest) -> None:
+            if limiter is not None:
+                await limiter.acquire()
+            started = time.perf_counter()
+            response: Response | None = None
+            error: Exception | None = None
+            try:
+                if request.method == "GET":
+                    # Keep the cache and single-flight of plain GETs.
+                    response = await self.get(
+                        request.path, params=request.params, headers=request.headers
+                    )
+                else:
+                    response = await self._make_request(
+                        request.path,
+                        method=request.method,
+                        params=request.params,
+                        headers=request.headers,
+                        data=request.data,
+                        json=request.json,
+                    )
+            except Exception as e:
+                error = e
+            duration = time.perf_counter() - started
+            latency.observe(duration)
+            await results.put(BatchResult(request, response, error, duration))
+
+        async def worker() -> None:
+            try:
+                for request in pending:
+                    await run(request)
+            finally:
+                # Also when ``requests`` raised, or the consumer would wait
+                # forever; unless the batch is being torn down.
+                task = asyncio.current_task()
+                if task is None or not task.cancelling():
+                    await results.put(None)
+
+        started = time.perf_counter()
+        completed = 0
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                completed += 1
+                yield result
+            # Re-raise an error of ``requests``, if any.
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            elapsed = time.perf_counter() - started
+            BATCH_DURATION.labels(host=self._host).observe(elapsed)
+            if completed and elapsed > 0:
+                BATCH_THROUGHPUT.labels(host=self._host).observe(completed / elapsed)
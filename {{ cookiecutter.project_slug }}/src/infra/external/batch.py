@@ -0,0 +1,79 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Mapping
+
+from prometheus_client import Histogram
+
+if TYPE_CHECKING:
+    from .base import Response
+
+BATCH_DURATION = Histogram(
+    "http_client_batch_duration_seconds",
+    "Histogram of outbound batch processing time by host (in seconds)",
+    ["host"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+BATCH_THROUGHPUT = Histogram(
+    "http_client_batch_throughput",
+    "Histogram of outbound batch throughput by host (in requests per second)",
+    ["host"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+BATCH_REQUEST_LATENCY = Histogram(
+    "http_client_batch_request_duration_seconds",
+    "Histogram of outbound request time inside batches by host (in seconds)",
+    ["host"],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchRequest:
+    path: str
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    params: Mapping[str, str] | None = None
+    headers: Mapping[str, str] | None = None
+    data: Mapping[str, str] | None = None
+    json: Mapping[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of one ``BatchRequest``; ``error`` is set if it raised."""
+
+    request: BatchRequest
+    response: "Response | None" = None
+    error: BaseException | None = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return (
+            self.error is None
+            and self.response is not None
+            and self.response.status_code < 400
+        )
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,228 @@
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Mapping
+
+import httpx
+import orjson
+from infra.cache import LRUCache
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+CACHE_REQUESTS = Counter(
+    "http_client_cache_requests_total",
+    "Total count of cacheable outbound GETs by host and result "
+    "(hit, miss, revalidated, collapsed).",
+    ["host", "result"],
+)
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# Successful statuses with a complete body, unlike 204 No Content and 206
+# Partial Content.
+CACHEABLE_STATUSES = frozenset((200, 203))
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _freshness_lifetime(headers: httpx.Headers) -> float | None:
+    directives = _parse_cache_control(headers.get("cache-control", ""))
+    for name in ("s-maxage", "max-age"):
+        if (argument := directives.get(name)) is not None and argument.isdigit():
+            return float(argument)
+    if "no-cache" in directives:
+        return 0.0
+    if (expires := headers.get("expires")) is not None:
+        try:
+            return max(parsedate_to_datetime(expires).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    max_age: float
+
+    @classmethod
+    def from_response(
+        cls, response: httpx.Response, default_ttl: float | None = None
+    ) -> "CachedResponse | None":
+        """Build an entry if the response may be stored, following Cache-Control."""
+        if response.status_code not in CACHEABLE_STATUSES:
+            return None
+        directives = _parse_cache_control(response.headers.get("cache-control", ""))
+        if "no-store" in directives or response.headers.get("vary") == "*":
+            return None
+
+        max_age = _freshness_lifetime(response.headers)
+        if max_age is None:
+            if default_ttl is not None:
+                max_age = default_ttl
+            elif "etag" in response.headers or "last-modified" in response.headers:
+                max_age = 0.0
+            else:
+                return None
+
+        return cls(
+            status_code=response.status_code,
+            headers={
+                name: response.headers[name]
+                for name in _STORED_HEADERS
+                if name in response.headers
+            },
+            body=response.content,
+            stored_at=time.time(),
+            max_age=max_age,
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.max_age
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if (etag := self.headers.get("etag")) is not None:
+            headers["If-None-Match"] = etag
+        if (last_modified := self.headers.get("last-modified")) is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def revalidated(self, response: httpx.Response) -> "CachedResponse":
+        """Return this entry refreshed by a ``304 Not Modified`` response."""
+        headers = self.headers | {
+            name: response.headers[name]
+            for name in _STORED_HEADERS
+            if name in response.headers
+        }
+        max_age = _freshness_lifetime(response.headers)
+        return replace(
+            self,
+            headers=headers,
+            stored_at=time.time(),
+            max_age=self.max_age if max_age is None else max_age,
+        )
+
+    def dumps(self) -> bytes:
+        return orjson.dumps(
+            {
+                "status_code": self.status_code,
+                "headers": self.headers,
+                "body": base64.b64encode(self.body).decode(),
+                "stored_at": self.stored_at,
+                "max_age": self.max_age,
+            }
+        )
+
+    @classmethod
+    def loads(cls, raw: bytes | str) -> "CachedResponse":
+        data = orjson.loads(raw)
+        data["body"] = base64.b64decode(data["body"])
+        return cls(**data)
+
+
+class HttpCache:
+    """
+    Opt-in HTTP-semantics cache for ``BaseClient.get``.
+
+    Entries live in a size-bounded in-process LRU and, if a Redis client is
+    given, in Redis as a second tier shared by all workers. Stale entries are
+    kept so they can be revalidated with conditional requests, and identical
+    in-flight requests are collapsed into one upstream call. Redis errors are
+    logged and the in-process tier is used alone.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        redis: Redis | None = None,
+        redis_prefix: str = "http-cache:",
+        redis_ttl: int = 24 * 60 * 60,
+        default_ttl: float | None = None,
+    ) -> None:
+        self._local: LRUCache[str, CachedResponse] = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=lambda entry: len(entry.body),
+        )
+        self._redis = redis
+        self._redis_prefix = redis_prefix
+        self._redis_ttl = redis_ttl
+        self.default_ttl = default_ttl
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> str:
+        digest = hashlib.blake2b(url.encode(), digest_size=16)
+        for name, value in sorted((params or {}).items()):
+            digest.update(f"\0{name}={value}".encode())
+        for name, value in sorted((headers or {}).items()):
+            # Credentials and negotiated representations must not be shared.
+            if name.lower() in ("authorization", "accept", "accept-encoding"):
+                digest.update(f"\0{name.lower()}:{value}".encode())
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> CachedResponse | None:
+        entry = self._local.get(key)
+        if entry is not None or self._redis is None:
+            return entry
+        try:
+            raw = await self._redis.get(self._redis_prefix + key)
+        except RedisError:
+            logger.warning("HTTP cache read failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        entry = CachedResponse.loads(raw)
+        self._local.set(key, entry)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        self._local.set(key, entry)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._redis_prefix + key, entry.dumps(), ex=self._redis_ttl
+            )
+        except RedisError:
+            logger.warning("HTTP cache write failed", exc_info=True)
+
+    async def single_flight[T](
+        self, key: str, host: str, fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run ``fetch`` once for all concurrent callers asking for ``key``."""
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            CACHE_REQUESTS.labels(host=host, result="collapsed").inc()
+            result: T = await asyncio.shield(in_flight)
+            return result
+
+        task = asyncio.ensure_future(fetch())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
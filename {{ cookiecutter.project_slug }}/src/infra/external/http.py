@@ -0,0 +1,132 @@
+import time
+import weakref
+from collections import Counter as Tally
+from typing import Iterable
+
+import httpx
+from infra.config import HttpClientConfig
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+REQUESTS = Counter(
+    "http_client_requests_total",
+    "Total count of outbound requests by host, method and status code.",
+    ["host", "method", "status_code"],
+)
+REQUESTS_DURATION = Histogram(
+    "http_client_request_duration_seconds",
+    "Histogram of outbound request time to response headers by host (in seconds)",
+    ["host", "method"],
+)
+
+
+class HttpPoolCollector(Collector):
+    """
+    Reports the connection pools of the tracked clients per host on scrape.
+
+    httpx keeps no counters of its own, so the state is read from the
+    underlying httpcore pool each time ``/metrics`` is collected. Those are
+    private attributes: whatever a release renames is skipped, not raised.
+    """
+
+    def __init__(self) -> None:
+        self._clients: weakref.WeakValueDictionary[str, httpx.AsyncClient] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def track(self, name: str, client: httpx.AsyncClient) -> None:
+        self._clients[name] = client
+
+    def collect(self) -> Iterable[Metric]:
+        connections = GaugeMetricFamily(
+            "http_client_pool_connections",
+            "Gauge of outbound pool connections by client, host and state.",
+            labels=["client", "host", "state"],
+        )
+        queued = GaugeMetricFamily(
+            "http_client_pool_queued_requests",
+            "Gauge of outbound requests waiting for a pool connection by host.",
+            labels=["client", "host"],
+        )
+        for name, client in list(self._clients.items()):
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            if pool is None:
+                continue
+            states: Tally[tuple[str, str]] = Tally()
+            for connection in getattr(pool, "connections", ()):
+                is_idle = getattr(connection, "is_idle", None)
+                if is_idle is None:
+                    continue
+                state = "idle" if is_idle() else "active"
+                states[(_origin_host(connection), state)] += 1
+            for (host, state), count in states.items():
+                connections.add_metric([name, host, state], count)
+
+            waiting: Tally[str] = Tally(
+                _request_host(request)
+                for request in getattr(pool, "_requests", ())
+                if getattr(request, "is_queued", lambda: False)()
+            )
+            for host, count in waiting.items():
+                queued.add_metric([name, host], count)
+
+        yield connections
+        yield queued
+
+
+def _origin_host(connection: object) -> str:
+    origin = getattr(connection, "_origin", None)
+    if origin is None:
+        return "unknown"
+    return str(origin.host.decode())
+
+
+def _request_host(pool_request: object) -> str:
+    url = getattr(getattr(pool_request, "request", None), "url", None)
+    if url is None:
+        return "unknown"
+    return str(url.host.decode())
+
+
+POOL_COLLECTOR = HttpPoolCollector()
+REGISTRY.register(POOL_COLLECTOR)
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions["started_at"] = time.perf_counter()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    request = response.request
+    host = request.url.host
+    REQUESTS.labels(
+        host=host, method=request.method, status_code=response.status_code
+    ).inc()
+    started_at = request.extensions.get("started_at")
+    if started_at is not None:
+        REQUESTS_DURATION.labels(host=host, method=request.method).observe(
+            time.perf_counter() - started_at
+        )
+
+
+def build_http_client(
+    config: HttpClientConfig, name: str = "default"
+) -> httpx.AsyncClient:
+    """
+    Create a long-lived client whose keep-alive pool is shared by every call.
+
+    The caller owns the client and must ``aclose()`` it on shutdown.
+    """
+    client = httpx.AsyncClient(
+        timeout=config.timeout,
+        http2=config.http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+    POOL_COLLECTOR.track(name, client)
+    return client
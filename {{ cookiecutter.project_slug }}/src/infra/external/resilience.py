@@ -0,0 +1,275 @@
+import asyncio
+import enum
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from prometheus_client import Counter, Gauge
+
+CIRCUIT_STATE = Gauge(
+    "fastapi_outbound_circuit_state",
+    "Circuit breaker state by host (0 - closed, 1 - open, 2 - half-open).",
+    ["host"],
+)
+CIRCUIT_TRANSITIONS = Counter(
+    "fastapi_outbound_circuit_transitions_total",
+    "Total count of circuit breaker transitions by host and new state.",
+    ["host", "state"],
+)
+CIRCUIT_REJECTIONS = Counter(
+    "fastapi_outbound_circuit_rejections_total",
+    "Total count of outbound requests failed fast by an open circuit by host.",
+    ["host"],
+)
+HEDGED_REQUESTS = Counter(
+    "fastapi_outbound_hedged_requests_total",
+    "Total count of hedged outbound requests by host and the attempt that won.",
+    ["host", "winner"],
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of a 503 ``Response`` where no ``Response`` is returned."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(f"Circuit breaker for {host} is open")
+        self.host = host
+
+
+class CircuitState(enum.IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerPolicy:
+    """
+    Thresholds of a circuit breaker.
+
+    Attributes
+    ----------
+    window : float
+        Length of the rolling window of recorded calls, in seconds.
+    min_calls : int
+        Calls needed in the window before the rates are evaluated.
+    error_rate : float
+        Share of failed calls that opens the circuit.
+    slow_call_duration : float
+        Calls slower than this, in seconds, count as slow.
+    slow_call_rate : float
+        Share of slow calls that opens the circuit.
+    open_duration : float
+        Seconds the circuit stays open before letting trial calls through.
+    half_open_calls : int
+        Successful trial calls needed to close the circuit again.
+    """
+
+    window: float = 30.0
+    min_calls: int = 20
+    error_rate: float = 0.5
+    slow_call_duration: float = 5.0
+    slow_call_rate: float = 0.8
+    open_duration: float = 15.0
+    half_open_calls: int = 3
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a rolling window of call outcomes.
+
+    While open, ``allow()`` returns False so callers can fail fast instead of
+    waiting on a dependency that is already known to be failing or slow.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        policy: CircuitBreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.policy = policy
+        self._clock = clock
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._state = CircuitState.CLOSED
+        CIRCUIT_STATE.labels(host=host).set(self._state)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow(self) -> bool:
+        if self._state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.policy.open_duration:
+                CIRCUIT_REJECTIONS.labels(host=self.host).inc()
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._trials >= self.policy.half_open_calls:
+                CIRCUIT_REJECTIONS.labels(host=self.host).inc()
+                return False
+            self._trials += 1
+        return True
+
+    def record(self, failed: bool, duration: float) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            if failed:
+                self._transition(CircuitState.OPEN)
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.policy.half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        now = self._clock()
+        slow = duration >= self.policy.slow_call_duration
+        self._calls.append((now, failed, slow))
+        self._failures += failed
+        self._slow += slow
+        self._evict(now)
+
+        calls = len(self._calls)
+        if self._state is CircuitState.CLOSED and calls >= self.policy.min_calls:
+            if (
+                self._failures / calls >= self.policy.error_rate
+                or self._slow / calls >= self.policy.slow_call_rate
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Give back a trial slot of a call that ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN and self._trials:
+            self._trials -= 1
+
+    def _evict(self, now: float) -> None:
+        horizon = now - self.policy.window
+        while self._calls and self._calls[0][0] < horizon:
+            _, failed, slow = self._calls.popleft()
+            self._failures -= failed
+            self._slow -= slow
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._trials = 0
+        self._trial_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        if state is CircuitState.CLOSED:
+            self._calls.clear()
+            self._failures = self._slow = 0
+        CIRCUIT_STATE.labels(host=self.host).set(state)
+        CIRCUIT_TRANSITIONS.labels(host=self.host, state=state.name.lower()).inc()
+
+
+_BREAKERS: dict[tuple[str, CircuitBreakerPolicy], CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str, policy: CircuitBreakerPolicy) -> CircuitBreaker:
+    """Return the process-wide breaker of ``host``, shared by all its clients."""
+    breaker = _BREAKERS.get((host, policy))
+    if breaker is None:
+        breaker = _BREAKERS[(host, policy)] = CircuitBreaker(host, policy)
+    return breaker
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    """
+    When to send a second, hedged copy of an idempotent request.
+
+    Attributes
+    ----------
+    quantile : int
+        Percentile of recent latencies after which the hedge is sent.
+    min_delay : float
+        Lower bound of the hedge delay, in seconds.
+    max_delay : float
+        Upper bound of the hedge delay, used until enough samples are seen.
+    min_samples : int
+        Latency samples needed before the percentile is trusted.
+    samples : int
+        Number of recent latencies kept per host.
+    """
+
+    quantile: int = 95
+    min_delay: float = 0.01
+    max_delay: float = 1.0
+    min_samples: int = 50
+    samples: int = 500
+
+
+_LATENCIES: dict[tuple[str, HedgePolicy], deque[float]] = {}
+
+
+class Hedger[T]:
+    """
+    Races a delayed second attempt against a slow first one.
+
+    The delay follows the recent latencies of ``host``, which are shared by
+    every hedger of that host and policy in the process.
+    """
+
+    def __init__(self, host: str, policy: HedgePolicy) -> None:
+        self.host = host
+        self.policy = policy
+        latencies = _LATENCIES.get((host, policy))
+        if latencies is None:
+            latencies = _LATENCIES[(host, policy)] = deque(maxlen=policy.samples)
+        self._latencies = latencies
+
+    @property
+    def delay(self) -> float:
+        if len(self._latencies) < self.policy.min_samples:
+            return self.policy.max_delay
+        quantile = statistics.quantiles(self._latencies, n=100)[
+            self.policy.quantile - 1
+        ]
+        return min(max(quantile, self.policy.min_delay), self.policy.max_delay)
+
+    async def run(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(attempt())
+        tasks: set[asyncio.Future[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay)
+            if not done:
+                hedge = asyncio.ensure_future(attempt())
+                tasks.add(hedge)
+            winner = await self._first_success(tasks)
+            if len(tasks) > 1:
+                HEDGED_REQUESTS.labels(
+                    host=self.host,
+                    winner="primary" if winner is primary else "hedge",
+                ).inc()
+            self._latencies.append(time.perf_counter() - started)
+            return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    @staticmethod
+    async def _first_success(tasks: set["asyncio.Future[T]"]) -> "asyncio.Future[T]":
+        pending = set(tasks)
+        failed: asyncio.Future[T] | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task
+                failed = failed or task
+        assert failed is not None
+        return failed
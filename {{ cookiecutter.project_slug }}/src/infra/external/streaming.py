@@ -0,0 +1,94 @@
+import re
+from typing import Any, Callable
+
+import orjson
+
+# A whole string literal, or a lone quote when it is cut by the chunk boundary.
+_TOKENS = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|["\[\]{},]', re.DOTALL)
+
+
+class JsonArrayDecoder:
+    """
+    Incremental decoder of a top-level JSON array.
+
+    Chunks are fed as they arrive and every complete item is returned as soon
+    as its closing separator is seen, so only the current item has to be kept
+    in memory. Items are decoded with orjson.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] = orjson.loads) -> None:
+        self._loads = loads
+        self._buffer = bytearray()
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._count = 0
+        self.done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        if self.done:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+
+        buffer = self._buffer
+        buffer += chunk
+        items: list[Any] = []
+        resume = len(buffer)
+        for match in _TOKENS.finditer(buffer, self._pos):
+            i = match.start()
+            char = buffer[i]
+            if char == 0x22:  # "
+                if match.end() - i == 1:
+                    # The string continues in the next chunk, rescan it then.
+                    resume = i
+                    break
+                if self._depth == 0:
+                    raise ValueError("Expected a JSON array")
+                continue
+            if self._depth == 0:
+                if char != 0x5B or buffer[:i].strip():  # [
+                    raise ValueError("Expected a JSON array")
+                self._depth = 1
+                self._start = i + 1
+            elif char in (0x5B, 0x7B):  # [ {
+                self._depth += 1
+            elif char in (0x5D, 0x7D):  # ] }
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buffer, i, items, closing=True)
+                    if buffer[i + 1 :].strip():
+                        raise ValueError(
+                            "Unexpected data after the end of the JSON array"
+                        )
+                    self.done = True
+                    break
+            elif self._depth == 1:  # ,
+                self._emit(buffer, i, items, closing=False)
+
+        if self._depth == 0 and not self.done and buffer.strip():
+            raise ValueError("Expected a JSON array")
+        if self._depth:
+            # Drop what has been consumed, keep the item being read.
+            del buffer[: self._start]
+            self._pos = resume - self._start
+            self._start = 0
+        else:
+            buffer.clear()
+            self._pos = 0
+        return items
+
+    def close(self) -> None:
+        if not self.done:
+            raise ValueError("Truncated JSON array")
+
+    def _emit(
+        self, buffer: bytearray, end: int, items: list[Any], closing: bool
+    ) -> None:
+        raw = bytes(buffer[self._start : end]).strip()
+        if raw:
+            items.append(self._loads(raw))
+            self._count += 1
+        elif not closing or self._count:
+            raise ValueError("Empty item in JSON array")
+        self._start = end + 1
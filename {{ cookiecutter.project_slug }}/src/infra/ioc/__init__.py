@@ -1,5 +1,7 @@
 from .adapters import (
+    AsyncpgProvider,
     ConfigProvider,
+    HttpClientProvider,
     RedisProvider,
     RepositoriesProvider,
     SqlalchemyProvider,
@@ -7,9 +9,11 @@ from .adapters import (
 from .usecases import InteractorProvider
 
 __all__ = (
+    "AsyncpgProvider",
     "ConfigProvider",
     "SqlalchemyProvider",
     "RepositoriesProvider",
     "InteractorProvider",
     "RedisProvider",
+    "HttpClientProvider",
 )
@@ -1,17 +1,23 @@
+import asyncio
+import contextlib
 from typing import AsyncIterable
 
-import backoff
+import httpx
 from dishka import Provider, Scope, provide
 from environs import Env
-from infra.config import Config, DbConfig, RedisConfig
-from redis.asyncio import Redis
+from infra.cache import InteractorCache
+from infra.config import Config, DbConfig, HttpClientConfig, RedisConfig
+from infra.db.instrumentation import instrument_engine
+from infra.db.pool import build_engine
+from infra.db.raw import QueryExecutor, create_pool
+from infra.db.repositories import EntityLoaders
+from infra.db.routing import EngineRouter, Replica, RoutingSession
+from infra.db.session import finish_session
+from infra.external.http import build_http_client
+from infra.redis import AutoPipelineRedis, BinaryRedis, InstrumentedConnectionPool
+from redis.asyncio import ConnectionPool, Redis
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 
 class ConfigProvider(Provider):
@@ -23,6 +29,7 @@ class ConfigProvider(Provider):
         return Config(
             db=DbConfig.from_env(env),
             redis=RedisConfig.from_env(env),
+            http=HttpClientConfig.from_env(env),
         )
 
     @provide(scope=Scope.APP)
@@ -33,22 +40,61 @@ class ConfigProvider(Provider):
     def provide_redis(self, config: Config) -> RedisConfig:
         return config.redis
 
+    @provide(scope=Scope.APP)
+    def provide_http(self, config: Config) -> HttpClientConfig:
+        return config.http
+
 
 class SqlalchemyProvider(Provider):
     @provide(scope=Scope.APP)
-    def provide_engine(self, config: DbConfig) -> AsyncEngine:
-        return create_async_engine(
-            config.construct_sqlalchemy_url,
-            pool_size=10,
-            max_overflow=5,
+    async def provide_engine(self, config: DbConfig) -> AsyncIterable[AsyncEngine]:
+        engine = self._instrument(build_engine(config), config)
+        yield engine
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    async def provide_router(
+        self, config: DbConfig, engine: AsyncEngine
+    ) -> AsyncIterable[EngineRouter]:
+        router = EngineRouter(
+            engine,
+            [
+                Replica(
+                    f"replica-{i}",
+                    self._instrument(build_engine(config, f"replica-{i}", url), config),
+                )
+                for i, url in enumerate(config.replica_urls)
+            ],
+            strategy=config.replica_strategy,
+        )
+        checks = (
+            asyncio.create_task(router.run_checks(config.replica_check_interval))
+            if router.replicas
+            else None
+        )
+        yield router
+        if checks is not None:
+            checks.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await checks
+        await router.dispose()
+
+    @staticmethod
+    def _instrument(engine: AsyncEngine, config: DbConfig) -> AsyncEngine:
+        return instrument_engine(
+            engine, config.repeated_query_threshold, config.repeated_query_mode
         )
 
     @provide(scope=Scope.APP)
     def provide_sessionmaker(
-        self, engine: AsyncEngine
+        self, engine: AsyncEngine, router: EngineRouter
     ) -> async_sessionmaker[AsyncSession]:
         return async_sessionmaker(
-            bind=engine, expire_on_commit=False, class_=AsyncSession
+            bind=engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            router=router,
         )
 
     @provide(scope=Scope.REQUEST, provides=AsyncSession)
@@ -58,29 +104,101 @@ class SqlalchemyProvider(Provider):
         async with sessionmaker() as session:
             try:
                 yield session
-                await session.commit()
+                await finish_session(session)
             except SQLAlchemyError:
                 await session.rollback()
             finally:
                 await session.close()
 
 
+class AsyncpgProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def provide_executor(self, config: DbConfig) -> AsyncIterable[QueryExecutor]:
+        # The pool itself is not provided: it skips the session reset on
+        # release, which is only safe for the statements QueryExecutor runs.
+        pool = await create_pool(config)
+        yield QueryExecutor(pool)
+        await pool.close()
+
+
 class RedisProvider(Provider):
     scope = Scope.APP
 
-    @backoff.on_exception(
-        backoff.expo,
-        ConnectionError,
-        max_tries=5,
-        giveup=lambda e: e.args[0] != "Connection Error",
-    )
-    @provide(scope=Scope.REQUEST)
-    async def provide_redis(self, config: RedisConfig) -> AsyncIterable[Redis]:
-        async with Redis.from_url(
-            config.construct_redis_dsn, decode_responses=True
-        ) as r_client:
-            yield r_client
+    @provide
+    async def provide_pool(self, config: RedisConfig) -> AsyncIterable[ConnectionPool]:
+        pool = InstrumentedConnectionPool.from_url(
+            config.construct_redis_dsn,
+            max_connections=config.max_connections,
+            timeout=config.pool_timeout,
+            health_check_interval=config.health_check_interval,
+            socket_timeout=config.socket_timeout,
+            socket_connect_timeout=config.socket_connect_timeout,
+            decode_responses=True,
+        )
+        yield pool
+        await pool.disconnect()
+
+    @provide
+    def provide_redis(self, pool: ConnectionPool, config: RedisConfig) -> Redis:
+        # The client is a thin handle: every batch of commands leases a
+        # connection from the shared pool and returns it once replies are read.
+        return AutoPipelineRedis(
+            connection_pool=pool,
+            max_batch=config.pipeline_max_batch,
+            max_delay=config.pipeline_max_delay,
+        )
+
+    @provide
+    async def provide_binary_redis(
+        self, config: RedisConfig
+    ) -> AsyncIterable[BinaryRedis]:
+        # A pool of its own: decoding is a connection setting, and caches
+        # store orjson bytes that must come back undecoded.
+        pool = InstrumentedConnectionPool.from_url(
+            config.construct_redis_dsn,
+            name="binary",
+            max_connections=config.max_connections,
+            timeout=config.pool_timeout,
+            health_check_interval=config.health_check_interval,
+            socket_timeout=config.socket_timeout,
+            socket_connect_timeout=config.socket_connect_timeout,
+        )
+        yield BinaryRedis(
+            connection_pool=pool,
+            max_batch=config.pipeline_max_batch,
+            max_delay=config.pipeline_max_delay,
+        )
+        await pool.disconnect()
+
+    @provide
+    async def provide_interactor_cache(
+        self, redis: BinaryRedis
+    ) -> AsyncIterable[InteractorCache]:
+        cache = InteractorCache(redis)
+        listener = asyncio.create_task(cache.listen())
+        yield cache
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+
+
+class HttpClientProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def provide_http_client(
+        self, config: HttpClientConfig
+    ) -> AsyncIterable[httpx.AsyncClient]:
+        client = build_http_client(config)
+        yield client
+        await client.aclose()
 
 
 class RepositoriesProvider(Provider):
     scope = Scope.REQUEST
+
+    @provide
+    def provide_loaders(self, session: AsyncSession) -> EntityLoaders:
+        return EntityLoaders(session)
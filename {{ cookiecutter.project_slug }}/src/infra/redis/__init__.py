@@ -0,0 +1,12 @@
+from .binary import BinaryRedis
+from .pipelining import AutoPipelineRedis
+from .pool import InstrumentedConnectionPool
+from .ratelimit import RateLimit, RateLimiter
+
+__all__ = (
+    "AutoPipelineRedis",
+    "BinaryRedis",
+    "InstrumentedConnectionPool",
+    "RateLimit",
+    "RateLimiter",
+)
@@ -0,0 +1,10 @@
+from .pipelining import AutoPipelineRedis
+
+
+class BinaryRedis(AutoPipelineRedis):
+    """
+    Client returning raw ``bytes`` replies, for binary payloads.
+
+    The default ``Redis`` client decodes every reply to ``str``, which
+    corrupts orjson or pickled values and wastes a decode on the hot path.
+    """
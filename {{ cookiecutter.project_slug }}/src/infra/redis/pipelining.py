@@ -0,0 +1,135 @@
+import asyncio
+from typing import Any
+
+from infra import deadline
+from prometheus_client import Histogram
+from redis.asyncio import Redis
+
+PIPELINE_BATCH_SIZE = Histogram(
+    "redis_autopipeline_batch_size",
+    "Histogram of commands sent per automatic Redis pipeline.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+# Commands that block the connection or change its state can't share a pipeline.
+_UNBATCHED = frozenset(
+    {
+        "BLPOP",
+        "BRPOP",
+        "BRPOPLPUSH",
+        "BLMOVE",
+        "BLMPOP",
+        "BZPOPMIN",
+        "BZPOPMAX",
+        "BZMPOP",
+        "XREAD",
+        "XREADGROUP",
+        "WAIT",
+        "WAITAOF",
+        "MULTI",
+        "EXEC",
+        "DISCARD",
+        "WATCH",
+        "UNWATCH",
+        "SUBSCRIBE",
+        "PSUBSCRIBE",
+        "SSUBSCRIBE",
+        "MONITOR",
+        "SELECT",
+        "AUTH",
+        "CLIENT",
+    }
+)
+
+_Command = tuple[tuple[Any, ...], dict[str, Any], asyncio.Future[Any]]
+
+
+class AutoPipelineRedis(Redis):
+    """
+    Redis client sending the commands of one event-loop iteration together.
+
+    The first command of an iteration schedules a flush right after it, so
+    commands issued by coroutines started together, e.g. with
+    ``asyncio.gather``, travel in a single non-transactional pipeline: one
+    round trip instead of one per command. Each caller still awaits its own
+    reply, or its own error. A batch is flushed early once it holds
+    ``max_batch`` commands; ``max_delay`` seconds, if set, lets a batch wait
+    for the commands of later iterations too, trading latency for fewer
+    round trips.
+
+    Sequential awaits gain nothing, since each waits for the previous reply.
+    Blocking and connection-state commands bypass the batching. Within a
+    request, every command gives up once the request deadline passes.
+    """
+
+    def __init__(
+        self, *args: Any, max_batch: int = 100, max_delay: float = 0.0, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: list[_Command] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        if deadline.expires_at() is None:
+            return await self._execute(args, options)
+        # Bounded by the request deadline on top of the socket timeout.
+        async with deadline.timeout():
+            return await self._execute(args, options)
+
+    async def _execute(self, args: tuple[Any, ...], options: dict[str, Any]) -> Any:
+        if self.connection is not None or str(args[0]).upper() in _UNBATCHED:
+            return await super().execute_command(*args, **options)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((args, options, future))
+        if len(self._queue) >= self.max_batch:
+            self._flush()
+        elif len(self._queue) == 1:
+            if self.max_delay > 0:
+                self._flush_handle = loop.call_later(self.max_delay, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._queue = self._queue, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[_Command]) -> None:
+        PIPELINE_BATCH_SIZE.observe(len(batch))
+        try:
+            if len(batch) == 1:
+                args, options, _ = batch[0]
+                results = [await super().execute_command(*args, **options)]
+            else:
+                async with self.pipeline(transaction=False) as pipe:
+                    for args, options, _ in batch:
+                        pipe.execute_command(*args, **options)
+                    results = await pipe.execute(raise_on_error=False)
+        except BaseException as err:
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(err, Exception):
+                    future.set_exception(err)
+                else:
+                    future.cancel()
+            if not isinstance(err, Exception):
+                raise
+            return
+        for (_, _, future), result in zip(batch, results):
+            if future.done():  # the caller was cancelled
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,74 @@
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from prometheus_client import Gauge, Histogram
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.connection import AbstractConnection
+
+POOL_CONNECTIONS = Gauge(
+    "redis_pool_connections",
+    "Gauge of Redis pool connections by state (in_use, idle).",
+    ["pool", "state"],
+)
+POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections",
+    "Configured maximum number of Redis pool connections.",
+    ["pool"],
+)
+POOL_WAIT_TIME = Histogram(
+    "redis_pool_wait_duration_seconds",
+    "Histogram of time spent waiting for a Redis pool connection (in seconds)",
+    ["pool"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+# When the ``get_connection`` of the current task started waiting.
+_waiting_since: ContextVar[float | None] = ContextVar(
+    "redis_pool_waiting_since", default=None
+)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Blocking Redis pool that publishes its usage as Prometheus metrics.
+
+    When every connection is leased, callers wait up to ``timeout`` seconds for
+    one to be released instead of failing, and the wait is recorded. Opening
+    the leased connection is not part of the wait.
+    """
+
+    def __init__(self, name: str = "default", **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.name = name
+        POOL_MAX_CONNECTIONS.labels(pool=name).set(self.max_connections)
+        POOL_CONNECTIONS.labels(pool=name, state="in_use").set_function(
+            lambda: len(self._in_use_connections)
+        )
+        POOL_CONNECTIONS.labels(pool=name, state="idle").set_function(
+            lambda: len(self._available_connections)
+        )
+        self._wait_time = POOL_WAIT_TIME.labels(pool=name)
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        token = _waiting_since.set(time.perf_counter())
+        try:
+            connection: AbstractConnection = await super().get_connection(
+                *args, **kwargs
+            )
+            return connection
+        finally:
+            # Timed out without a lease: the whole call was spent waiting.
+            self._observe_wait()
+            _waiting_since.reset(token)
+
+    async def ensure_connection(self, connection: AbstractConnection) -> None:
+        # Called once the connection is leased, before it is (re)connected.
+        self._observe_wait()
+        await super().ensure_connection(connection)
+
+    def _observe_wait(self) -> None:
+        started = _waiting_since.get()
+        if started is not None:
+            _waiting_since.set(None)
+            self._wait_time.observe(time.perf_counter() - started)
@@ -0,0 +1,185 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from infra.cache import LRUCache
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+RATE_LIMIT_CHECKS = Counter(
+    "rate_limit_checks_total",
+    "Total count of rate limit checks by algorithm and source (local, redis).",
+    ["algorithm", "source"],
+)
+
+# Both scripts take ARGV = limit, period in ms, tokens requested, and return
+# {granted, remaining, retry after in ms, reset in ms}. The clock is Redis',
+# so workers with skewed clocks agree.
+TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = capacity / tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+local reset = math.ceil((capacity - tokens) / rate)
+redis.call('PEXPIRE', KEYS[1], reset + 1000)
+local retry = 0
+if granted == 0 then
+    retry = math.ceil((1 - tokens) / rate)
+end
+return {granted, math.floor(tokens), retry, reset}
+"""
+SLIDING_WINDOW = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local window = math.floor(now / period)
+local current_key = KEYS[1] .. ':' .. window
+local current = tonumber(redis.call('GET', current_key)) or 0
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (window - 1))) or 0
+local elapsed = now % period
+local used = previous * (1 - elapsed / period) + current
+local granted = math.max(0, math.min(requested, math.floor(limit - used)))
+if granted > 0 then
+    redis.call('INCRBY', current_key, granted)
+    redis.call('PEXPIRE', current_key, 2 * period)
+end
+local reset = period - elapsed
+local retry = 0
+if granted == 0 then
+    if current + 1 > limit or previous == 0 then
+        retry = reset
+    else
+        retry = math.min(reset, math.ceil((used + 1 - limit) / previous * period))
+    end
+end
+return {granted, math.max(0, math.floor(limit - used - granted)), retry, reset}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """
+    Quota of ``limit`` requests per ``period`` seconds.
+
+    ``token_bucket`` allows bursts of up to ``limit`` requests and refills
+    steadily; ``sliding_window`` counts requests over the last ``period``,
+    weighting the previous fixed window by its overlap.
+    """
+
+    limit: int
+    period: float
+    algorithm: Literal["token_bucket", "sliding_window"] = "token_bucket"
+
+    @property
+    def policy(self) -> str:
+        return f"{self.limit};w={self.period:g}"
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: float
+    retry_after: float
+
+
+@dataclass(slots=True)
+class _Lease:
+    tokens: int
+    size: int
+    remaining: int
+    reset_at: float
+    retry_at: float = 0.0
+
+
+class RateLimiter:
+    """
+    Distributed rate limiter running atomic Lua scripts on Redis.
+
+    To spare high-volume clients a round trip per request, each worker
+    leases tokens in batches and spends them locally for up to
+    ``lease_ttl`` seconds. A key starts with single tokens and doubles its
+    lease whenever it spends one before it expires, up to ``max_lease``
+    of its limit. A worker may thus admit up to a lease of requests the
+    other workers no longer could, and let unspent tokens expire; keep
+    ``max_lease`` small. Rejections are cached until the retry time, so a
+    throttled client does not reach Redis either.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "ratelimit:",
+        max_lease: float = 0.05,
+        lease_ttl: float = 1.0,
+        max_entries: int = 10_000,
+    ) -> None:
+        self._scripts = {
+            "token_bucket": redis.register_script(TOKEN_BUCKET),
+            "sliding_window": redis.register_script(SLIDING_WINDOW),
+        }
+        self.prefix = prefix
+        self.max_lease = max_lease
+        self.lease_ttl = lease_ttl
+        self._leases: LRUCache[str, _Lease] = LRUCache(max_entries=max_entries)
+
+    async def hit(self, key: str, rule: RateLimit) -> RateLimitDecision:
+        now = time.monotonic()
+        key = f"{self.prefix}{rule.algorithm}:{key}"
+        lease = self._leases.get(key)
+        if lease is not None and (lease.tokens > 0 or lease.retry_at > now):
+            RATE_LIMIT_CHECKS.labels(algorithm=rule.algorithm, source="local").inc()
+            if lease.tokens == 0:
+                return self._decision(rule, lease, now)
+            lease.tokens -= 1
+            return self._decision(rule, lease, now, allowed=True)
+
+        size = 1
+        if lease is not None:  # spent before it expired
+            size = min(lease.size * 2, max(1, math.floor(rule.limit * self.max_lease)))
+        RATE_LIMIT_CHECKS.labels(algorithm=rule.algorithm, source="redis").inc()
+        granted, remaining, retry_ms, reset_ms = await self._scripts[rule.algorithm](
+            keys=[key], args=[rule.limit, math.ceil(rule.period * 1000), size]
+        )
+        lease = _Lease(
+            tokens=max(0, granted - 1),
+            size=size,
+            remaining=remaining,
+            reset_at=now + reset_ms / 1000,
+            retry_at=now + min(retry_ms / 1000, self.lease_ttl) if not granted else 0,
+        )
+        self._leases.set(key, lease, ttl=min(self.lease_ttl, rule.period))
+        return self._decision(rule, lease, now, allowed=granted > 0, retry_ms=retry_ms)
+
+    def _decision(
+        self,
+        rule: RateLimit,
+        lease: _Lease,
+        now: float,
+        allowed: bool = False,
+        retry_ms: int | None = None,
+    ) -> RateLimitDecision:
+        retry_after = 0.0
+        if not allowed:
+            retry_after = (
+                retry_ms / 1000 if retry_ms is not None else lease.retry_at - now
+            )
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=rule.limit,
+            remaining=lease.remaining + lease.tokens,
+            reset=max(0.0, lease.reset_at - now),
+            retry_after=max(0.0, retry_after),
+        )
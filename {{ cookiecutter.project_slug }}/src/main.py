@@ -9,14 +9,20 @@ from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from infra import (
+    AsyncpgProvider,
     ConfigProvider,
+    HttpClientProvider,
     InteractorProvider,
     RepositoriesProvider,
     SqlalchemyProvider,
     configure_logging,
 )
+from infra.config import DbConfig
+from infra.db import warm_up
 from infra.ioc import RedisProvider
 from presentation import init_middlewares, init_routes
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = structlog.stdlib.get_logger()
 
@@ -31,18 +37,32 @@ logging.getLogger("uvicorn.access").addFilter(EndpointFilter())
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    yield
-    if hasattr(app.state, "container"):
-        await app.state.container.close()
+    container: AsyncContainer = app.state.dishka_container
+    try:
+        db_config = await container.get(DbConfig)
+        if db_config.pool_warmup:
+            # Open the first connections before traffic, not on first requests.
+            engine = await container.get(AsyncEngine)
+            try:
+                await warm_up(engine, min(db_config.pool_warmup, db_config.pool_size))
+            except (SQLAlchemyError, OSError):
+                # The pool connects on demand, don't refuse to start for it.
+                logger.warning("Database pool warm-up failed", exc_info=True)
+        yield
+    finally:
+        # Finalizes APP-scoped providers: Redis pool, SQLAlchemy engine, etc.
+        await container.close()
 
 
 def container_factory() -> AsyncContainer:
     return make_async_container(
         SqlalchemyProvider(),
+        AsyncpgProvider(),
         ConfigProvider(),
         RepositoriesProvider(),
         InteractorProvider(),
         RedisProvider(),
+        HttpClientProvider(),
     )
 
 
@@ -1,7 +1,20 @@
+from .concurrency import ConcurrencyLimitMiddleware, GradientLimit
+from .deadline import DeadlineMiddleware
+from .instrumentation import InstrumentationMiddleware
 from .prometheus import PrometheusMiddleware
+from .ratelimit import RateLimitMiddleware
+from .route_index import RouteIndex, init_route_index, resolve_route
 from .structlog import logging_middleware
 
 __all__ = (
+    "ConcurrencyLimitMiddleware",
+    "DeadlineMiddleware",
+    "GradientLimit",
+    "InstrumentationMiddleware",
     "logging_middleware",
     "PrometheusMiddleware",
+    "RateLimitMiddleware",
+    "RouteIndex",
+    "init_route_index",
+    "resolve_route",
 )
@@ -0,0 +1,201 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Iterable
+
+from presentation.api.v1.response import ErrorData, ErrorResponse, ORJSONResponse
+from presentation.api.v1.urls import Paths
+from prometheus_client import Counter, Gauge
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .route_index import resolve_route
+
+CONCURRENCY_LIMIT = Gauge(
+    "http_concurrency_limit",
+    "Current adaptive limit of requests processed concurrently.",
+)
+CONCURRENCY_IN_FLIGHT = Gauge(
+    "http_concurrency_in_flight",
+    "Gauge of requests holding a concurrency slot.",
+)
+QUEUE_DEPTH = Gauge(
+    "http_concurrency_queue_depth",
+    "Gauge of requests waiting for a concurrency slot by path.",
+    ["path"],
+)
+SHED_REQUESTS = Counter(
+    "http_shed_requests_total",
+    "Total count of requests rejected with 503 by path and reason "
+    "(queue_full, timeout).",
+    ["path", "reason"],
+)
+
+
+class GradientLimit:
+    """
+    Concurrency limit following the latency gradient.
+
+    A long-term average of request latency stands for the no-load latency.
+    While recent latency stays within ``tolerance`` times of it, the limit
+    grows by about its square root per sample, probing for capacity; once
+    latency rises above, the limit shrinks in proportion, down to half per
+    sample. ``smoothing`` damps both moves. The limit only grows while it is
+    actually used, so an idle service does not drift to ``max_limit``.
+    """
+
+    def __init__(
+        self,
+        initial: int = 20,
+        min_limit: int = 4,
+        max_limit: int = 500,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        short_window: int = 10,
+        long_window: int = 600,
+    ) -> None:
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+        self._short_rtt = 0.0
+        self._long_rtt = 0.0
+
+    def update(self, rtt: float, in_flight: int) -> float:
+        if not self._long_rtt:
+            self._short_rtt = self._long_rtt = rtt
+        else:
+            self._short_rtt += (rtt - self._short_rtt) * self._short_alpha
+            self._long_rtt += (rtt - self._long_rtt) * self._long_alpha
+        if self._long_rtt > 2 * self._short_rtt:
+            # Latency dropped for good, e.g. after a slow period: catch up.
+            self._long_rtt *= 0.95
+        if in_flight < self.limit / 2:
+            return self.limit
+        ratio = self.tolerance * self._long_rtt / max(self._short_rtt, 1e-9)
+        gradient = max(0.5, min(1.0, ratio))
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit * (1 - self.smoothing) + target * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+        return self.limit
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Sheds load once the adaptive concurrency limit is reached.
+
+    Requests beyond ``limit`` wait in a FIFO queue of their route template,
+    and queues are served in turn so one slow route cannot starve the others.
+    A request is rejected with 503 and ``Retry-After`` when its queue already
+    holds ``max_queue`` requests or it waited ``max_wait`` seconds, long
+    before a client or proxy timeout. Unknown paths and ``exempt`` routes,
+    e.g. health checks and metrics, are never queued nor shed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit: GradientLimit | None = None,
+        max_queue: int = 50,
+        max_wait: float = 1.0,
+        retry_after: int = 1,
+        exempt: Iterable[str] = (Paths.HEALTHCHECK, "/metrics"),
+    ) -> None:
+        self.app = app
+        self.limit = limit or GradientLimit()
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.retry_after = retry_after
+        self.exempt = frozenset(exempt)
+        self._in_flight = 0
+        self._waiting: dict[str, deque[asyncio.Future[None]]] = {}
+        CONCURRENCY_LIMIT.set_function(lambda: self.limit.limit)
+        CONCURRENCY_IN_FLIGHT.set_function(lambda: self._in_flight)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path, is_handled_path = resolve_route(scope)
+        if not is_handled_path or path in self.exempt:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self._acquire(path):
+            response = ORJSONResponse(
+                ErrorResponse(
+                    status=HTTP_503_SERVICE_UNAVAILABLE,
+                    error=ErrorData(title="Service is overloaded, retry later"),
+                ),
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._release(time.perf_counter() - started)
+
+    async def _acquire(self, path: str) -> bool:
+        if not self._waiting and self._in_flight < int(self.limit.limit):
+            self._in_flight += 1
+            return True
+        queue = self._waiting.get(path)
+        if queue is not None and len(queue) >= self.max_queue:
+            SHED_REQUESTS.labels(path=path, reason="queue_full").inc()
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._waiting.setdefault(path, deque())
+        queue.append(future)
+        QUEUE_DEPTH.labels(path=path).set(len(queue))
+        self._wake()  # the limit may have grown since the last release
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await future
+        except TimeoutError:
+            if future.cancelled():
+                SHED_REQUESTS.labels(path=path, reason="timeout").inc()
+                return False
+        except asyncio.CancelledError:
+            if not future.cancelled():  # granted a slot, then disconnected
+                self._release(None)
+            raise
+        finally:
+            if not future.done() or future.cancelled():
+                self._discard(path, future)
+        return True
+
+    def _discard(self, path: str, future: asyncio.Future[None]) -> None:
+        queue = self._waiting.get(path)
+        if queue is not None and future in queue:
+            queue.remove(future)
+            QUEUE_DEPTH.labels(path=path).set(len(queue))
+            if not queue:
+                del self._waiting[path]
+
+    def _release(self, rtt: float | None) -> None:
+        if rtt is not None:
+            self.limit.update(rtt, self._in_flight)
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiting and self._in_flight < int(self.limit.limit):
+            path, queue = next(iter(self._waiting.items()))
+            future = queue.popleft()
+            # Round robin: the route goes last, or away once drained.
+            del self._waiting[path]
+            if queue:
+                self._waiting[path] = queue
+            QUEUE_DEPTH.labels(path=path).set(len(queue))
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
@@ -0,0 +1,108 @@
+import asyncio
+import math
+from typing import Iterable, Mapping
+
+from infra import deadline
+from presentation.api.v1.response import ErrorData, ErrorResponse, ORJSONResponse
+from prometheus_client import Counter
+from starlette.datastructures import Headers
+from starlette.status import HTTP_504_GATEWAY_TIMEOUT
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .route_index import resolve_route
+
+DEADLINE_EXCEEDED = Counter(
+    "http_deadline_exceeded_total",
+    "Total count of requests cancelled at their deadline by path.",
+    ["path"],
+)
+
+
+class DeadlineMiddleware:
+    """
+    Gives every request a deadline and cancels it once the deadline passes.
+
+    The time budget is the route's entry in ``routes``, else ``default``,
+    shortened by the client's ``X-Request-Timeout`` header (in seconds) if
+    it asks for less. It is stored in a contextvar (``infra.deadline``) so
+    Postgres statements, Redis commands and outbound HTTP calls give up at
+    the same time. A request missing its deadline is answered with 504,
+    unless its response had already started.
+
+    The deadline covers the handler only: once a streamed response (one
+    without ``Content-Length``) has started, e.g. an ``ExportResponse``,
+    its body is sent for as long as it takes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default: float | None = 30.0,
+        routes: Mapping[str, float | None] | None = None,
+        exempt: Iterable[str] = ("/metrics",),
+    ) -> None:
+        self.app = app
+        self.default = default
+        self.routes = dict(routes or {})
+        self.exempt = frozenset(exempt)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path, _ = resolve_route(scope)
+        timeout = self._timeout(scope, path)
+        if timeout is None or path in self.exempt:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        with deadline.deadline(timeout) as at:
+            cancel_scope = asyncio.timeout_at(at)
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal response_started
+                if message["type"] == "http.response.start":
+                    response_started = True
+                    if not _has_length(message):
+                        # The body is streamed from here on, in this context.
+                        cancel_scope.reschedule(None)
+                        deadline.lift()
+                await send(message)
+
+            try:
+                async with cancel_scope:
+                    await self.app(scope, receive, send_wrapper)
+            except TimeoutError:
+                if not cancel_scope.expired():
+                    raise  # a timeout of the handler's own
+                DEADLINE_EXCEEDED.labels(path=path).inc()
+                if response_started:
+                    raise
+                response = ORJSONResponse(
+                    ErrorResponse(
+                        status=HTTP_504_GATEWAY_TIMEOUT,
+                        error=ErrorData(title="Request deadline exceeded"),
+                    ),
+                    status_code=HTTP_504_GATEWAY_TIMEOUT,
+                )
+                await response(scope, receive, send)
+
+    def _timeout(self, scope: Scope, path: str) -> float | None:
+        timeout = self.routes.get(path, self.default)
+        requested = Headers(scope=scope).get(deadline.HEADER)
+        if requested is None:
+            return timeout
+        try:
+            seconds = float(requested)
+        except ValueError:
+            return timeout
+        if not math.isfinite(seconds) or seconds <= 0:
+            return timeout
+        return seconds if timeout is None else min(seconds, timeout)
+
+
+def _has_length(message: Message) -> bool:
+    headers = message.get("headers", ())
+    return any(name.lower() == b"content-length" for name, _ in headers)
@@ -0,0 +1,113 @@
+import time
+
+import structlog
+from infra.db.instrumentation import track_queries
+from opentelemetry import trace
+from starlette.datastructures import Headers
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .prometheus import (
+    EXCEPTIONS,
+    INFO,
+    REQUESTS,
+    REQUESTS_IN_PROGRESS,
+    REQUESTS_PROCESSING_TIME,
+    RESPONSES,
+)
+from .route_index import resolve_route
+
+
+class InstrumentationMiddleware:
+    """
+    Pure ASGI replacement for ``logging_middleware`` and ``PrometheusMiddleware``.
+
+    Binds the request id, records the Prometheus series, counts the SQL
+    statements per route and writes the access log in a single pass. Only
+    the ``http.response.start`` message is inspected, so response bodies are
+    streamed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, app_name: str = "fastapi-app") -> None:
+        self.app = app
+        self.app_name = app_name
+        INFO.labels(app_name=self.app_name).inc()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        req_id = Headers(scope=scope).get("request-id")
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id=req_id)
+
+        method = scope["method"]
+        path, is_handled_path = resolve_route(scope)
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        if is_handled_path:
+            REQUESTS_IN_PROGRESS.labels(
+                method=method, path=path, app_name=self.app_name
+            ).inc()
+            REQUESTS.labels(method=method, path=path, app_name=self.app_name).inc()
+
+        before_time = time.perf_counter()
+        try:
+            with track_queries(path if is_handled_path else None):
+                await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            status_code = HTTP_500_INTERNAL_SERVER_ERROR
+            if is_handled_path:
+                EXCEPTIONS.labels(
+                    method=method,
+                    path=path,
+                    exception_type=type(e).__name__,
+                    app_name=self.app_name,
+                ).inc()
+            raise
+        else:
+            if is_handled_path:
+                self._observe_duration(method, path, time.perf_counter() - before_time)
+        finally:
+            response_time = time.perf_counter() - before_time
+            if is_handled_path:
+                RESPONSES.labels(
+                    method=method,
+                    path=path,
+                    status_code=status_code,
+                    app_name=self.app_name,
+                ).inc()
+                REQUESTS_IN_PROGRESS.labels(
+                    method=method, path=path, app_name=self.app_name
+                ).dec()
+
+            await structlog.get_logger().info(
+                "Request processed",
+                request_id=req_id,
+                method=method,
+                path=scope["path"],
+                route=path,
+                status_code=status_code,
+                response_time=response_time,
+            )
+
+    def _observe_duration(self, method: str, path: str, duration: float) -> None:
+        histogram = REQUESTS_PROCESSING_TIME.labels(
+            method=method, path=path, app_name=self.app_name
+        )
+        # retrieve trace id for exemplar
+        span_context = trace.get_current_span().get_span_context()
+        if not span_context.is_valid:
+            histogram.observe(duration)
+            return
+        histogram.observe(
+            duration,
+            exemplar={"TraceID": trace.format_trace_id(span_context.trace_id)},
+        )
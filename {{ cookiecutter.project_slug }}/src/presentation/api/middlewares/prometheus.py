@@ -4,18 +4,21 @@ from typing import Tuple
 from environs import Env
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.semconv.trace import SpanAttributes
 from prometheus_client import Counter, Gauge, Histogram
+from starlette.applications import Starlette
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.routing import Match
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Scope
+
+from .route_index import resolve_route
 
 INFO = Gauge("fastapi_app_info", "FastAPI application information.", ["app_name"])
 REQUESTS = Counter(
@@ -101,16 +104,19 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
     @staticmethod
     def get_path(request: Request) -> Tuple[str, bool]:
-        for route in request.app.routes:
-            match, child_scope = route.matches(request.scope)
-            if match == Match.FULL:
-                return route.path, True
+        return resolve_route(request.scope)
+
 
-        return request.url.path, False
+def route_span_details(scope: Scope) -> Tuple[str, dict[str, str]]:
+    method = scope.get("method", "")
+    path, is_handled_path = resolve_route(scope)
+    if not is_handled_path:
+        return method, {}
+    return f"{method} {path}".strip(), {SpanAttributes.HTTP_ROUTE: path}
 
 
 def setting_otlp(
-    app: ASGIApp, app_name: str, endpoint: str, log_correlation: bool = True
+    app: Starlette, app_name: str, endpoint: str, log_correlation: bool = True
 ) -> None:
     env = Env()
     env.read_env()
@@ -133,4 +139,8 @@ def setting_otlp(
     if log_correlation:
         LoggingInstrumentor().instrument(set_logging_format=True)
 
-    FastAPIInstrumentor.instrument_app(app, tracer_provider=tracer)
+    app.add_middleware(
+        OpenTelemetryMiddleware,
+        default_span_details=route_span_details,
+        tracer_provider=tracer,
+    )
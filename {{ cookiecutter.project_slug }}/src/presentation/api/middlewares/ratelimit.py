@@ -0,0 +1,120 @@
+import hashlib
+import logging
+import math
+from typing import Iterable, Mapping
+
+from dishka import AsyncContainer
+from infra.redis.ratelimit import RateLimit, RateLimitDecision, RateLimiter
+from presentation.api.v1.response import ErrorData, ErrorResponse, ORJSONResponse
+from presentation.api.v1.urls import Paths
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .route_index import resolve_route
+
+RATE_LIMITED = Counter(
+    "http_rate_limited_total",
+    "Total count of requests rejected with 429 by path and client kind.",
+    ["path", "client"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitMiddleware:
+    """
+    Per-client quotas shared by every worker through Redis.
+
+    Clients are told apart by the ``api_key_header`` (hashed, never stored
+    as is) or else by IP, and counted separately per route template, under
+    ``routes[template]`` or the ``default`` rule. Responses carry the
+    ``RateLimit-Policy``/``RateLimit-Limit``/``RateLimit-Remaining``/
+    ``RateLimit-Reset`` headers, and rejections a 429 with ``Retry-After``.
+    If Redis fails, requests are let through: the limiter must not turn a
+    Redis outage into an API outage.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default: RateLimit | None = None,
+        routes: Mapping[str, RateLimit] | None = None,
+        limiter: RateLimiter | None = None,
+        api_key_header: str = "x-api-key",
+        exempt: Iterable[str] = (Paths.HEALTHCHECK, "/metrics"),
+    ) -> None:
+        self.app = app
+        self.default = default
+        self.routes = dict(routes or {})
+        self.limiter = limiter
+        self.api_key_header = api_key_header
+        self.exempt = frozenset(exempt)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path, is_handled_path = resolve_route(scope)
+        rule = self.routes.get(path, self.default)
+        if not is_handled_path or rule is None or path in self.exempt:
+            await self.app(scope, receive, send)
+            return
+
+        client, identity = self._identify(scope)
+        try:
+            limiter = self.limiter or await self._build_limiter(scope)
+            decision = await limiter.hit(f"{path}:{identity}", rule)
+        except RedisError:
+            logger.warning("Rate limit check failed, letting through", exc_info=True)
+            await self.app(scope, receive, send)
+            return
+
+        headers = _headers(rule, decision)
+        if not decision.allowed:
+            RATE_LIMITED.labels(path=path, client=client).inc()
+            headers["Retry-After"] = str(math.ceil(decision.retry_after))
+            response = ORJSONResponse(
+                ErrorResponse(
+                    status=HTTP_429_TOO_MANY_REQUESTS,
+                    error=ErrorData(title="Too many requests, retry later"),
+                ),
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                headers=headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _identify(self, scope: Scope) -> tuple[str, str]:
+        api_key = Headers(scope=scope).get(self.api_key_header)
+        if api_key:
+            digest = hashlib.blake2b(api_key.encode(), digest_size=12).hexdigest()
+            return "api_key", f"key:{digest}"
+        client = scope.get("client")
+        return "ip", f"ip:{client[0] if client else 'unknown'}"
+
+    async def _build_limiter(self, scope: Scope) -> RateLimiter:
+        # Middlewares are built before the container, so Redis is resolved
+        # on the first request.
+        container: AsyncContainer = scope["app"].state.dishka_container
+        self.limiter = RateLimiter(await container.get(Redis))
+        return self.limiter
+
+
+def _headers(rule: RateLimit, decision: RateLimitDecision) -> dict[str, str]:
+    return {
+        "RateLimit-Policy": rule.policy,
+        "RateLimit-Limit": str(decision.limit),
+        "RateLimit-Remaining": str(decision.remaining),
+        "RateLimit-Reset": str(math.ceil(decision.reset)),
+    }
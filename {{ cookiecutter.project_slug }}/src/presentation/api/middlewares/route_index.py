@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from starlette.applications import Starlette
+from starlette.routing import BaseRoute, Match, Mount
+from starlette.types import Scope
+
+ROUTE_TEMPLATE_SCOPE_KEY = "route_template"
+
+
+@dataclass(slots=True)
+class _Node:
+    static: dict[str, "_Node"] = field(default_factory=dict)
+    param: "_Node | None" = None
+    routes: list[tuple[int, BaseRoute]] = field(default_factory=list)
+    catch_all: list[tuple[int, BaseRoute]] = field(default_factory=list)
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def _route_path(scope: Scope) -> str:
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path) :] or "/"
+    return path
+
+
+class RouteIndex:
+    """
+    Compiled lookup from a request path to its route template.
+
+    Static paths are resolved through a hash map, parameterised paths through a
+    prefix tree keyed by path segments, and the last ``cache_size`` results are
+    kept in an LRU. Routes the tree cannot describe (e.g. ``Host``) are matched
+    linearly as a fallback. The HTTP method is not considered, so a 405 is
+    labelled with the template of the path it hit.
+    """
+
+    def __init__(self, routes: Sequence[BaseRoute], cache_size: int = 4096) -> None:
+        self._static: dict[str, tuple[int, BaseRoute]] = {}
+        self._root = _Node()
+        self._fallback: list[tuple[int, BaseRoute]] = []
+        for position, route in enumerate(routes):
+            self._add(position, route)
+        self._lookup = lru_cache(maxsize=cache_size)(self._resolve_path)
+
+    def resolve(self, scope: Scope) -> Tuple[str, bool]:
+        path = _route_path(scope)
+        template, is_handled_path = self._lookup(path)
+        if is_handled_path or not self._fallback:
+            return template, is_handled_path
+
+        for _, route in self._fallback:
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                return getattr(route, "path", path), True
+        return path, False
+
+    def _add(self, position: int, route: BaseRoute) -> None:
+        template: str | None = getattr(route, "path", None)
+        if template is None or not hasattr(route, "path_regex"):
+            self._fallback.append((position, route))
+            return
+
+        if "{" not in template and not isinstance(route, Mount):
+            self._static.setdefault(template, (position, route))
+            return
+
+        node = self._root
+        for segment in _segments(template):
+            if segment.endswith(":path}"):
+                node.catch_all.append((position, route))
+                return
+            if "{" in segment:
+                node.param = node.param or _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        if isinstance(route, Mount):
+            node.catch_all.append((position, route))
+        else:
+            node.routes.append((position, route))
+
+    def _resolve_path(self, path: str) -> Tuple[str, bool]:
+        candidates: list[tuple[int, BaseRoute]] = []
+        if (static := self._static.get(path)) is not None:
+            candidates.append(static)
+        self._collect(self._root, _segments(path), 0, candidates)
+
+        for _, route in sorted(candidates, key=lambda candidate: candidate[0]):
+            if route.path_regex.match(path):  # type: ignore[attr-defined]
+                return route.path, True  # type: ignore[attr-defined]
+        return path, False
+
+    def _collect(
+        self,
+        node: _Node,
+        segments: list[str],
+        depth: int,
+        candidates: list[tuple[int, BaseRoute]],
+    ) -> None:
+        candidates.extend(node.catch_all)
+        if depth == len(segments):
+            candidates.extend(node.routes)
+            return
+        if (child := node.static.get(segments[depth])) is not None:
+            self._collect(child, segments, depth + 1, candidates)
+        if node.param is not None:
+            self._collect(node.param, segments, depth + 1, candidates)
+
+
+def init_route_index(app: Starlette, cache_size: int = 4096) -> RouteIndex:
+    """Compile the route index for ``app`` once all routes are registered."""
+    index = RouteIndex(app.routes, cache_size=cache_size)
+    app.state.route_index = index
+    return index
+
+
+def resolve_route(scope: Scope) -> Tuple[str, bool]:
+    """
+    Return ``(route template, is handled path)`` for the current request.
+
+    The result is memoized in the ASGI scope, so the instrumentation, logging
+    and tracing layers share a single lookup per request.
+    """
+    resolved: Tuple[str, bool] | None = scope.get(ROUTE_TEMPLATE_SCOPE_KEY)
+    if resolved is not None:
+        return resolved
+
+    app: Starlette = scope["app"]
+    index: RouteIndex | None = getattr(app.state, "route_index", None)
+    if index is None:
+        index = init_route_index(app)
+    resolved = index.resolve(scope)
+    scope[ROUTE_TEMPLATE_SCOPE_KEY] = resolved
+    return resolved
@@ -4,6 +4,8 @@ from collections.abc import Awaitable, Callable
 import structlog
 from fastapi import Request, Response
 
+from .route_index import resolve_route
+
 
 async def logging_middleware(
     request: Request,
@@ -18,6 +20,7 @@ async def logging_middleware(
 
     start_time = time.time()
 
+    route, _ = resolve_route(request.scope)
     response: Response = await call_next(request)
 
     end_time = time.time()
@@ -28,6 +31,7 @@ async def logging_middleware(
         request_id=req_id,
         method=request.method,
         path=request.url.path,
+        route=route,
         status_code=response.status_code,
         response_time=response_time,
     )
@@ -8,14 +8,19 @@ from typing import Any, Callable, Generator
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, status
+from infra import deadline
 from redis.asyncio import Redis
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..response import OkResponse
+from ..response import OkResponse, ResponseRoute
 from ..urls import Paths
 
-healthcheck_router = APIRouter()
+healthcheck_router = APIRouter(route_class=ResponseRoute)
+
+# Checks give up this long before the request deadline, leaving time to
+# report them as unhealthy instead of failing the whole request.
+CHECK_RESERVE = 0.5
 
 
 @contextmanager
@@ -28,7 +33,8 @@ async def check_db_health(session: AsyncSession) -> dict[str, Any]:
     stmt = select(text("1"))
     with measure_time() as get_time_taken:
         try:
-            await asyncio.wait_for(session.execute(stmt), timeout=2.0)
+            async with deadline.timeout(reserve=CHECK_RESERVE):
+                await session.execute(stmt)
             service_status = "Healthy"
         except Exception as ex:
             logging.error(f"Database health check failed: {ex}")
@@ -45,7 +51,8 @@ async def check_db_health(session: AsyncSession) -> dict[str, Any]:
 async def check_redis_health(r_client: Redis) -> dict[str, Any]:
     with measure_time() as get_time_taken:
         try:
-            await asyncio.wait_for(r_client.ping(), timeout=2.0)
+            async with deadline.timeout(reserve=CHECK_RESERVE):
+                await r_client.ping()
             service_status = "Healthy"
         except Exception as ex:
             logging.error(f"Redis health check failed: {ex}")
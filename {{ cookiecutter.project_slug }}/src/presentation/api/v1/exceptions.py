@@ -2,15 +2,19 @@ import logging
 from functools import partial
 from typing import Awaitable, Callable
 
+from application.common.exceptions import InvalidCursorError
 from domain.common import AppError
 from fastapi import FastAPI, Request, status
-from fastapi.responses import ORJSONResponse
-from presentation.api.v1.response import ErrorData, ErrorResponse
+from presentation.api.v1.request import InvalidBodyError, PayloadTooLargeError
+from presentation.api.v1.response import ErrorData, ErrorResponse, ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 ex_mappers = {
     AppError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    InvalidCursorError: status.HTTP_400_BAD_REQUEST,
+    InvalidBodyError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    PayloadTooLargeError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
 }
 
 
@@ -0,0 +1,17 @@
+from .base import BulkRequest, Request
+from .exceptions import InvalidBodyError, PayloadTooLargeError
+from .msgpack import MsgPackRequest, is_msgpack, unpackb
+from .route import RequestRoute, decode_body, read_body
+
+__all__ = (
+    "BulkRequest",
+    "InvalidBodyError",
+    "MsgPackRequest",
+    "PayloadTooLargeError",
+    "Request",
+    "RequestRoute",
+    "decode_body",
+    "is_msgpack",
+    "read_body",
+    "unpackb",
+)
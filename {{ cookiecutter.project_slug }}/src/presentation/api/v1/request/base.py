@@ -0,0 +1,26 @@
+from typing import ClassVar, Iterator
+
+from pydantic import BaseModel, RootModel
+
+
+class Request(BaseModel):
+    """
+    Base for request bodies decoded by ``RequestRoute``.
+
+    Bodies over ``max_body_size`` bytes are rejected with 413; override it
+    on subclasses that expect more.
+    """
+
+    max_body_size: ClassVar[int] = 1024 * 1024
+
+
+class BulkRequest[TItem](RootModel[list[TItem]], Request):
+    """A JSON array of items, e.g. ``BulkRequest[ItemIn]``."""
+
+    max_body_size: ClassVar[int] = 32 * 1024 * 1024
+
+    def __iter__(self) -> Iterator[TItem]:  # type: ignore[override]
+        return iter(self.root)
+
+    def __len__(self) -> int:
+        return len(self.root)
@@ -0,0 +1,23 @@
+import dataclasses
+from typing import Any, Mapping, Sequence
+
+from domain.common import AppError
+
+
+@dataclasses.dataclass(eq=False)
+class PayloadTooLargeError(AppError):
+    limit: int
+
+    @property
+    def title(self) -> str:
+        return f"The request body exceeds {self.limit} bytes"
+
+
+@dataclasses.dataclass(eq=False)
+class InvalidBodyError(AppError):
+    count: int
+    errors: Sequence[Mapping[str, Any]]
+
+    @property
+    def title(self) -> str:
+        return "The request body is invalid"
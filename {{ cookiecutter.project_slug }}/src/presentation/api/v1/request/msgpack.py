@@ -0,0 +1,43 @@
+from typing import Any
+
+import msgpack
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from ..response.msgpack import MSGPACK_TYPES
+
+
+def unpackb(body: bytes) -> Any:
+    return msgpack.unpackb(body, strict_map_key=False)
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in MSGPACK_TYPES
+
+
+class MsgPackRequest(Request):
+    """
+    Request with a MessagePack body, read by FastAPI as if it were JSON.
+
+    FastAPI only parses bodies sent as JSON, so the request reports
+    ``Content-Type: application/json`` and ``json()`` unpacks the body.
+    """
+
+    @property
+    def headers(self) -> Headers:
+        if not hasattr(self, "_headers"):
+            raw = [
+                (name, value)
+                for name, value in self.scope["headers"]
+                if name != b"content-type"
+            ]
+            raw.append((b"content-type", b"application/json"))
+            self._headers = Headers(raw=raw)
+        return self._headers
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = unpackb(await self.body())
+        return self._json
@@ -0,0 +1,160 @@
+import functools
+import inspect
+from typing import Annotated, Any, Awaitable, Callable, Coroutine
+
+import pydantic
+from fastapi import Depends
+from starlette.datastructures import Headers
+from starlette.requests import Request as HTTPRequest
+from starlette.responses import Response
+
+from ..response import ResponseRoute
+from .base import Request
+from .exceptions import InvalidBodyError, PayloadTooLargeError
+from .msgpack import MsgPackRequest, is_msgpack, unpackb
+
+# Errors reported back, a bulk body can fail on every one of its items.
+MAX_ERRORS = 20
+
+
+async def read_body(request: HTTPRequest, limit: int) -> bytes:
+    """Read the request body, giving up as soon as it exceeds ``limit`` bytes."""
+    length = request.headers.get("content-length")
+    if length is not None and length.isdigit() and int(length) > limit:
+        raise PayloadTooLargeError(limit=limit)
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise PayloadTooLargeError(limit=limit)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _unpack(body: bytes) -> Any:
+    try:
+        return unpackb(body)
+    except (ValueError, TypeError) as e:
+        raise InvalidBodyError(
+            count=1, errors=[{"type": "msgpack_invalid", "msg": str(e)}]
+        ) from e
+
+
+async def decode_body[TRequest: Request](
+    request: HTTPRequest, model: type[TRequest]
+) -> TRequest:
+    """
+    Validate the raw body straight into ``model``, in a single pass.
+
+    JSON is parsed by pydantic-core while validating, with no intermediate
+    Python objects; MessagePack bodies are unpacked first.
+    """
+    body = await read_body(request, model.max_body_size)
+    try:
+        # The scope still holds the Content-Type the client sent.
+        if is_msgpack(Headers(scope=request.scope).get("content-type")):
+            return model.model_validate(_unpack(body))
+        return model.model_validate_json(body)
+    except pydantic.ValidationError as e:
+        raise InvalidBodyError(
+            count=e.error_count(),
+            errors=e.errors(include_url=False, include_input=False)[:MAX_ERRORS],
+        ) from e
+
+
+def _body_of(model: type[Request]) -> Callable[[HTTPRequest], Awaitable[Request]]:
+    async def body(request: HTTPRequest) -> Request:
+        return await decode_body(request, model)
+
+    return body
+
+
+class RequestRoute(ResponseRoute):
+    """
+    ``ResponseRoute`` that also decodes ``Request`` bodies in one pass.
+
+    FastAPI parses a JSON body into Python objects, then validates them
+    into the model. Handler parameters annotated with a ``Request``
+    subclass are instead read as bytes, up to the model's
+    ``max_body_size``, and validated by ``model_validate_json``. Errors are
+    answered as ``ErrorResponse``: 413 for oversized bodies, 422 for
+    invalid ones. Bodies may also be sent as MessagePack, for any model.
+
+    Usage::
+
+        router = APIRouter(route_class=RequestRoute)
+
+        @router.post("/items")
+        async def ingest(items: BulkRequest[ItemIn]) -> OkResponse[int]: ...
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        endpoint, model = _decode_bodies(endpoint)
+        if model is not None:
+            kwargs["openapi_extra"] = {
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {"schema": model.model_json_schema()}
+                    },
+                },
+                **(kwargs.get("openapi_extra") or {}),
+            }
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[HTTPRequest], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: HTTPRequest) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                request = MsgPackRequest(request.scope, request.receive)
+            return await handler(request)
+
+        return route_handler
+
+
+def _decode_bodies(
+    endpoint: Callable[..., Any],
+) -> tuple[Callable[..., Any], type[Request] | None]:
+    signature = inspect.signature(endpoint)
+    bodies = [
+        param
+        for param in signature.parameters.values()
+        if isinstance(param.annotation, type) and issubclass(param.annotation, Request)
+    ]
+    if len(bodies) != 1:
+        # Several bodies are embedded by name, leave those to FastAPI.
+        return endpoint, None
+
+    (body,) = bodies
+    model = body.annotation
+    parameters = [
+        (
+            param.replace(annotation=Annotated[model, Depends(_body_of(model))])
+            if param is body
+            else param
+        )
+        for param in signature.parameters.values()
+    ]
+
+    # A copy of the endpoint, so its own signature is left untouched.
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await endpoint(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return endpoint(*args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=parameters
+    )
+    return wrapper, model
@@ -1,8 +1,22 @@
-from .base import ErrorData, ErrorResponse, OkResponse, Response
+from .base import ErrorData, ErrorResponse, OkResponse, PageResponse, Response
+from .export import CSV, NDJSON, ExportResponse, accepts_gzip
+from .msgpack import MSGPACK, MsgPackResponse, accepts_msgpack
+from .orjson import ORJSONResponse
+from .route import ResponseRoute
 
 __all__ = (
+    "CSV",
     "ErrorResponse",
     "ErrorData",
+    "ExportResponse",
+    "MSGPACK",
+    "MsgPackResponse",
+    "NDJSON",
+    "ORJSONResponse",
     "OkResponse",
+    "PageResponse",
     "Response",
+    "ResponseRoute",
+    "accepts_gzip",
+    "accepts_msgpack",
 )
@@ -12,6 +12,12 @@ class OkResponse[TResult](Response):
     result: TResult | None = None
 
 
+@dataclass(frozen=True)
+class PageResponse[TResult](OkResponse[list[TResult]]):
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
 @dataclass(frozen=True)
 class ErrorData[TError]:
     title: str = "Unknown error occurred"
@@ -0,0 +1,84 @@
+import zlib
+from typing import AsyncIterator, Mapping
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.types import Send
+
+from .msgpack import _media_range
+
+CSV = "text/csv; charset=utf-8"
+NDJSON = "application/x-ndjson"
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether the ``Accept-Encoding`` of ``request`` allows gzip, by name or ``*``."""
+    accept = request.headers.get("accept-encoding", "")
+    gzip_q = any_q = None
+    # Codings take a quality like media ranges do.
+    for coding, quality in map(_media_range, accept.split(",")):
+        if coding == "gzip":
+            gzip_q = quality
+        elif coding == "*":
+            any_q = quality
+    accepted = gzip_q if gzip_q is not None else any_q
+    return accepted is not None and accepted > 0
+
+
+async def gzip_stream(
+    chunks: AsyncIterator[bytes], level: int = 6
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, wbits=31)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+class ExportResponse(StreamingResponse):
+    """
+    Streaming response for exports from ``infra.db.export``.
+
+    Chunks are pulled from ``content`` only once the previous one was sent,
+    so a slow client slows the export down instead of filling memory. When
+    the client goes away the iterators are closed, which stops the query.
+
+    Usage::
+
+        return ExportResponse(
+            copy_csv(session, select(User.id, User.email)),
+            media_type=CSV,
+            filename="users.csv",
+            gzip=accepts_gzip(request),
+        )
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        media_type: str,
+        filename: str | None = None,
+        gzip: bool = False,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        headers = dict(headers or {})
+        if filename is not None:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        headers["Vary"] = "Accept-Encoding"
+        self._source = content
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+            content = gzip_stream(content)
+        super().__init__(content, status_code, headers, media_type)
+
+    async def stream_response(self, send: Send) -> None:
+        try:
+            await super().stream_response(send)
+        finally:
+            # Runs on disconnects too, where the task is being cancelled.
+            with anyio.CancelScope(shield=True):
+                for iterator in (self.body_iterator, self._source):
+                    if aclose := getattr(iterator, "aclose", None):
+                        await aclose()
@@ -0,0 +1,78 @@
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+import msgpack
+import pydantic
+from starlette.responses import Response
+
+from .serializer import Encoder, cache_by_type, encoder_for
+
+MSGPACK = "application/msgpack"
+MSGPACK_TYPES = frozenset((MSGPACK, "application/x-msgpack", "application/vnd.msgpack"))
+
+
+@cache_by_type
+def _encoder_for(cls: type) -> Encoder:
+    # Same output as the JSON serializer, for types orjson handles itself.
+    if is_dataclass(cls):
+        names = tuple(field.name for field in fields(cls))
+        return lambda obj: {name: getattr(obj, name) for name in names}
+    if issubclass(cls, pydantic.BaseModel):
+        to_python = cls.__pydantic_serializer__.to_python
+        return lambda obj: to_python(obj, mode="json")
+    if issubclass(cls, (date, datetime, time)):
+        return lambda obj: obj.isoformat()
+    if issubclass(cls, Enum):
+        return lambda obj: obj.value
+    return encoder_for(cls)
+
+
+def _default(obj: Any) -> Any:
+    return _encoder_for(type(obj))(obj)
+
+
+def packb(content: Any) -> bytes:
+    packed: bytes = msgpack.packb(content, default=_default, datetime=False)
+    return packed
+
+
+def _media_range(item: str) -> tuple[str, float]:
+    media_type, *params = (part.strip() for part in item.split(";"))
+    quality = 1.0
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+    return media_type.lower(), quality
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+    """
+    Whether ``accept`` asks for MessagePack.
+
+    It has to be named explicitly, so JSON stays the default for ``*/*`` or
+    no ``Accept`` header, and wins if given a higher quality.
+    """
+    if not accept or "msgpack" not in accept:
+        return False
+    msgpack_q = json_q = 0.0
+    for media_type, quality in map(_media_range, accept.split(",")):
+        if media_type in MSGPACK_TYPES:
+            msgpack_q = max(msgpack_q, quality)
+        elif media_type == "application/json":
+            json_q = max(json_q, quality)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class MsgPackResponse(Response):
+    """``ORJSONResponse`` counterpart, rendering the same content as MessagePack."""
+
+    media_type = MSGPACK
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
@@ -0,0 +1,80 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .base import ErrorResponse, OkResponse
+from .msgpack import MsgPackResponse, accepts_msgpack
+from .orjson import ORJSONResponse
+
+# Response class picked for the current request from its Accept header.
+_response_class: ContextVar[type[Response]] = ContextVar(
+    "response_class", default=ORJSONResponse
+)
+
+
+class ResponseRoute(APIRoute):
+    """
+    Route rendering ``OkResponse``/``ErrorResponse`` results with orjson.
+
+    FastAPI validates a handler's result against the response model and
+    encodes it to Python primitives before rendering it. Results of the
+    known response types skip both steps: they are passed to
+    ``ORJSONResponse`` as is, with the route's ``status_code`` (else their
+    own ``status``). The response model still documents the route. Headers
+    set on an injected ``fastapi.Response`` are not applied to these
+    results, and ``response_model_exclude_*`` options are ignored.
+
+    Clients naming ``application/msgpack`` in ``Accept`` get these results
+    as MessagePack instead.
+
+    Usage::
+
+        router = APIRouter(route_class=ResponseRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(
+            path, _render_known(endpoint, kwargs.get("status_code")), **kwargs
+        )
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response_class = (
+                MsgPackResponse
+                if accepts_msgpack(request.headers.get("accept"))
+                else ORJSONResponse
+            )
+            token = _response_class.set(response_class)
+            try:
+                return await handler(request)
+            finally:
+                _response_class.reset(token)
+
+        return route_handler
+
+
+def _render_known(
+    endpoint: Callable[..., Any], status_code: int | None
+) -> Callable[..., Any]:
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, (OkResponse, ErrorResponse)):
+            return _response_class.get()(
+                result,
+                status_code=status_code or result.status,
+                headers={"Vary": "Accept"},
+            )
+        return result
+
+    return wrapper
@@ -0,0 +1,75 @@
+import logging
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable
+from uuid import UUID
+
+import orjson
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+Encoder = Callable[[Any], Any]
+
+
+def _exception(obj: Exception) -> str:
+    text = obj.args[0] if len(obj.args) > 0 else "Unknown error"
+    return f"{obj.__class__.__name__}: {text}"
+
+
+def _model(cls: type[pydantic.BaseModel]) -> Encoder:
+    # JSON straight from pydantic-core, embedded as is by orjson.
+    to_json = cls.__pydantic_serializer__.to_json
+    return lambda obj: orjson.Fragment(to_json(obj))
+
+
+# orjson handles UUID itself, but not its subclasses such as ``uuid6.UUID``.
+_ENCODERS: dict[type, Encoder] = {
+    Exception: _exception,
+    UUID: str,
+    Decimal: str,
+    set: list,
+    frozenset: list,
+}
+
+
+def cache_by_type(find: Callable[[type], Encoder]) -> Callable[[type], Encoder]:
+    """Memoize ``find`` per class, in a dict keyed by the class itself."""
+    encoders: dict[type, Encoder] = {}
+
+    @wraps(find)
+    def lookup(cls: type) -> Encoder:
+        try:
+            return encoders[cls]
+        except KeyError:
+            encoder = encoders[cls] = find(cls)
+            return encoder
+
+    return lookup
+
+
+@cache_by_type
+def encoder_for(cls: type) -> Encoder:
+    """
+    Encoder for values of ``cls`` that orjson can't serialize natively.
+
+    Looked up once per type along the MRO; an unknown type is warned about
+    on its first value and then encoded with ``repr``.
+    """
+    if issubclass(cls, pydantic.BaseModel):
+        return _model(cls)
+    for base in cls.__mro__:
+        if base in _ENCODERS:
+            return _ENCODERS[base]
+    logger.warning("Type is not JSON serializable: %s", cls)
+    return repr
+
+
+def default(obj: Any) -> Any:
+    return encoder_for(type(obj))(obj)
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=OPTIONS, default=default)
@@ -1,18 +1,33 @@
 from fastapi import FastAPI
+from infra.redis import RateLimit
 from presentation.api import (
     healthcheck_router,
     metrics_handler,
     setup_exception_handlers,
 )
-from presentation.api.middlewares import logging_middleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from presentation.api.middlewares import (
+    ConcurrencyLimitMiddleware,
+    DeadlineMiddleware,
+    InstrumentationMiddleware,
+    RateLimitMiddleware,
+    init_route_index,
+)
+from presentation.api.v1.urls import Paths
 from starlette.middleware.cors import CORSMiddleware
 
 
 def init_middlewares(app: FastAPI) -> None:
+    # Inside the instrumentation, so shed requests are counted and logged.
+    app.add_middleware(ConcurrencyLimitMiddleware)
+    # Throttled clients are turned away before they take a concurrency slot.
+    app.add_middleware(RateLimitMiddleware, default=RateLimit(limit=100, period=1.0))
+    # Outermost of the three, so time spent queued counts against the deadline.
+    app.add_middleware(
+        DeadlineMiddleware, default=30.0, routes={Paths.HEALTHCHECK: 2.5}
+    )
     app.add_middleware(
-        BaseHTTPMiddleware,
-        dispatch=logging_middleware,
+        InstrumentationMiddleware,
+        app_name=app.title,
     )
     app.add_middleware(
         CORSMiddleware,
@@ -20,7 +35,14 @@ def init_middlewares(app: FastAPI) -> None:
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["Content-Disposition"],
+        expose_headers=[
+            "Content-Disposition",
+            "Retry-After",
+            "RateLimit-Policy",
+            "RateLimit-Limit",
+            "RateLimit-Remaining",
+            "RateLimit-Reset",
+        ],
     )
 
 
@@ -32,3 +54,4 @@ def init_routes(app: FastAPI) -> None:
     )
     app.add_route("/metrics", metrics_handler)
     setup_exception_handlers(app)
+    init_route_index(app)
@@ -0,0 +1,144 @@
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    name: str
+    requests: int
+    elapsed: float
+    latencies: list[float]
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed
+
+    def percentile(self, q: int) -> float:
+        return statistics.quantiles(self.latencies, n=100)[q - 1]
+
+    def row(self) -> str:
+        return (
+            f"{self.name:<32} {self.rps:>12.1f} req/s"
+            f"   p50 {self.percentile(50) * 1000:>8.3f} ms"
+            f"   p99 {self.percentile(99) * 1000:>8.3f} ms"
+        )
+
+
+def http_scope(
+    path: str, method: str = "GET", headers: list[Any] | None = None
+) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers or [(b"host", b"bench")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+
+
+async def call_asgi(app: ASGIApp, scope: dict[str, Any], body: bytes = b"") -> int:
+    """Drive one request through an ASGI app without any network in between."""
+    status = 0
+    sent = False
+
+    async def receive() -> Message:
+        nonlocal sent
+        if sent:
+            await asyncio.Event().wait()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[Any]],
+    requests: int = 10_000,
+    concurrency: int = 32,
+    warmup: int = 500,
+) -> BenchResult:
+    for _ in range(warmup):
+        await call()
+
+    latencies: list[float] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(concurrency):
+            tg.create_task(worker())
+    elapsed = time.perf_counter() - started
+
+    return BenchResult(
+        name=name, requests=requests, elapsed=elapsed, latencies=latencies
+    )
+
+
+def report(title: str, results: list[BenchResult]) -> None:
+    print(title)
+    print("-" * len(title))
+    for result in results:
+        print(result.row())
+    print()
+
+
+@asynccontextmanager
+async def stub_server(
+    body: bytes = b'{"status": "ok"}', delay: float = 0.0
+) -> AsyncIterator[str]:
+    """Minimal keep-alive HTTP/1.1 server answering every request with ``body``."""
+    head = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n"
+    )
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                if delay:
+                    await asyncio.sleep(delay)
+                writer.write(head)
+                # Chunked so large bodies are not copied into the send buffer.
+                view = memoryview(body)
+                for offset in range(0, len(body), 64 * 1024):
+                    writer.write(view[offset : offset + 64 * 1024])
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    async with server:
+        yield f"http://{host}:{port}"
@@ -0,0 +1,83 @@
+# Usage: cd src && python -m tests.benchmarks.bench_autopipeline
+# Needs a disposable Redis server, configured like the app (.env).
+import asyncio
+from typing import Awaitable, Callable
+
+from environs import Env
+from infra.config import RedisConfig
+from infra.redis import AutoPipelineRedis, InstrumentedConnectionPool
+from prometheus_client import REGISTRY
+from redis.asyncio import Redis
+
+from ._harness import BenchResult, measure, report
+
+KEYS = [f"bench:key:{i}" for i in range(20)]
+
+
+def leases(pool: str) -> float:
+    # Every command, or pipeline, leases a connection once: one round trip.
+    count = REGISTRY.get_sample_value(
+        "redis_pool_wait_duration_seconds_count", {"pool": pool}
+    )
+    return count or 0.0
+
+
+async def sequential(redis: Redis) -> None:
+    for key in KEYS:
+        await redis.get(key)
+
+
+async def concurrent(redis: Redis) -> None:
+    await asyncio.gather(*(redis.get(key) for key in KEYS))
+
+
+async def run(
+    name: str,
+    pool: str,
+    handler: Callable[[Redis], Awaitable[None]],
+    redis: Redis,
+) -> BenchResult:
+    before = leases(pool)
+    result = await measure(
+        name, lambda: handler(redis), requests=2_000, concurrency=1, warmup=100
+    )
+    trips = (leases(pool) - before) / (result.requests + 100)
+    print(f"{name:<32} {trips:>6.1f} round trips/request")
+    return result
+
+
+async def main() -> None:
+    env = Env()
+    env.read_env()
+    config = RedisConfig.from_env(env)
+
+    def client(cls: type[Redis], pool: str) -> Redis:
+        return cls(
+            connection_pool=InstrumentedConnectionPool.from_url(
+                config.construct_redis_dsn, name=pool, max_connections=32
+            )
+        )
+
+    plain = client(Redis, "bench-plain")
+    pipelined = client(AutoPipelineRedis, "bench-auto")
+    await plain.mset({key: "x" * 100 for key in KEYS})
+
+    title = f"Handler doing {len(KEYS)} GETs, one request at a time"
+    print(title)
+    print("-" * len(title))
+    results = [
+        await run("Redis, sequential", "bench-plain", sequential, plain),
+        await run("Redis, gather", "bench-plain", concurrent, plain),
+        await run("AutoPipelineRedis, sequential", "bench-auto", sequential, pipelined),
+        await run("AutoPipelineRedis, gather", "bench-auto", concurrent, pipelined),
+    ]
+    print()
+    report("Latency", results)
+
+    await plain.delete(*KEYS)
+    for redis in (plain, pipelined):
+        await redis.connection_pool.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+# Usage: cd src && python -m tests.benchmarks.bench_batch
+import asyncio
+import time
+
+from infra.config import HttpClientConfig
+from infra.external import BaseClient, BatchRequest, build_http_client
+
+from ._harness import BenchResult, report, stub_server
+
+REQUESTS = 200
+UPSTREAM_DELAY = 0.01
+
+
+class StubClient(BaseClient):
+    pass
+
+
+async def sequential(client: StubClient) -> BenchResult:
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        call_started = time.perf_counter()
+        await client.get("/")
+        latencies.append(time.perf_counter() - call_started)
+    return BenchResult(
+        name="sequential awaits",
+        requests=REQUESTS,
+        elapsed=time.perf_counter() - started,
+        latencies=latencies,
+    )
+
+
+async def batched(client: StubClient, concurrency: int) -> BenchResult:
+    requests = [BatchRequest("/") for _ in range(REQUESTS)]
+    # Open the pool connections first so connects are not part of the timing.
+    async for _ in client.batch(requests[:concurrency], concurrency=concurrency):
+        pass
+    started = time.perf_counter()
+    latencies = [
+        result.duration
+        async for result in client.batch(requests, concurrency=concurrency)
+    ]
+    return BenchResult(
+        name=f"batch, concurrency={concurrency}",
+        requests=REQUESTS,
+        elapsed=time.perf_counter() - started,
+        latencies=latencies,
+    )
+
+
+async def main() -> None:
+    async with stub_server(delay=UPSTREAM_DELAY) as url:
+        http = build_http_client(HttpClientConfig(max_keepalive_connections=64))
+        client = StubClient(url, client=http)
+        results = [await sequential(client)]
+        for concurrency in (4, 16):
+            results.append(await batched(client, concurrency))
+        await http.aclose()
+    report(
+        f"{REQUESTS} GETs against a stub server with {UPSTREAM_DELAY * 1000:.0f}ms latency",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+# Usage: cd src && python -m tests.benchmarks.bench_export
+# Needs a disposable PostgreSQL database, configured like the app (.env).
+# Each mode runs in its own process so that its peak RSS is its own.
+import asyncio
+import resource
+import subprocess
+import sys
+import time
+
+import orjson
+from environs import Env
+from infra.config import DbConfig
+from infra.db import build_engine, copy_csv, ndjson
+from presentation.api.v1.response import CSV, NDJSON, ExportResponse
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.types import Message
+
+from .bench_repository import BenchItem
+
+ROWS = 2_000_000
+MODES = ("orm + orjson", "ndjson", "csv", "csv + gzip")
+
+
+async def orm_dump(session: AsyncSession) -> int:
+    items = (await session.scalars(select(BenchItem))).all()
+    body = orjson.dumps([{"id": i.id, "name": i.name, "value": i.value} for i in items])
+    return len(body)
+
+
+async def stream(response: ExportResponse) -> int:
+    sent = 0
+
+    async def receive() -> Message:
+        return await asyncio.Future()
+
+    async def send(message: Message) -> None:
+        nonlocal sent
+        sent += len(message.get("body", b""))
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    await response(scope, receive, send)
+    return sent
+
+
+async def export(session: AsyncSession, mode: str) -> int:
+    columns = select(BenchItem.id, BenchItem.name, BenchItem.value)
+    match mode:
+        case "orm + orjson":
+            return await orm_dump(session)
+        case "ndjson":
+            return await stream(ExportResponse(ndjson(session, columns), NDJSON))
+        case "csv":
+            return await stream(ExportResponse(copy_csv(session, columns), CSV))
+        case _:
+            return await stream(
+                ExportResponse(copy_csv(session, columns), CSV, gzip=True)
+            )
+
+
+def engine() -> AsyncEngine:
+    env = Env()
+    env.read_env()
+    return build_engine(DbConfig.from_env(env), name="bench")
+
+
+async def run(mode: str) -> None:
+    engine_ = engine()
+    async with async_sessionmaker(engine_)() as session:
+        started = time.perf_counter()
+        size = await export(session, mode)
+        elapsed = time.perf_counter() - started
+    await engine_.dispose()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+    print(
+        f"{mode:<16} {ROWS / elapsed:>12.0f} rows/s {size / 2**20 / elapsed:>8.1f} "
+        f"MiB/s {size / 2**20:>8.1f} MiB  peak RSS {peak:>8.1f} MiB"
+    )
+
+
+async def seed() -> None:
+    engine_ = engine()
+    async with engine_.begin() as connection:
+        await connection.run_sync(BenchItem.__table__.create, checkfirst=True)
+        count = await connection.scalar(select(func.count()).select_from(BenchItem))
+        if count != ROWS:
+            await connection.execute(text("TRUNCATE bench_items"))
+            await connection.execute(
+                insert(BenchItem).from_select(
+                    ["id", "name", "value"],
+                    select(
+                        text("i"), text("'item-' || i"), text("i * 0.5")
+                    ).select_from(text(f"generate_series(1, {ROWS}) AS i")),
+                )
+            )
+    await engine_.dispose()
+
+
+def main() -> None:
+    asyncio.run(seed())
+    title = f"Exporting {ROWS} rows"
+    print(title)
+    print("-" * len(title))
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "tests.benchmarks.bench_export", mode], check=True
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        asyncio.run(run(sys.argv[1]))
+    else:
+        main()
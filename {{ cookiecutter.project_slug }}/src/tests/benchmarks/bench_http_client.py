@@ -0,0 +1,50 @@
+# Usage: cd src && python -m tests.benchmarks.bench_http_client
+import asyncio
+
+import httpx
+from infra.config import HttpClientConfig
+from infra.external import BaseClient, build_http_client
+
+from ._harness import measure, report, stub_server
+
+
+class StubClient(BaseClient):
+    pass
+
+
+async def per_call_client(url: str) -> None:
+    # What BaseClient did before: a fresh client (and TCP handshake) per call.
+    async with httpx.AsyncClient(base_url=url, timeout=20) as client:
+        (await client.get("/")).json()
+
+
+async def main() -> None:
+    async with stub_server() as url:
+        http = build_http_client(HttpClientConfig(max_keepalive_connections=64))
+        pooled = StubClient(url, client=http)
+        results = []
+        for concurrency in (1, 32):
+            results.append(
+                await measure(
+                    f"per-call client, c={concurrency}",
+                    lambda: per_call_client(url),
+                    requests=500,
+                    concurrency=concurrency,
+                    warmup=20,
+                )
+            )
+            results.append(
+                await measure(
+                    f"pooled BaseClient, c={concurrency}",
+                    lambda: pooled.get("/"),
+                    requests=500,
+                    concurrency=concurrency,
+                    warmup=20,
+                )
+            )
+        await http.aclose()
+    report("BaseClient throughput against a local stub server", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+# Usage: cd src && python -m tests.benchmarks.bench_loader
+# Needs a disposable PostgreSQL database, configured like the app (.env).
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from environs import Env
+from infra.config import DbConfig
+from infra.db import Base, build_engine
+from infra.db.instrumentation import instrument_engine, track_queries
+from infra.db.repositories import EntityLoaders
+from sqlalchemy import ForeignKey, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+ITEMS = 100
+REQUESTS = 200
+
+
+class BenchAuthor(Base):
+    __tablename__ = "bench_authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class BenchPost(Base):
+    __tablename__ = "bench_posts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    author_id: Mapped[int] = mapped_column(ForeignKey("bench_authors.id"))
+
+
+async def list_posts(session: AsyncSession) -> list[BenchPost]:
+    posts = await session.scalars(select(BenchPost).order_by(BenchPost.id).limit(ITEMS))
+    return list(posts)
+
+
+def render(post: BenchPost, author: BenchAuthor | None) -> dict[str, Any]:
+    return {"id": post.id, "title": post.title, "author": author and author.name}
+
+
+async def one_by_one(session: AsyncSession) -> list[dict[str, Any]]:
+    return [
+        render(post, await session.get(BenchAuthor, post.author_id))
+        for post in await list_posts(session)
+    ]
+
+
+async def per_item_loads(session: AsyncSession) -> list[dict[str, Any]]:
+    # Each item resolves its own author, as nested resolvers would.
+    loaders = EntityLoaders(session)
+
+    async def resolve(post: BenchPost) -> dict[str, Any]:
+        return render(post, await loaders.of(BenchAuthor).load(post.author_id))
+
+    return list(
+        await asyncio.gather(*(resolve(post) for post in await list_posts(session)))
+    )
+
+
+async def load_many(session: AsyncSession) -> list[dict[str, Any]]:
+    posts = await list_posts(session)
+    authors = (
+        await EntityLoaders(session)
+        .of(BenchAuthor)
+        .load_many(post.author_id for post in posts)
+    )
+    return [render(post, author) for post, author in zip(posts, authors)]
+
+
+async def measure(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    name: str,
+    endpoint: Callable[[AsyncSession], Awaitable[list[dict[str, Any]]]],
+) -> None:
+    elapsed = 0.0
+    for _ in range(REQUESTS):
+        # A session per request, as in the app: nothing is cached across them.
+        async with sessionmaker() as session:
+            with track_queries() as queries:
+                started = time.perf_counter()
+                assert len(await endpoint(session)) == ITEMS
+                elapsed += time.perf_counter() - started
+    print(
+        f"{name:<28} {elapsed / REQUESTS * 1000:>8.2f} ms/request "
+        f"{queries.total:>4} queries/request"
+    )
+
+
+async def main() -> None:
+    env = Env()
+    env.read_env()
+    engine = instrument_engine(
+        build_engine(DbConfig.from_env(env), name="bench"), mode="off"
+    )
+    tables = [BenchAuthor.__table__, BenchPost.__table__]
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+        await connection.execute(
+            insert(BenchAuthor),
+            [{"id": i, "name": f"author-{i}"} for i in range(ITEMS)],
+        )
+        await connection.execute(
+            insert(BenchPost),
+            [{"id": i, "title": f"post-{i}", "author_id": i} for i in range(ITEMS)],
+        )
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    title = f"List endpoint of {ITEMS} posts with their authors"
+    print(title)
+    print("-" * len(title))
+    await measure(sessionmaker, "session.get per item", one_by_one)
+    await measure(sessionmaker, "DataLoader.load per item", per_item_loads)
+    await measure(sessionmaker, "DataLoader.load_many", load_many)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all, tables=tables)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
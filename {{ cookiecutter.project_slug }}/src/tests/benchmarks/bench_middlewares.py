@@ -0,0 +1,57 @@
+# Usage: cd src && python -m tests.benchmarks.bench_middlewares
+import asyncio
+import logging
+
+import structlog
+from fastapi import FastAPI
+from presentation.api.middlewares import (
+    InstrumentationMiddleware,
+    PrometheusMiddleware,
+    logging_middleware,
+)
+from presentation.api.v1.response import OkResponse
+from presentation.api.v1.urls import Paths
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ._harness import call_asgi, http_scope, measure, report
+
+
+async def healthcheck_stub() -> OkResponse[dict[str, str]]:
+    # Same route as the real healthcheck, minus Postgres/Redis round-trips,
+    # so the numbers only reflect the middleware stack.
+    return OkResponse(result={"status": "Healthy"})
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+    if stack == "before":
+        app.add_middleware(BaseHTTPMiddleware, dispatch=logging_middleware)
+        app.add_middleware(PrometheusMiddleware, app_name="bench-before")
+    else:
+        app.add_middleware(InstrumentationMiddleware, app_name="bench-after")
+    app.add_api_route(Paths.HEALTHCHECK, healthcheck_stub, methods=["GET"])
+    return app
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    structlog.configure(
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.AsyncBoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    results = []
+    for stack in ("before", "after"):
+        app = build_app(stack)
+        results.append(
+            await measure(
+                f"{stack}: {Paths.HEALTHCHECK}",
+                lambda app=app: call_asgi(app, http_scope(Paths.HEALTHCHECK)),
+            )
+        )
+    report("BaseHTTPMiddleware stack vs pure ASGI instrumentation", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
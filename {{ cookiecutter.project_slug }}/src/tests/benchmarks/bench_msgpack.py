@@ -0,0 +1,66 @@
+# Usage: cd src && python -m tests.benchmarks.bench_msgpack
+import random
+import time
+from typing import Any, Callable
+
+import msgpack
+import orjson
+from presentation.api.v1.request import unpackb
+from presentation.api.v1.response import OkResponse
+from presentation.api.v1.response.msgpack import packb
+from presentation.api.v1.response.serializer import dumps
+from pydantic import BaseModel
+
+
+class Series(BaseModel):
+    name: str
+    timestamps: list[int]
+    values: list[float]
+
+
+def series(points: int) -> Series:
+    return Series(
+        name="cpu.load",
+        timestamps=[1_700_000_000 + i for i in range(points)],
+        values=[random.random() * 100 for _ in range(points)],
+    )
+
+
+PAYLOADS = {
+    "10 series x 10 points": OkResponse(result=[series(10) for _ in range(10)]),
+    "10 series x 1k points": OkResponse(result=[series(1000) for _ in range(10)]),
+    "ints 100k": OkResponse(result=list(range(100_000))),
+    "floats 100k": OkResponse(result=[random.random() for _ in range(100_000)]),
+}
+
+
+def per_second(call: Callable[[], Any], seconds: float = 0.5) -> float:
+    calls, started = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        for _ in range(10):
+            call()
+        calls += 10
+    return calls / elapsed
+
+
+def main() -> None:
+    title = "orjson vs MessagePack: size, encode/s, decode/s"
+    print(title)
+    print("-" * len(title))
+    for name, payload in PAYLOADS.items():
+        as_json, as_msgpack = dumps(payload), packb(payload)
+        assert msgpack.unpackb(as_msgpack) == orjson.loads(as_json)
+        for codec, body, encode, decode in (
+            ("json", as_json, dumps, orjson.loads),
+            ("msgpack", as_msgpack, packb, unpackb),
+        ):
+            print(
+                f"{name:<24} {codec:<8} {len(body) / 1024:>10.1f} KiB"
+                f"   enc {per_second(lambda: encode(payload)):>10.0f} /s"
+                f"   dec {per_second(lambda: decode(body)):>10.0f} /s"
+            )
+    print()
+
+
+if __name__ == "__main__":
+    main()
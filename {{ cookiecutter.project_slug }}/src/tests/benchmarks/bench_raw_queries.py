@@ -0,0 +1,114 @@
+# Usage: cd src && python -m tests.benchmarks.bench_raw_queries
+# Needs a disposable PostgreSQL database, configured like the app (.env).
+import asyncio
+import dataclasses
+import random
+import time
+from typing import Awaitable, Callable
+
+from environs import Env
+from infra.config import DbConfig
+from infra.db import Query, QueryExecutor, build_engine
+from infra.db.raw import create_pool
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .bench_repository import BenchItem, BenchItemRepository, rows
+
+SIZE = 10_000
+CALLS = 5_000
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BenchItemDto:
+    id: int
+    name: str
+    value: float
+
+
+BY_ID = Query(
+    "bench_item_by_id",
+    "SELECT id, name, value FROM bench_items WHERE id = $1",
+    BenchItemDto,
+)
+PAGE = Query(
+    "bench_items_page",
+    "SELECT id, name, value FROM bench_items WHERE id > $1 ORDER BY id LIMIT 100",
+    BenchItemDto,
+)
+COLUMNS = select(BenchItem.id, BenchItem.name, BenchItem.value)
+
+
+async def orm_by_id(session: AsyncSession, ident: int) -> None:
+    item = await session.scalar(select(BenchItem).where(BenchItem.id == ident))
+    assert item is not None
+    BenchItemDto(id=item.id, name=item.name, value=item.value)
+    session.expunge_all()
+
+
+async def core_by_id(session: AsyncSession, ident: int) -> None:
+    row = (await session.execute(COLUMNS.where(BenchItem.id == ident))).one()
+    BenchItemDto(**row._mapping)
+
+
+async def orm_page(session: AsyncSession, ident: int) -> None:
+    items = await session.scalars(
+        select(BenchItem).where(BenchItem.id > ident).order_by(BenchItem.id).limit(100)
+    )
+    [BenchItemDto(id=i.id, name=i.name, value=i.value) for i in items]
+    session.expunge_all()
+
+
+async def core_page(session: AsyncSession, ident: int) -> None:
+    result = await session.execute(
+        COLUMNS.where(BenchItem.id > ident).order_by(BenchItem.id).limit(100)
+    )
+    [BenchItemDto(**row._mapping) for row in result]
+
+
+async def measure(name: str, call: Callable[[int], Awaitable[object]]) -> None:
+    idents = [random.randrange(SIZE - 100) for _ in range(CALLS)]
+    for ident in idents[:100]:  # warm up connections and statement caches
+        await call(ident)
+    started = time.perf_counter()
+    for ident in idents:
+        await call(ident)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<24} {elapsed / CALLS * 1e6:>8.1f} us/query")
+
+
+async def main() -> None:
+    env = Env()
+    env.read_env()
+    config = DbConfig.from_env(env)
+    engine = build_engine(config, name="bench")
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(BenchItem.__table__.create, checkfirst=True)
+    async with sessionmaker() as session:
+        await session.execute(text("TRUNCATE bench_items"))
+        await BenchItemRepository(session).add_many(rows(SIZE))
+        await session.commit()
+
+    pool = await create_pool(config)
+    executor = QueryExecutor(pool)
+
+    title = f"Sequential lookups, {CALLS} queries each"
+    print(title)
+    print("-" * len(title))
+    async with sessionmaker() as session:
+        await measure("ORM by id", lambda i: orm_by_id(session, i))
+        await measure("Core by id", lambda i: core_by_id(session, i))
+        await measure("raw by id", lambda i: executor.fetch_one(BY_ID, i))
+        await measure("ORM page of 100", lambda i: orm_page(session, i))
+        await measure("Core page of 100", lambda i: core_page(session, i))
+        await measure("raw page of 100", lambda i: executor.fetch(PAGE, i))
+
+    async with engine.begin() as connection:
+        await connection.run_sync(BenchItem.__table__.drop)
+    await pool.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+# Usage: cd src && python -m tests.benchmarks.bench_repository
+# Needs a disposable PostgreSQL database, configured like the app (.env).
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from environs import Env
+from infra.config import DbConfig
+from infra.db import Base, build_engine
+from infra.db.repositories import SqlalchemyRepository
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+SIZES = (10_000, 1_000_000)
+
+
+class BenchItem(Base):
+    __tablename__ = "bench_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    value: Mapped[float]
+
+
+class BenchItemRepository(SqlalchemyRepository[BenchItem]):
+    model = BenchItem
+
+
+def rows(size: int) -> list[dict[str, object]]:
+    return [{"id": i, "name": f"item-{i}", "value": i * 0.5} for i in range(size)]
+
+
+async def naive(session: AsyncSession, size: int) -> None:
+    for row in rows(size):
+        session.add(BenchItem(**row))
+    await session.flush()
+
+
+async def add_many(session: AsyncSession, size: int) -> None:
+    await BenchItemRepository(session).add_many(rows(size))
+
+
+async def upsert_many(session: AsyncSession, size: int) -> None:
+    await BenchItemRepository(session).upsert_many(rows(size))
+
+
+async def copy_records(session: AsyncSession, size: int) -> None:
+    await BenchItemRepository(session).copy_records(
+        ((i, f"item-{i}", i * 0.5) for i in range(size)), ("id", "name", "value")
+    )
+
+
+async def measure(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    name: str,
+    load: Callable[[AsyncSession, int], Awaitable[None]],
+    size: int,
+) -> None:
+    async with sessionmaker() as session:
+        await session.execute(text("TRUNCATE bench_items"))
+        await session.commit()
+        started = time.perf_counter()
+        await load(session, size)
+        await session.commit()
+        elapsed = time.perf_counter() - started
+    print(f"{name:<24} {size:>9} rows {size / elapsed:>12.0f} rows/s")
+
+
+async def main() -> None:
+    env = Env()
+    env.read_env()
+    engine = build_engine(DbConfig.from_env(env), name="bench")
+    async with engine.begin() as connection:
+        await connection.run_sync(BenchItem.__table__.create, checkfirst=True)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    title = "Bulk insert throughput"
+    print(title)
+    print("-" * len(title))
+    for size in SIZES:
+        for name, load in (
+            ("session.add loop", naive),
+            ("add_many", add_many),
+            ("upsert_many", upsert_many),
+            ("copy_records", copy_records),
+        ):
+            await measure(sessionmaker, name, load, size)
+        print()
+
+    async with engine.begin() as connection:
+        await connection.run_sync(BenchItem.__table__.drop)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
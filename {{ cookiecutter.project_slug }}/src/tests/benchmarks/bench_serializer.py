@@ -0,0 +1,126 @@
+# Usage: cd src && python -m tests.benchmarks.bench_serializer
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+from uuid import UUID
+
+import orjson
+import pydantic
+import uuid6
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from presentation.api.v1.response import (
+    ErrorData,
+    ErrorResponse,
+    OkResponse,
+    PageResponse,
+    ResponseRoute,
+)
+from presentation.api.v1.response.serializer import dumps
+
+from ._harness import call_asgi, http_scope, measure, report
+
+
+class Item(pydantic.BaseModel):
+    id: UUID
+    name: str
+    price: float
+    tags: list[str]
+    created_at: datetime
+
+
+def item() -> Item:
+    return Item(
+        id=uuid6.uuid7(),
+        name="Lorem ipsum dolor sit amet",
+        price=12.5,
+        tags=["new", "sale"],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+PAYLOADS = {
+    "ok: one model": OkResponse(result=item()),
+    "page: 50 models": PageResponse(result=[item() for _ in range(50)]),
+    "ok: dict of uuids": OkResponse(result={"ids": [uuid6.uuid7() for _ in range(50)]}),
+    "error: exception": ErrorResponse(
+        error=ErrorData(title="Failed", data=ValueError("bad input"))
+    ),
+}
+
+
+def legacy_default(obj: Any) -> Any:
+    # The serializer this module replaced, with ``model_dump`` for the
+    # deprecated ``dict``, which warns on every call.
+    match obj:
+        case Exception():
+            text = obj.args[0] if len(obj.args) > 0 else "Unknown error"
+            return f"{obj.__class__.__name__}: {text}"
+        case UUID():
+            return str(obj)
+        case pydantic.BaseModel():
+            return obj.model_dump()
+    return repr(obj)
+
+
+def legacy_dumps(content: Any) -> bytes:
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        default=legacy_default,
+    )
+
+
+def per_second(call: Callable[[], Any], seconds: float = 0.5) -> float:
+    calls, started = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        for _ in range(100):
+            call()
+        calls += 100
+    return calls / elapsed
+
+
+def build_app(route_class: type[APIRoute]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    page = PAYLOADS["page: 50 models"]
+
+    @router.get("/items")
+    async def items() -> PageResponse[Item]:
+        return page  # type: ignore[return-value]
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.ERROR)
+
+    title = "Serializer: legacy default vs cached encoders"
+    print(title)
+    print("-" * len(title))
+    for name, payload in PAYLOADS.items():
+        legacy = per_second(lambda: legacy_dumps(payload))
+        cached = per_second(lambda: dumps(payload))
+        print(
+            f"{name:<24} {legacy:>12.0f} /s  ->  {cached:>12.0f} /s"
+            f"   x{cached / legacy:.2f}"
+        )
+    print()
+
+    results = []
+    for route_class in (APIRoute, ResponseRoute):
+        app = build_app(route_class)
+        results.append(
+            await measure(
+                f"{route_class.__name__}: /items",
+                lambda app=app: call_asgi(app, http_scope("/items")),
+            )
+        )
+    report("Response model pass vs direct orjson rendering", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+# Usage: cd src && python -m tests.benchmarks.bench_streaming
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+import orjson
+from infra.config import HttpClientConfig
+from infra.external import BaseClient, build_http_client
+
+from ._harness import stub_server
+
+ITEMS = 50_000
+
+
+class StubClient(BaseClient):
+    pass
+
+
+def payload() -> bytes:
+    return orjson.dumps(
+        [
+            {"id": i, "name": f"item-{i}", "tags": ["a", "b", "c"], "price": i * 0.5}
+            for i in range(ITEMS)
+        ]
+    )
+
+
+async def validated(client: StubClient) -> float:
+    response = await client.get("/")
+    return sum(item["price"] for item in response.data)
+
+
+async def raw(client: StubClient) -> float:
+    response = await client.get("/", raw=True)
+    return sum(item["price"] for item in response.data)
+
+
+async def streamed(client: StubClient) -> float:
+    total = 0.0
+    async for item in client.stream_json("/"):
+        total += item["price"]
+    return total
+
+
+async def profile(
+    name: str, call: Callable[[], Awaitable[Any]], expected: float
+) -> None:
+    started = time.perf_counter()
+    assert await call() == expected
+    elapsed = time.perf_counter() - started
+    # Traced separately, tracemalloc slows allocation-heavy code down a lot.
+    tracemalloc.start()
+    assert await call() == expected
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<32} peak {peak / 2**20:>8.1f} MiB   {elapsed * 1000:>8.1f} ms")
+
+
+async def main() -> None:
+    body = payload()
+    expected = sum(i * 0.5 for i in range(ITEMS))
+    async with stub_server(body=body) as url:
+        http = build_http_client(HttpClientConfig())
+        client = StubClient(url, client=http)
+        await client.get("/")  # connect outside of the measurements
+
+        title = f"Consuming a {len(body) / 2**20:.1f} MiB JSON array of {ITEMS} items"
+        print(title)
+        print("-" * len(title))
+        await profile("get() + pydantic Response", lambda: validated(client), expected)
+        await profile("get(raw=True)", lambda: raw(client), expected)
+        await profile("stream_json()", lambda: streamed(client), expected)
+        await http.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
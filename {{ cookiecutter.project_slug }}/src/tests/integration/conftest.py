@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import AsyncGenerator, Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, ContextManager, Generator, Iterator
 
 import orjson
 import pytest
@@ -11,6 +12,7 @@ from dishka.integrations.fastapi import setup_dishka
 from httpx import ASGITransport, AsyncClient
 from infra import ConfigProvider, InteractorProvider, RepositoriesProvider
 from infra.db import Base
+from infra.db.instrumentation import QueryCounter, instrument_engine, track_queries
 from main import create_app
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from testcontainers.postgres import PostgresContainer
@@ -72,10 +74,13 @@ async def setup_db(postgres_url: str) -> None:
 async def session_factory(
         postgres_url: str,
 ) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
-    engine = create_async_engine(
-        url=postgres_url,
-        json_serializer=lambda o: orjson.dumps(o).decode(),
-        json_deserializer=orjson.loads,
+    engine = instrument_engine(
+        create_async_engine(
+            url=postgres_url,
+            json_serializer=lambda o: orjson.dumps(o).decode(),
+            json_deserializer=orjson.loads,
+        ),
+        mode="raise",
     )
     session_factory_: async_sessionmaker[AsyncSession] = async_sessionmaker(
         bind=engine, expire_on_commit=False, autoflush=False
@@ -92,6 +97,27 @@ async def session(
         yield session_
 
 
+@pytest.fixture
+def max_queries() -> Callable[[int], ContextManager[QueryCounter]]:
+    """
+    Fail the test if the block runs more than ``limit`` SQL statements::
+
+        with max_queries(2):
+            await ac.get("/api/v1/items")
+    """
+
+    @contextmanager
+    def check(limit: int) -> Iterator[QueryCounter]:
+        with track_queries() as queries:
+            yield queries
+        assert queries.total <= limit, (
+            f"{queries.total} queries run, at most {limit} expected:\n"
+            f"{queries.report()}"
+        )
+
+    return check
+
+
 @pytest.fixture(scope="session")
 def container(postgres_url: str):
     container = make_async_container(
@@ -0,0 +1,37 @@
+import asyncio
+from typing import Callable, ContextManager
+
+import pytest
+from infra.db.instrumentation import QueryCounter
+from infra.db.repositories import EntityLoaders
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .test_repository import Probe, ProbeRepository
+
+
+@pytest.mark.anyio
+async def test_loads_share_one_query(
+    session_factory: async_sessionmaker[AsyncSession],
+    max_queries: Callable[[int], ContextManager[QueryCounter]],
+) -> None:
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE repository_probes"))
+        await ProbeRepository(session).add_many(
+            {"id": i, "name": f"probe-{i}"} for i in range(5)
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        loader = EntityLoaders(session).of(Probe)
+        with max_queries(1):
+            probes = await asyncio.gather(*(loader.load(i) for i in (4, 0, 42, 4)))
+            cached = await loader.load(0)
+
+    assert [probe and probe.name for probe in probes] == [
+        "probe-4",
+        "probe-0",
+        None,
+        "probe-4",
+    ]
+    assert cached is probes[1]
@@ -0,0 +1,62 @@
+import pytest
+from infra.db import Base
+from infra.db.repositories import SqlalchemyRepository
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Entry(Base):
+    __tablename__ = "paginated_entries"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class EntryRepository(SqlalchemyRepository[Entry]):
+    model = Entry
+
+
+@pytest.mark.anyio
+async def test_pages_follow_cursors_both_ways(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        # One transaction: every row shares created_at, the id breaks ties.
+        await session.execute(text("TRUNCATE paginated_entries"))
+        await EntryRepository(session).add_many({"id": i} for i in range(7))
+        await session.commit()
+
+        repository = EntryRepository(session)
+        first = await repository.paginate(3, descending=True)
+        second = await repository.paginate(3, cursor=first.next_cursor, descending=True)
+        last = await repository.paginate(3, cursor=second.next_cursor, descending=True)
+        back = await repository.paginate(3, cursor=second.prev_cursor, descending=True)
+        odd = await repository.paginate(
+            2, Entry.id % 2 == 1, cursor=first.next_cursor, descending=True
+        )
+
+    assert [entry.id for entry in first.items] == [6, 5, 4]
+    assert first.prev_cursor is None
+    assert [entry.id for entry in second.items] == [3, 2, 1]
+    assert [entry.id for entry in last.items] == [0]
+    assert last.next_cursor is None
+    assert [entry.id for entry in back.items] == [6, 5, 4]
+    assert back.prev_cursor is None
+    assert back.next_cursor is not None
+    assert [entry.id for entry in odd.items] == [3, 1]
+
+
+@pytest.mark.anyio
+async def test_stream_yields_every_row(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE paginated_entries"))
+        await EntryRepository(session).add_many({"id": i} for i in range(25))
+        await session.commit()
+
+        ids = [
+            entry.id async for entry in EntryRepository(session).stream(fetch_size=4)
+        ]
+
+    assert sorted(ids) == list(range(25))
@@ -0,0 +1,29 @@
+from typing import Callable, ContextManager
+
+import pytest
+from httpx import AsyncClient
+from infra.db.instrumentation import QueryCounter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.mark.anyio
+async def test_index_runs_no_query(
+    ac: AsyncClient, max_queries: Callable[[int], ContextManager[QueryCounter]]
+) -> None:
+    with max_queries(0):
+        response = await ac.get(url="/")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_statements_are_counted(
+    session: AsyncSession, max_queries: Callable[[int], ContextManager[QueryCounter]]
+) -> None:
+    with max_queries(2) as queries:
+        await session.execute(text("SELECT 1"))
+        await session.execute(text("SELECT 2"))
+
+    assert queries.total == 2
+    assert len(queries.fingerprints) == 1
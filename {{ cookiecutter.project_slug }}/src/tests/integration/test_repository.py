@@ -0,0 +1,103 @@
+import pytest
+from infra.db import Base
+from infra.db.repositories import SqlalchemyRepository
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Probe(Base):
+    __tablename__ = "repository_probes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class ProbeRepository(SqlalchemyRepository[Probe]):
+    model = Probe
+
+
+class Pair(Base):
+    __tablename__ = "repository_pairs"
+
+    left: Mapped[int] = mapped_column(primary_key=True)
+    right: Mapped[int] = mapped_column(primary_key=True)
+
+
+class PairRepository(SqlalchemyRepository[Pair]):
+    model = Pair
+
+
+@pytest.mark.anyio
+async def test_bulk_writes_and_get_many(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        repository = ProbeRepository(session, chunk_size=2)
+
+        assert (
+            await repository.add_many({"id": i, "name": f"probe-{i}"} for i in range(5))
+            == 5
+        )
+        assert (
+            await repository.upsert_many(
+                [{"id": 4, "name": "updated"}, {"id": 5, "name": "new"}]
+            )
+            == 2
+        )
+        assert (
+            await repository.copy_records(
+                ((i, f"copied-{i}") for i in range(6, 9)), ("id", "name")
+            )
+            == 3
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        probes = await ProbeRepository(session, chunk_size=2).get_many([4, 5, 7, 42, 4])
+
+    assert sorted((probe.id, probe.name) for probe in probes) == [
+        (4, "updated"),
+        (5, "new"),
+        (7, "copied-7"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_empty_update_columns_keep_rows_and_copy_rolls_back(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        repository = ProbeRepository(session)
+        await repository.add_many([{"id": 100, "name": "kept"}])
+        await repository.upsert_many(
+            [{"id": 100, "name": "ignored"}, {"id": 101, "name": "added"}],
+            update_columns=[],
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        await ProbeRepository(session).copy_records(
+            [(102, "discarded")], ("id", "name")
+        )
+        await session.rollback()
+
+    async with session_factory() as session:
+        probes = await ProbeRepository(session).get_many([100, 101, 102])
+
+    assert sorted((probe.id, probe.name) for probe in probes) == [
+        (100, "kept"),
+        (101, "added"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_get_many_with_composite_keys(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        repository = PairRepository(session, chunk_size=2)
+        await repository.add_many({"left": i, "right": -i} for i in range(3))
+
+        pairs = await repository.get_many([(0, 0), (1, -1), (2, 2), (1, -1)])
+
+    assert sorted((pair.left, pair.right) for pair in pairs) == [(0, 0), (1, -1)]
@@ -0,0 +1,107 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from infra import deadline
+from infra.db import autocommit, finish_session
+from infra.db.session import (
+    ROUND_TRIPS_SAVED,
+    TrackedSession,
+    clear_statement_timeout,
+)
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest_asyncio.fixture
+async def tracked_factory(
+    postgres_url: str,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    engine = create_async_engine(url=postgres_url)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE IF NOT EXISTS session_probe (x int)"))
+        await conn.execute(text("TRUNCATE session_probe"))
+        await conn.execute(
+            text(
+                "CREATE OR REPLACE FUNCTION session_probe_insert() RETURNS void "
+                "AS 'INSERT INTO session_probe VALUES (2)' LANGUAGE sql"
+            )
+        )
+    yield async_sessionmaker(
+        bind=engine, expire_on_commit=False, sync_session_class=TrackedSession
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP FUNCTION session_probe_insert"))
+        await conn.execute(text("DROP TABLE session_probe"))
+    await engine.dispose()
+
+
+def saved(outcome: str) -> float:
+    return ROUND_TRIPS_SAVED.labels(outcome=outcome)._sum.get()
+
+
+@pytest.mark.anyio
+async def test_writes_are_committed(
+    tracked_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with tracked_factory() as session:
+        await session.execute(text("INSERT INTO session_probe VALUES (1)"))
+        await finish_session(session)
+
+    async with tracked_factory() as session:
+        count = await session.scalar(text("SELECT count(*) FROM session_probe"))
+    assert count == 1
+
+
+@pytest.mark.anyio
+async def test_selects_with_side_effects_are_committed(
+    tracked_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with tracked_factory() as session:
+        await session.execute(text("SELECT session_probe_insert()"))
+        await finish_session(session)
+
+    async with tracked_factory() as session:
+        count = await session.scalar(text("SELECT count(*) FROM session_probe"))
+    assert count == 1
+
+
+@pytest.mark.anyio
+async def test_autocommit_reads_skip_begin_and_commit(
+    tracked_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    before = saved("autocommit")
+
+    async with tracked_factory() as session:
+        await autocommit(session)
+        await session.execute(text("SELECT 1"))
+        await finish_session(session)
+
+    assert saved("autocommit") == before + 2
+
+
+@pytest.mark.anyio
+async def test_deadline_sets_the_statement_timeout(
+    tracked_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with tracked_factory() as session:
+        with deadline.deadline(0.5):
+            timeout = await session.scalar(text("SHOW statement_timeout"))
+            with pytest.raises(DBAPIError, match="statement timeout"):
+                await session.execute(text("SELECT pg_sleep(2)"))
+    assert 0 < int(timeout.removesuffix("ms")) <= 500
+
+    async with tracked_factory() as session:
+        assert await session.scalar(text("SHOW statement_timeout")) == "0"
+
+
+@pytest.mark.anyio
+async def test_exports_can_outlive_the_statement_timeout(
+    tracked_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with tracked_factory() as session:
+        with deadline.deadline(0.5):
+            await clear_statement_timeout(await session.connection())
+            assert await session.scalar(text("SHOW statement_timeout")) == "0"
+            await session.execute(text("SELECT pg_sleep(0.6)"))
@@ -1,6 +1,8 @@
 from typing import AsyncIterable
 
 from dishka import Provider, Scope, provide
+from infra.db.instrumentation import instrument_engine
+from infra.db.session import TrackedSession, finish_session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -17,7 +19,8 @@ class MockSqlalchemyProvider(Provider):
 
     @provide(scope=Scope.APP)
     def provide_engine(self) -> AsyncEngine:
-        return create_async_engine(self.uri)
+        # Likely N+1s fail the tests instead of only being logged.
+        return instrument_engine(create_async_engine(self.uri), mode="raise")
 
     @provide(scope=Scope.APP)
     def provide_sessionmaker(
@@ -27,6 +30,7 @@ class MockSqlalchemyProvider(Provider):
             bind=engine,
             expire_on_commit=False,
             autoflush=False,
+            sync_session_class=TrackedSession,
         )
 
     @provide(scope=Scope.REQUEST, provides=AsyncSession)
@@ -36,7 +40,7 @@ class MockSqlalchemyProvider(Provider):
         async with sessionmaker() as session:
             try:
                 yield session
-                await session.commit()
+                await finish_session(session)
             except SQLAlchemyError as e:
                 await session.rollback()
             finally:
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any
+
+import pytest
+from infra.redis import AutoPipelineRedis
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+
+class StubPipeline:
+    def __init__(self, redis: "StubRedis") -> None:
+        self.redis = redis
+        self.commands: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "StubPipeline":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        pass
+
+    def execute_command(self, *args: Any, **_: Any) -> "StubPipeline":
+        self.commands.append(args)
+        return self
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        self.redis.round_trips.append([args[0] for args in self.commands])
+        await asyncio.sleep(0)
+        return [self.redis.reply(*args) for args in self.commands]
+
+
+class StubRedis(AutoPipelineRedis):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.round_trips: list[list[str]] = []
+
+    def pipeline(self, *_: Any, **__: Any) -> StubPipeline:  # type: ignore[override]
+        return StubPipeline(self)
+
+    def reply(self, command: str, *args: Any) -> Any:
+        if command == "INCRBY":
+            return ResponseError("value is not an integer")
+        return f"{command.lower()}:{':'.join(map(str, args))}"
+
+
+@pytest.fixture
+def single_commands(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    sent: list[str] = []
+
+    async def execute_command(self: StubRedis, *args: Any, **_: Any) -> Any:
+        sent.append(args[0])
+        self.round_trips.append([args[0]])
+        return self.reply(*args)
+
+    monkeypatch.setattr(Redis, "execute_command", execute_command)
+    return sent
+
+
+async def test_commands_of_one_tick_share_a_pipeline(
+    single_commands: list[str],
+) -> None:
+    redis = StubRedis()
+
+    values = await asyncio.gather(*(redis.get(f"key-{i}") for i in range(20)))
+
+    assert values == [f"get:key-{i}" for i in range(20)]
+    assert redis.round_trips == [["GET"] * 20]
+    assert single_commands == []
+
+
+async def test_each_caller_gets_its_own_error(single_commands: list[str]) -> None:
+    redis = StubRedis()
+
+    value, error = await asyncio.gather(
+        redis.get("key"), redis.incr("key"), return_exceptions=True
+    )
+
+    assert value == "get:key"
+    assert isinstance(error, ResponseError)
+
+
+async def test_batches_are_flushed_at_the_threshold(single_commands: list[str]) -> None:
+    redis = StubRedis(max_batch=8)
+
+    await asyncio.gather(*(redis.get(f"key-{i}") for i in range(20)))
+
+    assert [len(trip) for trip in redis.round_trips] == [8, 8, 4]
+
+
+async def test_max_delay_waits_for_later_commands(single_commands: list[str]) -> None:
+    redis = StubRedis(max_delay=0.01)
+
+    async def later() -> Any:
+        await asyncio.sleep(0)
+        return await redis.get("later")
+
+    await asyncio.gather(redis.get("first"), later())
+
+    assert redis.round_trips == [["GET", "GET"]]
+
+
+async def test_lone_and_blocking_commands_skip_the_pipeline(
+    single_commands: list[str],
+) -> None:
+    redis = StubRedis()
+
+    await redis.get("key")
+    await redis.execute_command("BLPOP", "queue", 1)
+
+    assert single_commands == ["GET", "BLPOP"]
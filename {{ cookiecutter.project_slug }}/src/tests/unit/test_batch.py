@@ -0,0 +1,109 @@
+import asyncio
+from typing import Iterator
+
+import httpx
+import pytest
+from infra.external import BaseClient, BatchRequest
+from infra.external.batch import TokenBucket
+
+
+class StubClient(BaseClient):
+    pass
+
+
+def make_client(handler: httpx.AsyncBaseTransport) -> StubClient:
+    return StubClient(
+        "http://batch.test",
+        client=httpx.AsyncClient(transport=handler),
+        circuit_breaker=None,
+    )
+
+
+async def test_batch_bounds_concurrency_and_yields_in_completion_order() -> None:
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(float(request.url.params["delay"]))
+        in_flight -= 1
+        return httpx.Response(200, json={"delay": request.url.params["delay"]})
+
+    client = make_client(httpx.MockTransport(handler))
+    requests = [
+        BatchRequest("/", params={"delay": delay})
+        for delay in ("0.05", "0.01", "0.03", "0.02")
+    ]
+
+    results = [result async for result in client.batch(requests, concurrency=2)]
+
+    assert peak == 2
+    assert [r.response.data["delay"] for r in results if r.response] == [
+        "0.01",  # done at 10ms, frees a slot for 0.03
+        "0.03",  # done at 40ms, frees a slot for 0.02
+        "0.05",
+        "0.02",  # done at 60ms
+    ]
+    assert all(result.ok for result in results)
+
+
+async def test_batch_isolates_failures() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/boom":
+            raise RuntimeError("boom")
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={})
+
+    client = make_client(httpx.MockTransport(handler))
+    requests = [BatchRequest(path) for path in ("/ok", "/boom", "/missing", "/ok")]
+
+    results = {
+        result.request.path: result
+        async for result in client.batch(requests, concurrency=4)
+    }
+
+    assert isinstance(results["/boom"].error, RuntimeError)
+    assert results["/missing"].response is not None
+    assert results["/missing"].response.status_code == 404
+    assert not results["/missing"].ok
+    assert results["/ok"].ok
+
+
+async def test_token_bucket_paces_acquisitions_after_the_burst() -> None:
+    bucket = TokenBucket(rate=50, burst=2)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(7):
+        await bucket.acquire()
+    elapsed = loop.time() - started
+
+    # Two tokens are available up front, the other five arrive at 50/s.
+    assert 0.09 <= elapsed < 0.3
+
+
+async def test_batch_reraises_errors_of_the_requests() -> None:
+    def requests() -> Iterator[BatchRequest]:
+        yield BatchRequest("/ok")
+        raise RuntimeError("source failed")
+
+    client = make_client(httpx.MockTransport(lambda request: httpx.Response(200)))
+    results = []
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        async with asyncio.timeout(1):
+            async for result in client.batch(requests(), concurrency=2):
+                results.append(result)
+
+    assert len(results) == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"rate": 0}, {"rate": -1}])
+async def test_batch_rejects_invalid_limits(kwargs: dict[str, float]) -> None:
+    client = make_client(httpx.MockTransport(lambda request: httpx.Response(200)))
+
+    with pytest.raises(ValueError):
+        async for _ in client.batch([BatchRequest("/")], **kwargs):  # type: ignore
+            pass
@@ -0,0 +1,90 @@
+import pytest
+from infra.external.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    policy = CircuitBreakerPolicy(
+        window=10.0,
+        min_calls=4,
+        error_rate=0.5,
+        slow_call_duration=1.0,
+        slow_call_rate=0.75,
+        open_duration=5.0,
+        half_open_calls=2,
+    )
+    return CircuitBreaker("example.com", policy, clock=clock)
+
+
+def test_opens_on_error_rate(breaker: CircuitBreaker) -> None:
+    for failed in (False, True, False, True):
+        assert breaker.allow()
+        breaker.record(failed, 0.1)
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_opens_on_slow_calls(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        breaker.record(False, 2.0)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_old_calls_leave_the_window(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    breaker.record(True, 0.1)
+    breaker.record(True, 0.1)
+    clock.now = 20.0
+    for _ in range(3):
+        breaker.record(False, 0.1)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_closes_after_successful_trials(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    for _ in range(4):
+        breaker.record(True, 0.1)
+    clock.now = 5.0
+
+    assert breaker.allow()
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.record(False, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_reopens_on_failure(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    for _ in range(4):
+        breaker.record(True, 0.1)
+    clock.now = 5.0
+
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
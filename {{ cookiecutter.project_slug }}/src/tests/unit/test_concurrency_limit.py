@@ -0,0 +1,133 @@
+import asyncio
+
+import httpx
+from presentation.api.middlewares import ConcurrencyLimitMiddleware, GradientLimit
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+
+def build_app(
+    release: asyncio.Event, max_queue: int = 1, max_wait: float = 1.0
+) -> Starlette:
+    async def slow(request: Request) -> PlainTextResponse:
+        await release.wait()
+        return PlainTextResponse("slow")
+
+    async def fast(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("fast")
+
+    limit = GradientLimit(initial=1, min_limit=1, max_limit=1)
+    return Starlette(
+        routes=[
+            Route("/slow/{item_id}", slow),
+            Route("/fast", fast),
+            Route("/healthcheck", slow),
+        ],
+        middleware=[
+            Middleware(
+                ConcurrencyLimitMiddleware,
+                limit=limit,
+                max_queue=max_queue,
+                max_wait=max_wait,
+            )
+        ],
+    )
+
+
+def client(app: Starlette) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+async def test_requests_over_the_limit_wait_for_a_slot() -> None:
+    release = asyncio.Event()
+    async with client(build_app(release)) as http:
+        first = asyncio.create_task(http.get("/slow/1"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(http.get("/fast"))
+        await asyncio.sleep(0.01)
+        assert not queued.done()
+
+        release.set()
+        responses = await asyncio.gather(first, queued)
+
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+async def test_full_queue_is_shed_with_retry_after() -> None:
+    release = asyncio.Event()
+    async with client(build_app(release)) as http:
+        first = asyncio.create_task(http.get("/slow/1"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(http.get("/slow/2"))
+        await asyncio.sleep(0.01)
+        shed = await http.get("/slow/3")
+        # Queues are per route template: another route still gets a place.
+        other = asyncio.create_task(http.get("/fast"))
+        await asyncio.sleep(0.01)
+        release.set()
+        responses = await asyncio.gather(first, queued, other)
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert shed.json()["status"] == 503
+    assert [response.status_code for response in responses] == [200, 200, 200]
+
+
+async def test_requests_waiting_too_long_are_shed() -> None:
+    release = asyncio.Event()
+    async with client(build_app(release, max_wait=0.05)) as http:
+        first = asyncio.create_task(http.get("/slow/1"))
+        await asyncio.sleep(0.01)
+        shed = await http.get("/fast")
+        release.set()
+        await first
+
+    assert shed.status_code == 503
+
+
+async def test_exempt_and_unknown_routes_are_never_limited() -> None:
+    release = asyncio.Event()
+    async with client(build_app(release, max_queue=0)) as http:
+        first = asyncio.create_task(http.get("/slow/1"))
+        await asyncio.sleep(0.01)
+        health = asyncio.create_task(http.get("/healthcheck"))
+        missing = await http.get("/missing")
+        await asyncio.sleep(0.01)
+        release.set()
+        responses = await asyncio.gather(first, health)
+
+    assert missing.status_code == 404
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_limit_grows_while_latency_is_steady() -> None:
+    limit = GradientLimit(initial=10, max_limit=100)
+    for _ in range(50):
+        limit.update(0.01, in_flight=int(limit.limit))
+
+    assert limit.limit > 20
+
+
+def test_limit_shrinks_when_latency_rises() -> None:
+    limit = GradientLimit(initial=50, min_limit=4)
+    for _ in range(100):
+        limit.update(0.01, in_flight=50)
+    grown = limit.limit
+    for _ in range(50):
+        limit.update(0.2, in_flight=int(limit.limit))
+
+    assert limit.limit < grown / 2
+    assert limit.limit >= 4
+
+
+def test_idle_limit_does_not_grow() -> None:
+    limit = GradientLimit(initial=10)
+    for _ in range(50):
+        limit.update(0.01, in_flight=1)
+
+    assert limit.limit == 10
@@ -0,0 +1,81 @@
+from typing import AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from fastapi import FastAPI
+from infra.config import DbConfig
+from infra.db import build_engine, warm_up
+from infra.db.pool import POOL_WAIT_TIME, InstrumentedAsyncAdaptedQueuePool
+from main import lifespan
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+CONFIG = DbConfig(host="db", password="pass", user="user", database="db", port=5432)
+# Nothing listens on port 1, connections are refused right away.
+UNREACHABLE = DbConfig(
+    host="127.0.0.1", password="pass", user="user", database="db", port=1
+)
+
+
+def checkouts(pool: str) -> float:
+    return sum(bucket.get() for bucket in POOL_WAIT_TIME.labels(pool=pool)._buckets)
+
+
+def test_checkouts_are_recorded_under_the_pool_name() -> None:
+    pool = InstrumentedAsyncAdaptedQueuePool(MagicMock, pool_size=1)
+    pool.name = "checkout"
+
+    pool.connect().close()
+    pool.connect().close()
+
+    assert checkouts("checkout") == 2
+
+
+def test_pools_keep_their_name_once_recreated() -> None:
+    engine = build_engine(CONFIG, name="recreated")
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+
+    recreated = pool.recreate()
+
+    assert isinstance(recreated, InstrumentedAsyncAdaptedQueuePool)
+    assert (pool.name, recreated.name) == ("recreated", "recreated")
+
+
+async def test_failed_warm_ups_return_the_opened_connections() -> None:
+    engine = build_engine(UNREACHABLE, name="unreachable")
+
+    with pytest.raises((SQLAlchemyError, OSError)):
+        await warm_up(engine, 2)
+
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+    assert pool.checkedout() == 0
+
+
+async def test_apps_start_while_the_database_is_unreachable() -> None:
+    closed = False
+
+    class UnreachableProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def config(self) -> DbConfig:
+            return UNREACHABLE
+
+        @provide
+        async def engine(self, config: DbConfig) -> AsyncIterator[AsyncEngine]:
+            nonlocal closed
+            engine = build_engine(config, name="lifespan")
+            yield engine
+            await engine.dispose()
+            closed = True
+
+    app = FastAPI()
+    app.state.dishka_container = make_async_container(UnreachableProvider())
+
+    async with lifespan(app):
+        pass
+
+    assert closed
@@ -0,0 +1,145 @@
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from infra import deadline
+from infra.external import BaseClient
+from presentation.api.middlewares import DeadlineMiddleware
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+
+class StubClient(BaseClient):
+    pass
+
+
+async def test_nested_deadlines_only_shorten() -> None:
+    assert deadline.remaining() is None
+    assert deadline.clip(5.0) == 5.0
+
+    with deadline.deadline(1.0):
+        with deadline.deadline(10.0):
+            assert deadline.remaining() <= 1.0  # type: ignore[operator]
+        with deadline.deadline(0.1):
+            assert deadline.clip(5.0) <= 0.1  # type: ignore[operator]
+            assert deadline.clip(None) <= 0.1  # type: ignore[operator]
+
+    assert deadline.remaining() is None
+
+
+async def test_timeout_leaves_a_reserve_before_the_deadline() -> None:
+    with deadline.deadline(0.2):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(TimeoutError):
+            async with deadline.timeout(reserve=0.15):
+                await asyncio.sleep(1)
+        assert loop.time() - started < 0.15
+
+
+def build_app() -> Starlette:
+    async def sleep(request: Request) -> JSONResponse:
+        await asyncio.sleep(float(request.path_params["seconds"]))
+        return JSONResponse({"remaining": deadline.remaining()})
+
+    async def own_timeout(request: Request) -> JSONResponse:
+        async with asyncio.timeout(0.01):
+            await asyncio.sleep(1)
+        return JSONResponse({})
+
+    async def export(request: Request) -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(4):
+                await asyncio.sleep(0.05)
+                yield f"{deadline.remaining()}\n".encode()
+
+        return StreamingResponse(chunks())
+
+    return Starlette(
+        routes=[
+            Route("/sleep/{seconds}", sleep),
+            Route("/fast/{seconds}", sleep),
+            Route("/own-timeout", own_timeout),
+            Route("/export", export),
+        ],
+        middleware=[
+            Middleware(
+                DeadlineMiddleware,
+                default=1.0,
+                routes={"/fast/{seconds}": 0.05, "/export": 0.1},
+            )
+        ],
+    )
+
+
+def client(app: Starlette) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    )
+
+
+def exceeded(path: str) -> float:
+    value = REGISTRY.get_sample_value("http_deadline_exceeded_total", {"path": path})
+    return value or 0.0
+
+
+async def test_requests_get_the_route_deadline() -> None:
+    before = exceeded("/fast/{seconds}")
+    async with client(build_app()) as http:
+        within = await http.get("/sleep/0")
+        late = await http.get("/fast/0.2")
+
+    assert 0.9 < within.json()["remaining"] <= 1.0
+    assert late.status_code == 504
+    assert late.json()["status"] == 504
+    assert exceeded("/fast/{seconds}") == before + 1
+
+
+async def test_clients_may_ask_for_a_shorter_deadline() -> None:
+    async with client(build_app()) as http:
+        shorter = await http.get("/sleep/0", headers={"x-request-timeout": "0.5"})
+        longer = await http.get("/sleep/0", headers={"x-request-timeout": "60"})
+        invalid = await http.get("/sleep/0", headers={"x-request-timeout": "soon"})
+
+    assert shorter.json()["remaining"] <= 0.5
+    assert 0.5 < longer.json()["remaining"] <= 1.0
+    assert 0.5 < invalid.json()["remaining"] <= 1.0
+
+
+async def test_timeouts_of_the_handler_are_not_deadlines() -> None:
+    async with client(build_app()) as http:
+        response = await http.get("/own-timeout")
+
+    assert response.status_code == 500
+
+
+async def test_streamed_bodies_outlive_the_deadline() -> None:
+    async with client(build_app()) as http:
+        response = await http.get("/export")
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["None"] * 4
+
+
+async def test_base_client_passes_the_deadline_on() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    stub = StubClient("http://upstream", client=http, circuit_breaker=None)
+    await stub.get("/")
+    with deadline.deadline(0.5):
+        await stub.get("/")
+
+    assert "x-request-timeout" not in seen[0].headers
+    assert 0 < float(seen[1].headers["x-request-timeout"]) <= 0.5
+    assert seen[1].extensions["timeout"]["read"] <= 0.5
@@ -0,0 +1,117 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from infra.db.export import compile_query
+from presentation.api.v1.response import NDJSON, ExportResponse, accepts_gzip
+from sqlalchemy import column, select, table
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from starlette.requests import ClientDisconnect, Request
+from starlette.types import Message
+
+ITEMS = table("items", column("id"), column("name"))
+CHUNKS = [b'{"id":%d}\n' % i for i in range(100)]
+
+
+class Source:
+    def __init__(self) -> None:
+        self.sent = 0
+        self.closed = False
+
+    async def __call__(self) -> AsyncIterator[bytes]:
+        try:
+            for chunk in CHUNKS:
+                self.sent += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+async def request(response: ExportResponse) -> bytes:
+    async def app(scope, receive, send) -> None:  # type: ignore[no-untyped-def]
+        await response(scope, receive, send)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://t") as ac:
+        result = await ac.get("/")
+    assert result.headers["content-disposition"] == 'attachment; filename="x.ndjson"'
+    return result.content
+
+
+async def test_streams_plain_and_gzipped() -> None:
+    plain = await request(ExportResponse(Source()(), NDJSON, filename="x.ndjson"))
+    zipped = await request(
+        ExportResponse(Source()(), NDJSON, filename="x.ndjson", gzip=True)
+    )
+
+    assert plain == b"".join(CHUNKS)
+    # httpx decodes Content-Encoding: gzip on its own.
+    assert zipped == plain
+
+
+async def test_disconnect_closes_the_source() -> None:
+    source = Source()
+    sent_some = asyncio.Event()
+
+    async def receive() -> Message:
+        await sent_some.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and source.sent == 3:
+            sent_some.set()
+        await asyncio.sleep(0)
+
+    await ExportResponse(source(), NDJSON)({"type": "http"}, receive, send)
+
+    assert source.closed
+    assert source.sent < len(CHUNKS)
+
+
+async def test_reset_connection_closes_the_source() -> None:
+    source = Source()
+
+    async def receive() -> Message:
+        return await asyncio.Future()
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and source.sent == 3:
+            raise OSError("Connection reset by peer")
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await ExportResponse(source(), NDJSON)(scope, receive, send)
+
+    assert source.closed
+    assert source.sent == 3
+
+
+def test_compiled_queries_expand_in_filters() -> None:
+    statement = select(ITEMS.c.id).where(ITEMS.c.name == "x", ITEMS.c.id.in_([1, 2, 3]))
+
+    query, args = compile_query(statement, PGDialect_asyncpg())
+
+    assert "POSTCOMPILE" not in query
+    assert "IN ($2::INTEGER, $3::INTEGER, $4::INTEGER)" in query
+    assert args == ["x", 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", False),
+        ("identity", False),
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("x-gzip", False),
+        ("*", True),
+        ("gzip;q=0, *", False),
+        ("*;q=0", False),
+    ],
+)
+def test_gzip_must_be_accepted(accept_encoding: str, expected: bool) -> None:
+    headers = [(b"accept-encoding", accept_encoding.encode())]
+    request = Request({"type": "http", "headers": headers})
+
+    assert accepts_gzip(request) is expected
@@ -0,0 +1,32 @@
+import asyncio
+
+from infra.external.resilience import HedgePolicy, Hedger
+
+POLICY = HedgePolicy(min_delay=0.01, max_delay=0.02, min_samples=2, samples=10)
+
+
+async def test_a_slow_attempt_is_raced_by_a_hedge() -> None:
+    hedger: Hedger[str] = Hedger("slow.test", POLICY)
+    delays = iter((1.0, 0.0))
+
+    async def attempt() -> str:
+        delay = next(delays)
+        await asyncio.sleep(delay)
+        return "primary" if delay else "hedge"
+
+    assert await hedger.run(attempt) == "hedge"
+
+
+async def test_latencies_are_shared_per_host() -> None:
+    first: Hedger[None] = Hedger("shared.test", POLICY)
+    second: Hedger[None] = Hedger("shared.test", POLICY)
+    other: Hedger[None] = Hedger("other.test", POLICY)
+
+    async def attempt() -> None:
+        pass
+
+    await first.run(attempt)
+    await first.run(attempt)
+
+    assert second.delay == POLICY.min_delay
+    assert other.delay == POLICY.max_delay
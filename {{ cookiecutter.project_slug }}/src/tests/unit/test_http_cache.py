@@ -0,0 +1,110 @@
+import asyncio
+from typing import Any
+
+import httpx
+from infra.external import BaseClient
+from infra.external.cache import HttpCache
+from redis.exceptions import ConnectionError
+
+
+class StubClient(BaseClient):
+    pass
+
+
+class BrokenRedis:
+    async def get(self, key: str) -> Any:
+        raise ConnectionError("redis is down")
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> Any:
+        raise ConnectionError("redis is down")
+
+
+def make_client(
+    handler: Any, cache: HttpCache | None = None
+) -> tuple[StubClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    async def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response: httpx.Response = await handler(request)
+        return response
+
+    client = StubClient(
+        "http://cache.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(record)),
+        circuit_breaker=None,
+        cache=cache or HttpCache(),
+    )
+    return client, requests
+
+
+async def test_fresh_entries_are_served_from_the_cache() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"id": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+
+    client, requests = make_client(handler)
+
+    first = await client.get("/items/1")
+    second = await client.get("/items/1")
+
+    assert first.data == second.data == {"id": 1}
+    assert len(requests) == 1
+
+
+async def test_stale_entries_are_revalidated() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'})
+
+    client, requests = make_client(handler)
+
+    await client.get("/items/1")
+    revalidated = await client.get("/items/1")
+
+    assert revalidated.status_code == 200
+    assert revalidated.data == {"id": 1}
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"']
+
+
+async def test_concurrent_gets_are_collapsed() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": 1})
+
+    client, requests = make_client(handler)
+
+    responses = await asyncio.gather(*(client.get("/items/1") for _ in range(5)))
+
+    assert [response.data for response in responses] == [{"id": 1}] * 5
+    assert len(requests) == 1
+
+
+async def test_redis_failures_fall_back_to_the_local_tier() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"id": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+
+    cache = HttpCache(redis=BrokenRedis())  # type: ignore[arg-type]
+    client, requests = make_client(handler, cache)
+
+    assert (await client.get("/items/1")).data == {"id": 1}
+    assert (await client.get("/items/1")).data == {"id": 1}
+    assert len(requests) == 1
+
+
+async def test_incomplete_responses_are_not_stored() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            206, json={"id": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+
+    client, requests = make_client(handler)
+
+    await client.get("/items/1")
+    await client.get("/items/1")
+
+    assert len(requests) == 2
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import httpx
+from infra import deadline
+from infra.external import BaseClient
+from infra.external.http import HttpPoolCollector
+
+
+class StubClient(BaseClient):
+    pass
+
+
+async def timeouts_of(
+    client: StubClient, seen: list[httpx.Request]
+) -> dict[str, float]:
+    await client.get("/")
+    timeout: dict[str, float] = seen.pop().extensions["timeout"]
+    return timeout
+
+
+async def test_requests_use_the_timeouts_of_the_client_unless_given() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    http = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), timeout=httpx.Timeout(3, connect=1)
+    )
+    default = StubClient("http://upstream", client=http, circuit_breaker=None)
+    explicit = StubClient(
+        "http://upstream", timeout=5, client=http, circuit_breaker=None
+    )
+
+    assert await timeouts_of(default, seen) == {
+        "connect": 1,
+        "read": 3,
+        "write": 3,
+        "pool": 3,
+    }
+    assert await timeouts_of(explicit, seen) == dict.fromkeys(
+        ("connect", "read", "write", "pool"), 5
+    )
+    with deadline.deadline(0.5):
+        clipped = await timeouts_of(default, seen)
+    assert all(0 < value <= 0.5 for value in clipped.values())
+
+
+def test_pool_collector_skips_unknown_transports() -> None:
+    collector = HttpPoolCollector()
+    renamed = httpx.AsyncClient()
+    renamed._transport._pool = SimpleNamespace()  # type: ignore[attr-defined]
+    clients = [
+        httpx.AsyncClient(),
+        httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200))),
+        renamed,
+    ]
+    for i, client in enumerate(clients):
+        collector.track(f"client-{i}", client)
+
+    assert [metric.samples for metric in collector.collect()] == [[], []]
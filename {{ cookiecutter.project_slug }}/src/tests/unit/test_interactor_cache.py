@@ -0,0 +1,346 @@
+import asyncio
+import dataclasses
+import time
+from typing import Any, AsyncIterator
+
+import pytest
+from infra.cache import InteractorCache
+from infra.cache.interactor import CachedInteractor, _Entry
+from prometheus_client import REGISTRY
+from redis.exceptions import ConnectionError, RedisError
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GetUser:
+    user_id: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UserDto:
+    user_id: int
+    name: str
+
+
+class StubInteractor:
+    def __init__(self) -> None:
+        self.calls: list[GetUser] = []
+
+    async def execute(self, request: GetUser) -> UserDto:
+        self.calls.append(request)
+        await asyncio.sleep(0.01)
+        return UserDto(request.user_id, f"user-{request.user_id}")
+
+
+class StubPipeline:
+    def __init__(self, redis: "StubRedis") -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "StubPipeline":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        pass
+
+    def __getattr__(self, command: str) -> Any:
+        return lambda *args, **kwargs: self.commands.append((command, args, kwargs))
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self.redis, command)(*args, **kwargs)
+            for command, args, kwargs in self.commands
+        ]
+
+
+class StubLock:
+    def __init__(self, redis: "StubRedis", name: str) -> None:
+        self.redis = redis
+        self.name = name
+
+    async def acquire(self, blocking: bool = True) -> bool:
+        return bool(await self.redis.set(self.name, b"token", nx=True))
+
+    async def release(self) -> None:
+        await self.redis.delete(self.name)
+
+
+class StubPubSub:
+    def __init__(self, redis: "StubRedis") -> None:
+        self.redis = redis
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def __aenter__(self) -> "StubPubSub":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        for queues in self.redis.subscribers.values():
+            queues.remove(self.messages)
+
+    async def subscribe(self, channel: str) -> None:
+        await self.redis.subscribe(channel, self.messages)
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self.messages.get()
+
+
+class StubRedis:
+    """Redis shared by the caches of several workers, in memory."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.subscribers: dict[str, list[asyncio.Queue[dict[str, Any]]]] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(
+        self, key: str, value: Any, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def sadd(self, key: str, *members: str) -> None:
+        self.data.setdefault(key, set()).update(m.encode() for m in members)
+
+    async def smembers(self, key: str) -> Any:
+        return self.data.get(key, set())
+
+    async def expire(self, key: str, seconds: int, **_: Any) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"data": message})
+
+    async def subscribe(self, channel: str, queue: asyncio.Queue[Any]) -> None:
+        self.subscribers.setdefault(channel, []).append(queue)
+
+    def pipeline(self, transaction: bool = True) -> StubPipeline:
+        return StubPipeline(self)
+
+    def lock(self, name: str, timeout: float | None = None) -> StubLock:
+        return StubLock(self, name)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> StubPubSub:
+        return StubPubSub(self)
+
+
+class BrokenRedis(StubRedis):
+    async def get(self, key: str) -> Any:
+        raise ConnectionError("redis is down")
+
+    async def set(self, key: str, value: Any, **_: Any) -> bool | None:
+        raise ConnectionError("redis is down")
+
+    async def smembers(self, key: str) -> Any:
+        raise ConnectionError("redis is down")
+
+    async def delete(self, *keys: str) -> None:
+        raise ConnectionError("redis is down")
+
+    async def subscribe(self, channel: str, queue: asyncio.Queue[Any]) -> None:
+        raise ConnectionError("redis is down")
+
+
+def worker(
+    redis: StubRedis, name: str, **kwargs: Any
+) -> tuple[CachedInteractor[GetUser, UserDto], StubInteractor]:
+    interactor = StubInteractor()
+    cache = InteractorCache(redis=redis, **kwargs)  # type: ignore[arg-type]
+    get_user = cache.wrap(
+        interactor,
+        name,
+        ttl=60,
+        tags=lambda request: [f"user:{request.user_id}"],
+        decode=lambda data: UserDto(**data),
+    )
+    return get_user, interactor
+
+
+async def test_results_are_cached_per_request() -> None:
+    interactor = StubInteractor()
+    get_user = InteractorCache().wrap(interactor, "get_user", ttl=60)
+
+    first = await get_user.execute(GetUser(1))
+    again = await get_user.execute(GetUser(1))
+    other = await get_user.execute(GetUser(2))
+
+    assert first == again == UserDto(1, "user-1")
+    assert other == UserDto(2, "user-2")
+    assert interactor.calls == [GetUser(1), GetUser(2)]
+    ratio = REGISTRY.get_sample_value(
+        "interactor_cache_hit_ratio", {"interactor": "get_user"}
+    )
+    assert ratio == 1 / 3
+
+
+async def test_concurrent_misses_share_one_call() -> None:
+    interactor = StubInteractor()
+    get_user = InteractorCache().wrap(interactor, "get_user_collapsed", ttl=60)
+
+    results = await asyncio.gather(*(get_user.execute(GetUser(1)) for _ in range(10)))
+
+    assert results == [UserDto(1, "user-1")] * 10
+    assert interactor.calls == [GetUser(1)]
+
+
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    interactor = StubInteractor()
+    get_user = InteractorCache().wrap(interactor, "get_user_cancelled", ttl=60)
+
+    first = asyncio.ensure_future(get_user.execute(GetUser(1)))
+    second = asyncio.ensure_future(get_user.execute(GetUser(1)))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == UserDto(1, "user-1")
+    assert interactor.calls == [GetUser(1)]
+
+
+async def test_failures_are_not_cached() -> None:
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectionError("database is gone")
+        return "value"
+
+    cache = InteractorCache()
+    try:
+        await cache.get_or_compute("flaky", "flaky:1", 60, compute)
+    except ConnectionError:
+        pass
+
+    assert await cache.get_or_compute("flaky", "flaky:1", 60, compute) == "value"
+    assert calls == 2
+
+
+async def test_entries_expire_locally() -> None:
+    interactor = StubInteractor()
+    get_user = InteractorCache(local_ttl=0.05).wrap(
+        interactor, "get_user_expiring", ttl=60
+    )
+
+    await get_user.execute(GetUser(1))
+    await asyncio.sleep(0.06)
+    await get_user.execute(GetUser(1))
+
+    assert interactor.calls == [GetUser(1), GetUser(1)]
+
+
+def test_early_refresh_grows_near_expiry() -> None:
+    fresh = _Entry("value", delta=0.1, expires_at=time.time() + 60)
+    expiring = _Entry("value", delta=0.1, expires_at=time.time() + 0.01)
+    expired = _Entry("value", delta=0.1, expires_at=time.time() - 1)
+
+    assert not any(fresh.should_refresh(beta=1.0) for _ in range(1000))
+    assert 0 < sum(expiring.should_refresh(beta=1.0) for _ in range(1000)) < 1000
+    assert all(expired.should_refresh(beta=1.0) for _ in range(1000))
+
+
+def test_keys_do_not_depend_on_field_order() -> None:
+    get_user = InteractorCache().wrap(StubInteractor(), "get_user", ttl=60)
+
+    assert get_user.key({"a": 1, "b": 2}) == get_user.key({"b": 2, "a": 1})
+    assert get_user.key(GetUser(1)) != get_user.key(GetUser(2))
+    assert get_user.key(GetUser(1)).startswith("get_user:")
+
+
+async def test_workers_share_results_through_redis() -> None:
+    redis = StubRedis()
+    first, first_calls = worker(redis, "get_user_shared")
+    second, second_calls = worker(redis, "get_user_shared")
+
+    assert await first.execute(GetUser(1)) == UserDto(1, "user-1")
+    assert await second.execute(GetUser(1)) == UserDto(1, "user-1")
+
+    assert first_calls.calls == [GetUser(1)]
+    assert second_calls.calls == []
+    key = first.key(GetUser(1))
+    assert redis.data["interactor-cache:tag:user:1"] == {key.encode()}
+    assert REGISTRY.get_sample_value(
+        "interactor_cache_requests_total",
+        {"interactor": "get_user_shared", "result": "l2_hit"},
+    )
+
+
+async def test_lock_holder_computes_while_other_workers_wait() -> None:
+    redis = StubRedis()
+    first, first_calls = worker(redis, "get_user_locked")
+    second, second_calls = worker(redis, "get_user_locked")
+
+    results = await asyncio.gather(
+        first.execute(GetUser(1)), second.execute(GetUser(1))
+    )
+
+    assert results == [UserDto(1, "user-1")] * 2
+    assert first_calls.calls == [GetUser(1)]
+    assert second_calls.calls == []
+    assert not any(key.startswith("interactor-cache:lock:") for key in redis.data)
+
+
+async def test_waiting_workers_compute_once_the_lock_times_out() -> None:
+    redis = StubRedis()
+    get_user, interactor = worker(redis, "get_user_stuck", lock_timeout=0.1)
+    redis.data[f"interactor-cache:lock:{get_user.key(GetUser(1))}"] = b"dead"
+
+    started = time.monotonic()
+    assert await get_user.execute(GetUser(1)) == UserDto(1, "user-1")
+
+    assert time.monotonic() - started >= 0.1
+    assert interactor.calls == [GetUser(1)]
+
+
+async def test_invalidation_reaches_every_worker() -> None:
+    redis = StubRedis()
+    first, first_calls = worker(redis, "get_user_invalidated")
+    second, second_calls = worker(redis, "get_user_invalidated")
+    await first.execute(GetUser(1))
+    await first.execute(GetUser(2))
+    await second.execute(GetUser(1))
+    listener = asyncio.ensure_future(second.cache.listen())
+    await asyncio.sleep(0)
+
+    try:
+        await first.cache.invalidate("user:1")
+        await asyncio.sleep(0.01)
+
+        await first.execute(GetUser(1))
+        await second.execute(GetUser(1))
+        await second.execute(GetUser(2))
+    finally:
+        listener.cancel()
+
+    assert first_calls.calls == [GetUser(1), GetUser(2), GetUser(1)]
+    assert second_calls.calls == []
+    assert REGISTRY.get_sample_value(
+        "interactor_cache_invalidations_total", {"origin": "remote"}
+    )
+
+
+async def test_redis_failures_fall_back_to_the_local_tier() -> None:
+    get_user, interactor = worker(BrokenRedis(), "get_user_broken")
+
+    assert await get_user.execute(GetUser(1)) == UserDto(1, "user-1")
+    assert await get_user.execute(GetUser(1)) == UserDto(1, "user-1")
+    assert interactor.calls == [GetUser(1)]
+
+    with pytest.raises(RedisError):
+        await get_user.cache.invalidate("user:1")
+
+    # Invalidations may have been missed, so the listener drops L1.
+    listener = asyncio.ensure_future(get_user.cache.listen())
+    await asyncio.sleep(0)
+    listener.cancel()
+    await get_user.execute(GetUser(1))
+
+    assert interactor.calls == [GetUser(1), GetUser(1)]
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from infra.db import Base
+from infra.db.repositories import DataLoader, EntityLoaders
+from infra.db.repositories.loader import select_by_ids
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Author(Base):
+    __tablename__ = "loader_authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class StubBatchLoad:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.batches.append(keys)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("database is gone")
+        return {key: f"author-{key}" for key in keys if key != 404}
+
+
+async def test_loads_of_one_tick_are_batched_and_cached() -> None:
+    batch_load = StubBatchLoad()
+    loader = DataLoader(batch_load, name="authors")
+
+    first, second, many = await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load_many([2, 3, 404])
+    )
+    again = await loader.load_many([1, 3])
+
+    assert (first, second, many) == (
+        "author-1",
+        "author-2",
+        ["author-2", "author-3", None],
+    )
+    assert again == ["author-1", "author-3"]
+    assert batch_load.batches == [[1, 2, 3, 404]]
+
+
+async def test_batches_are_split() -> None:
+    batch_load = StubBatchLoad()
+    loader = DataLoader(batch_load, name="authors", max_batch_size=2)
+
+    await loader.load_many(range(5))
+
+    assert batch_load.batches == [[0, 1], [2, 3], [4]]
+
+
+async def test_failures_are_not_cached() -> None:
+    batch_load = StubBatchLoad(fail=True)
+    loader = DataLoader(batch_load, name="authors")
+
+    with pytest.raises(ConnectionError):
+        await loader.load(1)
+    batch_load.fail = False
+
+    assert await loader.load(1) == "author-1"
+    assert batch_load.batches == [[1], [1]]
+
+
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    loader = DataLoader(StubBatchLoad(), name="authors")
+    cancelled = asyncio.create_task(loader.load(1))
+    waiting = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    assert await waiting == "author-1"
+
+
+def test_entities_are_fetched_with_one_array_parameter() -> None:
+    compiled = select_by_ids(Author).compile(dialect=asyncpg.dialect())
+
+    assert str(compiled).endswith("WHERE loader_authors.id = ANY ($1::INTEGER[])")
+
+
+def test_one_loader_per_model() -> None:
+    loaders = EntityLoaders(AsyncSession())
+
+    assert loaders.of(Author) is loaders.of(Author)
+    assert loaders.of(Author).name == "Author"
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import httpx
+import msgpack
+import orjson
+import pytest
+from fastapi import APIRouter, FastAPI
+from infra.external import BaseClient
+from presentation.api.v1.request import RequestRoute
+from presentation.api.v1.response import (
+    ErrorData,
+    ErrorResponse,
+    OkResponse,
+    accepts_msgpack,
+)
+from presentation.api.v1.response.msgpack import packb
+from presentation.api.v1.response.serializer import dumps
+from pydantic import BaseModel
+
+
+class Reading(BaseModel):
+    id: UUID
+    values: list[float]
+    taken_at: datetime
+
+
+class StubClient(BaseClient):
+    pass
+
+
+READING = Reading(
+    id=UUID("00000000-0000-0000-0000-000000000001"),
+    values=[0.5, 1.25],
+    taken_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+)
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, False),
+        ("*/*", False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/json;q=0.5, application/x-msgpack", True),
+        ("application/msgpack;q=0.5, application/json", False),
+        ("application/msgpack;q=0", False),
+    ],
+)
+def test_msgpack_must_be_asked_for(accept: str | None, expected: bool) -> None:
+    assert accepts_msgpack(accept) is expected
+
+
+def test_msgpack_holds_the_same_content_as_json() -> None:
+    content = ErrorResponse(
+        status=400,
+        error=ErrorData(title="Invalid", data=[READING, ValueError("bad")]),
+    )
+
+    assert msgpack.unpackb(packb(content)) == orjson.loads(dumps(content))
+
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=RequestRoute)
+
+    @router.post("/readings")
+    async def create(reading: Reading) -> OkResponse[Reading]:
+        return OkResponse(result=reading)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def test_route_negotiates_the_format() -> None:
+    body = READING.model_dump(mode="json")
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=build_app()), base_url="http://test"
+    ) as http:
+        as_json = await http.post("/readings", json=body)
+        as_msgpack = await http.post(
+            "/readings",
+            content=msgpack.packb(body),
+            headers={
+                "Content-Type": "application/msgpack",
+                "Accept": "application/msgpack",
+            },
+        )
+        invalid = await http.post(
+            "/readings",
+            content=b"\xc1",
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+    assert as_json.headers["content-type"] == "application/json"
+    assert as_json.json()["result"] == body
+    assert as_msgpack.headers["content-type"] == "application/msgpack"
+    assert as_msgpack.headers["vary"] == "Accept"
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+    assert invalid.status_code == 400
+
+
+async def test_base_client_can_ask_for_msgpack() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            content=msgpack.packb({"values": [1, 2]}),
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    stub = StubClient(
+        "http://upstream", client=http, circuit_breaker=None, msgpack=True
+    )
+    response = await stub.get("/")
+
+    assert seen[0].headers["accept"] == "application/msgpack"
+    assert response.data == {"values": [1, 2]}
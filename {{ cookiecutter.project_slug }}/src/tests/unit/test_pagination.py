@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+from application.common.exceptions import InvalidCursorError
+from infra.db import Base
+from infra.db.repositories.pagination import decode_cursor, encode_cursor
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Entry(Base):
+    __tablename__ = "pagination_entries"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+KEYS = (Entry.created_at, Entry.id)
+
+
+def test_cursor_round_trip_keeps_key_types() -> None:
+    created_at = datetime.datetime(2024, 5, 1, 12, 30, 15, 123456)
+
+    cursor = encode_cursor("n", [created_at, 42])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, KEYS) == ("n", [created_at, 42])
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 !",
+        encode_cursor("n", [1]),
+        encode_cursor("x", ["2024-05-01T12:30:15", 42]),
+        encode_cursor("n", ["yesterday", 42]),
+    ],
+)
+def test_tampered_cursors_are_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, KEYS)
@@ -0,0 +1,132 @@
+from typing import Any
+
+import httpx
+from infra.redis import RateLimit, RateLimiter
+from presentation.api.middlewares import RateLimitMiddleware
+from redis.exceptions import ConnectionError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+
+class StubScript:
+    """Token bucket without refill, counting the round trips to Redis."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.tokens: dict[str, int] = {}
+        self.calls: list[int] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[str], args: list[Any]) -> list[int]:
+        if self.fail:
+            raise ConnectionError("redis is gone")
+        (key,), (limit, period_ms, requested) = keys, args
+        self.calls.append(requested)
+        tokens = self.tokens.get(key, limit)
+        granted = min(requested, tokens)
+        self.tokens[key] = tokens - granted
+        retry = 0 if granted else 500
+        return [granted, tokens - granted, retry, period_ms]
+
+
+class StubRedis:
+    def __init__(self, script: StubScript) -> None:
+        self.script = script
+
+    def register_script(self, source: str) -> StubScript:
+        return self.script
+
+
+def limiter(script: StubScript, **kwargs: Any) -> RateLimiter:
+    return RateLimiter(StubRedis(script), **kwargs)  # type: ignore[arg-type]
+
+
+async def test_requests_over_the_limit_are_rejected() -> None:
+    script = StubScript()
+    rate_limiter = limiter(script, max_lease=0)
+    rule = RateLimit(limit=3, period=60)
+
+    decisions = [await rate_limiter.hit("client", rule) for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+    assert decisions[-1].retry_after == 0.5
+
+
+async def test_busy_clients_lease_growing_batches_of_tokens() -> None:
+    script = StubScript()
+    rate_limiter = limiter(script, max_lease=0.1)
+    rule = RateLimit(limit=1000, period=60)
+
+    decisions = [await rate_limiter.hit("client", rule) for _ in range(100)]
+
+    assert all(decision.allowed for decision in decisions)
+    assert script.calls == [1, 2, 4, 8, 16, 32, 64]
+    assert decisions[-1].remaining == 1000 - 100
+
+
+async def test_rejections_are_cached_until_retry() -> None:
+    script = StubScript()
+    rate_limiter = limiter(script, max_lease=0)
+    rule = RateLimit(limit=1, period=60)
+
+    decisions = [await rate_limiter.hit("client", rule) for _ in range(5)]
+
+    assert [d.allowed for d in decisions] == [True] + [False] * 4
+    assert len(script.calls) == 2
+
+
+def build_app(script: StubScript) -> Starlette:
+    async def endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    return Starlette(
+        routes=[
+            Route("/items/{item_id}", endpoint),
+            Route("/search", endpoint),
+            Route("/healthcheck", endpoint),
+        ],
+        middleware=[
+            Middleware(
+                RateLimitMiddleware,
+                default=RateLimit(limit=2, period=60),
+                routes={"/search": RateLimit(limit=1, period=60)},
+                limiter=limiter(script, max_lease=0),
+            )
+        ],
+    )
+
+
+def client(app: Starlette) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+async def test_middleware_limits_per_client_and_route_template() -> None:
+    script = StubScript()
+    async with client(build_app(script)) as http:
+        items = [await http.get(f"/items/{i}") for i in range(3)]
+        search = [await http.get("/search") for _ in range(2)]
+        other_key = await http.get("/items/1", headers={"x-api-key": "secret"})
+        health = [await http.get("/healthcheck") for _ in range(3)]
+
+    assert [r.status_code for r in items] == [200, 200, 429]
+    assert [r.status_code for r in search] == [200, 429]
+    assert other_key.status_code == 200
+    assert [r.status_code for r in health] == [200] * 3
+    assert items[0].headers["ratelimit-policy"] == "2;w=60"
+    assert items[0].headers["ratelimit-remaining"] == "1"
+    assert items[2].headers["retry-after"] == "1"
+    assert items[2].json()["status"] == 429
+    assert not any("secret" in key for key in script.tokens)
+
+
+async def test_middleware_lets_requests_through_when_redis_fails() -> None:
+    async with client(build_app(StubScript(fail=True))) as http:
+        response = await http.get("/items/1")
+
+    assert response.status_code == 200
+    assert "ratelimit-limit" not in response.headers
@@ -0,0 +1,66 @@
+import dataclasses
+from typing import Any
+
+from domain.common import ValueObject
+from infra.db import Query, QueryExecutor
+
+
+@dataclasses.dataclass(frozen=True)
+class Name(ValueObject[str]):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemDto:
+    id: int
+    name: str
+
+
+class Record(dict[str, Any]):
+    # Like asyncpg.Record: a mapping also indexable by position.
+    def __getitem__(self, key: str | int) -> Any:
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+
+class StubPool:
+    def __init__(self, *records: Record) -> None:
+        self.records = list(records)
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def fetch(
+        self, sql: str, *args: Any, timeout: float | None = None
+    ) -> list[Record]:
+        self.calls.append((sql, args))
+        return self.records
+
+    async def fetchrow(
+        self, sql: str, *args: Any, timeout: float | None = None
+    ) -> Record | None:
+        self.calls.append((sql, args))
+        return self.records[0] if self.records else None
+
+
+def executor(pool: StubPool) -> QueryExecutor:
+    return QueryExecutor(pool)  # type: ignore[arg-type]
+
+
+ITEMS = Query("items", "SELECT id, name FROM items WHERE id > $1", ItemDto)
+ITEM_NAME = Query("item_name", "SELECT name FROM items WHERE id = $1", Name)
+
+
+async def test_rows_are_mapped_into_dtos() -> None:
+    pool = StubPool(Record(id=1, name="a"), Record(id=2, name="b"))
+
+    items = await executor(pool).fetch(ITEMS, 0)
+
+    assert items == [ItemDto(id=1, name="a"), ItemDto(id=2, name="b")]
+    assert pool.calls == [(ITEMS.sql, (0,))]
+
+
+async def test_value_objects_take_the_first_column() -> None:
+    pool = StubPool(Record(name="a"))
+
+    assert await executor(pool).fetch_one(ITEM_NAME, 1) == Name("a")
+    assert await executor(StubPool()).fetch_one(ITEM_NAME, 2) is None
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from infra.redis import InstrumentedConnectionPool
+from infra.redis.pool import POOL_WAIT_TIME
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.connection import AbstractConnection
+from redis.exceptions import ConnectionError
+
+CONNECT_TIME = 0.05
+
+
+@pytest.fixture(autouse=True)
+def slow_connect(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def ensure_connection(
+        self: BlockingConnectionPool, connection: AbstractConnection
+    ) -> None:
+        await asyncio.sleep(CONNECT_TIME)
+
+    monkeypatch.setattr(BlockingConnectionPool, "ensure_connection", ensure_connection)
+
+
+def waited(pool: str) -> tuple[float, float]:
+    metric = POOL_WAIT_TIME.labels(pool=pool)
+    return metric._sum.get(), sum(bucket.get() for bucket in metric._buckets)
+
+
+async def test_only_the_wait_for_a_lease_is_recorded() -> None:
+    pool = InstrumentedConnectionPool(name="lease", max_connections=1, timeout=1)
+    first = await pool.get_connection()
+
+    second = asyncio.create_task(pool.get_connection())
+    await asyncio.sleep(0.02)
+    await pool.release(first)
+    await pool.release(await second)
+
+    total, count = waited("lease")
+    assert count == 2
+    assert 0.02 <= total < CONNECT_TIME
+
+
+async def test_timed_out_waits_are_recorded() -> None:
+    pool = InstrumentedConnectionPool(name="timeout", max_connections=1, timeout=0.02)
+    await pool.get_connection()
+
+    with pytest.raises(ConnectionError):
+        await pool.get_connection()
+
+    total, count = waited("timeout")
+    assert count == 2
+    assert 0.02 <= total < CONNECT_TIME
@@ -0,0 +1,105 @@
+from typing import ClassVar
+
+import httpx
+import msgpack
+import orjson
+from fastapi import APIRouter, FastAPI
+from presentation.api.v1 import setup_exception_handlers
+from presentation.api.v1.request import BulkRequest, Request, RequestRoute
+from presentation.api.v1.response import OkResponse
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    sku: str
+    quantity: int
+
+
+class Note(Request):
+    max_body_size: ClassVar[int] = 64
+
+    text: str
+
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=RequestRoute)
+
+    @router.post("/items")
+    async def ingest(items: BulkRequest[Item]) -> OkResponse[int]:
+        return OkResponse(result=sum(item.quantity for item in items))
+
+    @router.post("/notes/{note_id}")
+    def note(note_id: int, body: Note) -> OkResponse[str]:
+        return OkResponse(result=f"{note_id}: {body.text}")
+
+    app = FastAPI()
+    app.include_router(router)
+    setup_exception_handlers(app)
+    return app
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+async def test_bodies_are_validated_into_request_models() -> None:
+    items = [{"sku": f"sku-{i}", "quantity": i} for i in range(100)]
+    async with client(build_app()) as http:
+        as_json = await http.post("/items", content=orjson.dumps(items))
+        as_msgpack = await http.post(
+            "/items",
+            content=msgpack.packb(items),
+            headers={"Content-Type": "application/msgpack"},
+        )
+        note = await http.post("/notes/7", json={"text": "hello"})
+
+    assert as_json.json()["result"] == sum(range(100))
+    assert as_msgpack.json()["result"] == sum(range(100))
+    assert note.json()["result"] == "7: hello"
+
+
+async def test_invalid_bodies_are_answered_with_error_response() -> None:
+    invalid = [{"sku": "a", "quantity": "many"}] * 50
+    async with client(build_app()) as http:
+        wrong = await http.post("/items", content=orjson.dumps(invalid))
+        malformed = await http.post("/items", content=b'[{"sku": ')
+        bad_msgpack = await http.post(
+            "/items", content=b"\xc1", headers={"Content-Type": "application/msgpack"}
+        )
+
+    assert wrong.status_code == 422
+    error = wrong.json()["error"]
+    assert error["title"] == "The request body is invalid"
+    assert error["data"]["count"] == 50
+    assert len(error["data"]["errors"]) == 20
+    assert error["data"]["errors"][0]["loc"] == [0, "quantity"]
+    assert "input" not in error["data"]["errors"][0]
+    assert malformed.status_code == 422
+    assert malformed.json()["error"]["data"]["errors"][0]["type"] == "json_invalid"
+    assert bad_msgpack.status_code == 422
+
+
+async def test_oversized_bodies_are_rejected_while_streaming() -> None:
+    async def chunks():  # type: ignore[no-untyped-def]
+        yield b'{"text": "'
+        for _ in range(100):
+            yield b"x" * 10
+        yield b'"}'
+
+    async with client(build_app()) as http:
+        declared = await http.post("/notes/1", json={"text": "x" * 100})
+        streamed = await http.post("/notes/1", content=chunks())
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
+    assert streamed.json()["error"]["title"] == "The request body exceeds 64 bytes"
+
+
+def test_openapi_still_documents_the_body() -> None:
+    operation = build_app().openapi()["paths"]["/items"]["post"]
+
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert schema["type"] == "array"
+    assert "parameters" not in operation
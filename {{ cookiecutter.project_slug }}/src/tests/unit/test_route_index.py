@@ -0,0 +1,47 @@
+import pytest
+from presentation.api.middlewares.route_index import RouteIndex
+from starlette.routing import Mount, Route
+
+
+async def endpoint() -> None:
+    pass
+
+
+@pytest.fixture(scope="module")
+def index() -> RouteIndex:
+    return RouteIndex(
+        [
+            Route("/", endpoint),
+            Route("/items/{item_id}", endpoint),
+            Route("/items/me", endpoint),
+            Route("/users/{user_id:int}/posts/{post_id}", endpoint),
+            Route("/files/{file_path:path}", endpoint),
+            Mount("/static", routes=[Route("/logo.png", endpoint)]),
+            Route("/healthcheck", endpoint),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/", ("/", True)),
+        ("/healthcheck", ("/healthcheck", True)),
+        ("/items/42", ("/items/{item_id}", True)),
+        # the first registered route wins, as in Starlette's router
+        ("/items/me", ("/items/{item_id}", True)),
+        ("/users/7/posts/abc", ("/users/{user_id:int}/posts/{post_id}", True)),
+        ("/users/seven/posts/abc", ("/users/seven/posts/abc", False)),
+        ("/files/a/b/c.txt", ("/files/{file_path:path}", True)),
+        ("/static/logo.png", ("/static", True)),
+        ("/items/42/extra", ("/items/42/extra", False)),
+    ],
+)
+def test_resolve(index: RouteIndex, path: str, expected: tuple[str, bool]) -> None:
+    assert index.resolve({"path": path, "root_path": ""}) == expected
+
+
+def test_resolve_strips_root_path(index: RouteIndex) -> None:
+    scope = {"path": "/api/items/1", "root_path": "/api"}
+
+    assert index.resolve(scope) == ("/items/{item_id}", True)
@@ -0,0 +1,110 @@
+from typing import Any
+
+import pytest
+from infra.db.routing import EngineRouter, Replica, RoutingSession, use_primary
+from infra.db.session import autocommit, read_only
+from sqlalchemy import column, insert, select, table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+ITEMS = table("items", column("id"))
+
+
+def engine(host: str) -> AsyncEngine:
+    # Engines connect lazily, routing is decided without a database.
+    return create_async_engine(f"postgresql+asyncpg://user:pass@{host}/db")
+
+
+@pytest.fixture
+def router() -> EngineRouter:
+    return EngineRouter(
+        engine("primary"),
+        [Replica("r0", engine("replica-0")), Replica("r1", engine("replica-1"))],
+        strategy="round_robin",
+    )
+
+
+def session(router: EngineRouter) -> AsyncSession:
+    return AsyncSession(
+        bind=router.primary, sync_session_class=RoutingSession, router=router
+    )
+
+
+def host_of(async_session: AsyncSession, clause: object) -> str:
+    bind = async_session.sync_session.get_bind(clause=clause)
+    return str(bind.url.host)
+
+
+def test_reads_go_to_one_replica_per_session(router: EngineRouter) -> None:
+    first, second = session(router), session(router)
+
+    assert host_of(first, select(ITEMS)) == "replica-0"
+    assert host_of(first, select(ITEMS)) == "replica-0"
+    assert host_of(second, select(ITEMS)) == "replica-1"
+
+
+def test_writes_and_locks_go_to_the_primary_and_stick(router: EngineRouter) -> None:
+    writer, locker = session(router), session(router)
+
+    assert host_of(writer, insert(ITEMS)) == "primary"
+    assert host_of(writer, select(ITEMS)) == "primary"
+    assert host_of(locker, select(ITEMS).with_for_update()) == "primary"
+    assert host_of(locker, select(ITEMS)) == "primary"
+
+
+def test_explicit_transactions_go_to_the_primary_and_stick(
+    router: EngineRouter,
+) -> None:
+    explicit = session(router)
+    explicit.sync_session.begin()
+
+    assert host_of(explicit, select(ITEMS)) == "primary"
+    explicit.sync_session.rollback()
+    assert host_of(explicit, select(ITEMS)) == "primary"
+
+
+def test_raw_sql_and_use_primary_go_to_the_primary(router: EngineRouter) -> None:
+    raw, pinned = session(router), session(router)
+    use_primary(pinned)
+
+    assert host_of(raw, text("SELECT 1")) == "primary"
+    assert host_of(pinned, select(ITEMS)) == "primary"
+
+
+@pytest.mark.parametrize("setup", [read_only, autocommit])
+async def test_read_only_sessions_go_to_a_replica(
+    router: EngineRouter, setup: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reader = session(router)
+
+    async def connection(**kwargs: Any) -> None:
+        # What session.connection() asks the router, without connecting.
+        reader.sync_session.get_bind()
+
+    monkeypatch.setattr(reader, "connection", connection)
+    await setup(reader)
+
+    assert host_of(reader, None) == "replica-0"
+    assert host_of(reader, select(ITEMS)) == "replica-0"
+
+
+def test_explicit_connections_go_to_the_primary_and_stick(
+    router: EngineRouter,
+) -> None:
+    explicit = session(router)
+
+    assert host_of(explicit, None) == "primary"
+    assert host_of(explicit, select(ITEMS)) == "primary"
+
+
+def test_unhealthy_replicas_leave_the_rotation(router: EngineRouter) -> None:
+    router.replicas[0].mark(False)
+
+    assert {host_of(session(router), select(ITEMS)) for _ in range(4)} == {"replica-1"}
+
+    router.replicas[1].mark(False)
+    assert host_of(session(router), select(ITEMS)) == "primary"
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        EngineRouter(engine("primary"), strategy="random")
@@ -0,0 +1,103 @@
+import logging
+from decimal import Decimal
+from uuid import UUID
+
+import httpx
+import orjson
+import pytest
+import uuid6
+from fastapi import APIRouter, FastAPI, status
+from presentation.api.v1.response import ErrorData, ErrorResponse, OkResponse
+from presentation.api.v1.response import ResponseRoute
+from presentation.api.v1.response.serializer import dumps, encoder_for
+from pydantic import BaseModel, Field
+
+
+class Profile(BaseModel):
+    id: UUID
+    name: str = Field(serialization_alias="fullName")
+    balance: Decimal
+
+
+class Unknown:
+    def __repr__(self) -> str:
+        return "<unknown>"
+
+
+PROFILE = Profile(
+    id=UUID("00000000-0000-0000-0000-000000000001"), name="Ann", balance=Decimal("1.5")
+)
+
+
+def test_models_are_dumped_in_json_mode() -> None:
+    content = OkResponse(result=[PROFILE])
+
+    assert orjson.loads(dumps(content)) == {
+        "status": 200,
+        "result": [PROFILE.model_dump(mode="json")],
+    }
+
+
+def test_values_orjson_lacks_get_an_encoder() -> None:
+    uuid = uuid6.uuid7()
+    content = ErrorResponse(
+        error=ErrorData(title="Failed", data=ValueError("bad input")),
+    )
+
+    assert orjson.loads(dumps({"id": uuid, "tags": {"a"}})) == {
+        "id": str(uuid),
+        "tags": ["a"],
+    }
+    assert orjson.loads(dumps(content))["error"]["data"] == "ValueError: bad input"
+
+
+def test_unknown_types_are_warned_about_once(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        assert orjson.loads(dumps([Unknown(), Unknown()])) == ["<unknown>"] * 2
+        dumps(Unknown())
+
+    assert len(caplog.records) == 1
+    assert encoder_for(Unknown) is repr
+
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=ResponseRoute)
+
+    @router.get("/profile", response_model=OkResponse[Profile])
+    async def profile() -> OkResponse[Profile]:
+        return OkResponse(result=PROFILE)
+
+    @router.post("/profiles", status_code=status.HTTP_201_CREATED)
+    async def create() -> OkResponse[Profile]:
+        return OkResponse(status=201, result=PROFILE)
+
+    @router.get("/missing")
+    async def missing() -> ErrorResponse[None]:
+        return ErrorResponse(status=404, error=ErrorData(title="Not found"))
+
+    @router.get("/plain")
+    def plain() -> dict[str, int]:
+        return {"value": 1}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def test_route_renders_known_responses_directly() -> None:
+    app = build_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        profile = await http.get("/profile")
+        created = await http.post("/profiles")
+        missing = await http.get("/missing")
+        plain = await http.get("/plain")
+
+    assert profile.json()["result"] == PROFILE.model_dump(mode="json")
+    assert created.status_code == 201
+    assert missing.status_code == 404
+    assert missing.json()["error"]["title"] == "Not found"
+    assert plain.json() == {"value": 1}
+    schema = app.openapi()["paths"]["/profile"]["get"]["responses"]["200"]
+    assert "$ref" in schema["content"]["application/json"]["schema"]
@@ -0,0 +1,90 @@
+import httpx
+import orjson
+import pytest
+from infra.external import BaseClient
+from infra.external.streaming import JsonArrayDecoder
+
+DOCUMENT = [
+    1,
+    -2.5e3,
+    True,
+    None,
+    "a, b ] }",
+    'escaped \\" quote',
+    {"nested": [1, {"deep": "]"}], "empty": {}},
+    [[], [[]]],
+    "unicode é",
+]
+
+
+class StubClient(BaseClient):
+    pass
+
+
+def feed_in_chunks(body: bytes, size: int) -> list[object]:
+    decoder = JsonArrayDecoder()
+    items = []
+    for start in range(0, len(body), size):
+        items += decoder.feed(body[start : start + size])
+    decoder.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_decoder_yields_items_across_chunk_boundaries(size: int) -> None:
+    body = orjson.dumps(DOCUMENT, option=orjson.OPT_INDENT_2)
+    assert feed_in_chunks(body, size) == DOCUMENT
+
+
+def test_decoder_accepts_an_empty_array() -> None:
+    assert feed_in_chunks(b" [ ] ", 1) == []
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1}', b"[1,]", b"[,1]", b"[1, 2", b"[1] [2]"])
+def test_decoder_rejects_malformed_arrays(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        feed_in_chunks(body, 2)
+
+
+async def test_stream_json_yields_items_of_the_body() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=orjson.dumps(DOCUMENT))
+
+    client = StubClient(
+        "http://stream.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    items = [item async for item in client.stream_json("/", chunk_size=5)]
+
+    assert items == DOCUMENT
+
+
+async def test_stream_bytes_raises_on_error_status() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, content=b"missing")
+
+    client = StubClient(
+        "http://stream.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async for _ in client.stream_bytes("/"):
+            pass
+
+
+async def test_raw_mode_skips_validation() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[1, 2, 3])
+
+    client = StubClient(
+        "http://stream.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    response = await client.get("/", raw=True)
+
+    # A list of ints would fail validation against ``Response.data``.
+    assert response.status_code == 200
+    assert response.data == [1, 2, 3]